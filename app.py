@@ -1,16 +1,32 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import re
-from collections import Counter
 import random
+import os
+import time
 import warnings
-from xquik_source import load_xquik_posts
+from dashboard_cache import ResultCache
+from data_export import EXPORT_FORMATS, available_formats, export_to_tempfile
+from dashboard_data import DAY_ORDER, dataset_version, load_dashboard_data
+from filter_engine import FilterIndex, take_rows
+from geo_index import STATES_PATH, UNKNOWN_REGION, RegionIndex
+from hashtag_index import HashtagIndex
+from search_index import SearchIndex
+from tweet_browser import SORT_OPTIONS, TweetBrowser
+from sentiment_cube import airline_metrics as cube_airline_metrics
+from sentiment_cube import build_cube, cube_summary, filter_cube, sentiment_pivot, sentiment_totals
+from sentiment_analyzer import MODEL_NAME
+from sentiment_cache import DEFAULT_CACHE_PATH, SentimentCache
+from live_poller import DEFAULT_INTERVAL, LivePoller
+from live_store import LiveStore, LiveStoreReader
+from xquik_client import XquikClient, XquikConfigError, XquikError, XquikRateLimited
 warnings.filterwarnings('ignore')
 
+# Tweets per page in the Deep Dive tweet browser
+BROWSE_PAGE_SIZE = 25
+# Columns preselected for export
+EXPORT_COLUMNS = ['date', 'user', 'tweet_content', 'Airline', 'Predicted_Sentiment', 'Sentiment_Confidence', 'retweet_count', 'like_count']
+
 # Page configuration
 st.set_page_config(
     page_title="SkySentiment - Indian Airline Tweet Analysis",
@@ -267,31 +283,13 @@ st.markdown("""
 
 # Utility functions
 def load_data():
-    """Load and preprocess data with caching"""
+    """Load preprocessed data, memory-mapping the columnar snapshot when it is current"""
     try:
-        data = pd.read_csv('sentiment_analyzed_data.csv', encoding='latin-1')
-        data['date'] = pd.to_datetime(data['date'])
-        data['Date'] = data['date']
-        data['tweet_location'] = data['tweet_location'].fillna('Unknown')
-        data['latitude'] = pd.to_numeric(data['latitude'], errors='coerce')
-        data['longitude'] = pd.to_numeric(data['longitude'], errors='coerce')
-        data['hour'] = data['date'].dt.hour
-        data['day_of_week'] = data['date'].dt.day_name()
-        data['month'] = data['date'].dt.month
-        data['year'] = data['date'].dt.year
-        data['Airline'] = data['Airline'].str.title()
-        return data
+        return load_dashboard_data()
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
-def extract_hashtags(text):
-    """Extract hashtags from text"""
-    if pd.isna(text):
-        return []
-    hashtags = re.findall(r'#\w+', str(text))
-    return [tag.lower() for tag in hashtags]
-
 def create_chart_config():
     """Create consistent chart configuration"""
     return {
@@ -302,12 +300,90 @@ def create_chart_config():
         'yaxis': dict(gridcolor='#333')
     }
 
-# Load data
-@st.cache_data
-def cached_load_data():
+# Load data (shared read-only across sessions, so reruns never copy the full frame).
+# Per-version caches keep two entries: the bundled dataset and the newest live store version,
+# so polling replaces older live indexes instead of accumulating them.
+@st.cache_resource
+def cached_load_data(version):
     return load_data()
 
-data = cached_load_data()
+@st.cache_resource(max_entries=2)
+def cached_filter_index(version, _data):
+    """Date-sorted filter index, built once per dataset version"""
+    return FilterIndex(_data)
+
+@st.cache_resource(max_entries=2)
+def cached_hashtag_index(version, _data):
+    """Hashtag vocabulary and (row, hashtag) pairs, extracted once per dataset version"""
+    return HashtagIndex(_data['tweet_content'])
+
+@st.cache_resource(max_entries=2)
+def cached_search_index(version, _data):
+    """Positional token index over tweet text, built once per dataset version"""
+    return SearchIndex(_data['tweet_content'])
+
+@st.cache_resource(max_entries=2)
+def cached_tweet_browser(version, _data):
+    """Per-sort-column row orders for the tweet browser, built once per dataset version"""
+    return TweetBrowser(_data)
+
+@st.cache_resource
+def cached_region_index():
+    """State outlines for point-in-state lookups, loaded once per process"""
+    return RegionIndex.from_shapefile(STATES_PATH) if os.path.exists(STATES_PATH) else None
+
+@st.cache_resource
+def cached_state_geojson():
+    """Simplified state outlines for the Geography map, built once per process"""
+    return cached_region_index().to_geojson()
+
+@st.cache_resource(max_entries=1)
+def cached_live_frame(version, _data):
+    """Live posts with their states assigned, as the snapshot does at load time, once per store version"""
+    regions = cached_region_index()
+    if regions is None:
+        return _data
+    return _data.assign(State=regions.assign(_data['longitude'], _data['latitude']))
+
+@st.cache_data(max_entries=2)
+def cached_cube(version, _data):
+    """Aggregate cube, built once per dataset version and shared by every session"""
+    return build_cube(_data)
+
+@st.cache_resource
+def get_shared_results():
+    """Process-wide LRU of filtered rows, aggregates and figures, capped by memory"""
+    return ResultCache(max_bytes=int(os.environ.get('DASHBOARD_CACHE_MB', 256)) * 1024 * 1024)
+
+@st.cache_resource
+def open_sentiment_cache():
+    """One connection per process to the model result cache shared with tweet.py"""
+    return SentimentCache(DEFAULT_CACHE_PATH, model_name=MODEL_NAME)
+
+def get_sentiment_cache():
+    """The model result cache, once a scoring run has created it; checked again on every rerun"""
+    if not os.path.exists(DEFAULT_CACHE_PATH):
+        return None
+    return open_sentiment_cache()
+
+@st.cache_resource
+def get_xquik_client():
+    """One Xquik client per process, so its keep-alive connections outlive reruns"""
+    return XquikClient()
+
+@st.cache_resource
+def get_live_store():
+    """The local store of polled posts and the reader that loads only its new parts"""
+    store = LiveStore()
+    return store, LiveStoreReader(store)
+
+@st.cache_resource
+def get_live_poller():
+    """One poller per process; its background thread keeps appending to the live store"""
+    return LivePoller(get_xquik_client(), get_live_store()[0], cache=get_sentiment_cache())
+
+data_version = dataset_version()
+data = cached_load_data(data_version)
 
 if data is None:
     st.error("Failed to load data. Please check if 'sentiment_analyzed_data.csv' exists.")
@@ -322,28 +398,75 @@ st.sidebar.markdown('<h3 class="sidebar-header">🎛️ Dashboard Controls</h3>'
 st.sidebar.markdown("---")
 
 st.sidebar.markdown('<p class="filter-label">Live X Source</p>', unsafe_allow_html=True)
-xquik_query = st.sidebar.text_input(
+xquik_queries = st.sidebar.text_area(
     "Search X Posts",
     value="",
-    placeholder="IndiGo flight delay",
+    placeholder="IndiGo flight delay\nAir India refund",
+    help="One search per line; all searches run at once and shared posts are kept once.",
     label_visibility="collapsed"
 )
-xquik_limit = st.sidebar.slider("Live Post Limit", min_value=5, max_value=50, value=20, step=5)
+xquik_limit = st.sidebar.slider("Live Posts per Search", min_value=10, max_value=2000, value=20, step=10)
+
+def show_live_error(error):
+    """Tell a key problem apart from throttling or an outage"""
+    if isinstance(error, XquikConfigError):
+        st.sidebar.error(f"🔑 {error}")
+    elif isinstance(error, XquikRateLimited):
+        wait = get_xquik_client().bucket.paused_for
+        st.sidebar.warning(f"⏳ Xquik is rate limiting searches; try again in {wait:.0f}s." if wait
+                           else "⏳ Xquik is rate limiting searches; try again shortly.")
+    else:
+        st.sidebar.warning(f"📡 Live search is unavailable: {error}")
+
+live_poller = get_live_poller()
+if live_poller.scorer.cache is None:
+    # The poller may have started before tweet.py created the cache
+    live_poller.scorer.cache = get_sentiment_cache()
+live_queries = [query for query in xquik_queries.splitlines() if query.strip()]
+
+def toggle_live_polling():
+    """The poller is shared by every session, so only an explicit toggle changes what it polls"""
+    if st.session_state.live_polling:
+        live_poller.configure(live_queries, xquik_limit)
+        live_poller.start()
+    else:
+        # Do not hold up this rerun while a poll in progress finishes
+        live_poller.stop(wait=False)
 
 if st.sidebar.button("Load Live X Posts", key="load_xquik_posts"):
-    live_data = load_xquik_posts(xquik_query, limit=xquik_limit)
-    if live_data is None:
-        st.sidebar.info("Set XQUIK_API_KEY and enter a search query.")
-    elif live_data.empty:
-        st.sidebar.info("No live posts found.")
+    if not live_queries:
+        st.sidebar.info("Enter a search query.")
     else:
-        st.session_state["xquik_live_data"] = live_data
-        st.sidebar.success(f"Loaded {len(live_data):,} posts.")
+        try:
+            stored = live_poller.poll_once(live_queries, xquik_limit)
+        except XquikError as error:
+            show_live_error(error)
+        else:
+            st.sidebar.success(f"Added {stored:,} new posts." if stored else "No new posts since the last poll.")
 
-xquik_live_data = st.session_state.get("xquik_live_data")
-if isinstance(xquik_live_data, pd.DataFrame) and not xquik_live_data.empty:
+# Reflect the shared poller, which another session may have started or stopped
+st.session_state.live_polling = live_poller.running and not live_poller.stopping
+st.sidebar.toggle("Keep polling", key="live_polling", on_change=toggle_live_polling,
+                  disabled=not live_queries and not st.session_state.live_polling,
+                  help=f"Fetch only newer posts for these searches every {DEFAULT_INTERVAL} seconds in the background.")
+if st.session_state.live_polling:
+    st.sidebar.caption(f"Polling {len(live_poller.queries):,} searches: " + "; ".join(live_poller.queries))
+    if live_poller.last_error is not None:
+        show_live_error(live_poller.last_error)
+
+live_store, live_reader = get_live_store()
+xquik_live_data = live_reader.refresh()
+if xquik_live_data is not None and not xquik_live_data.empty:
+    st.sidebar.caption(f"{len(xquik_live_data):,} live posts stored locally.")
+    totals = live_poller.scorer.totals
+    if totals["posts"]:
+        st.sidebar.caption(
+            f"🧠 {live_poller.scorer.escalated_fraction:.0%} of {totals['posts']:,} new posts escalated past keywords: "
+            f"{totals['cache']:,} cached, {totals['model']:,} model-scored, {totals['unresolved']:,} kept keyword labels."
+        )
     if st.sidebar.checkbox("Use live X source", value=True):
-        data = xquik_live_data
+        data_version = live_reader.version
+        data = cached_live_frame(data_version, xquik_live_data)
 
 st.sidebar.markdown("---")
 
@@ -375,32 +498,43 @@ selected_sentiments = st.sidebar.multiselect(
     label_visibility="collapsed"
 )
 
-# Apply filters
-filtered_data = data.copy()
+# Everything derived from the sidebar filters is memoized across sessions under this key
+shared_results = get_shared_results()
+filter_key = (data_version, tuple(date_range), tuple(sorted(selected_airlines)), tuple(sorted(selected_sentiments)))
 
-if len(date_range) == 2:
-    filtered_data = filtered_data[
-        (filtered_data['date'].dt.date >= date_range[0]) &
-        (filtered_data['date'].dt.date <= date_range[1])
-    ]
+def cached_result(name, compute, *extra_key):
+    """Look up a filter-dependent result in the shared LRU cache, computing it on a miss"""
+    return shared_results.get_or_compute((name,) + filter_key + extra_key, compute)
 
-if 'All' not in selected_airlines:
-    filtered_data = filtered_data[filtered_data['Airline'].isin(selected_airlines)]
+def cached_figure(name, build, *extra_key):
+    """Shared, memoized Plotly figure for the current filter state"""
+    return cached_result(f'figure:{name}', build, *extra_key)
 
-if 'All' not in selected_sentiments:
-    filtered_data = filtered_data[filtered_data['Predicted_Sentiment'].isin(selected_sentiments)]
+# Apply filters: binary search on the date-sorted index plus airline/sentiment bitmaps
+filtered_rows = cached_result(
+    'filtered_rows',
+    lambda: cached_filter_index(data_version, data).filter(date_range, selected_airlines, selected_sentiments)
+)
 
-# Main content with tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "📊 Overview", 
-    "📈 Trends & Analytics", 
-    "🏢 Airline Comparison", 
-    "📝 Content Analysis", 
-    "🔍 Deep Dive"
-])
+def filtered_tweets():
+    """Tweet-level rows for the current filters, materialized only by the tabs that need them"""
+    return take_rows(data, filtered_rows)
+
+def filtered_cube():
+    """Overview, trends and airline charts roll up the pre-aggregated cube instead of rescanning tweets"""
+    return cached_result(
+        'cube',
+        lambda: filter_cube(cached_cube(data_version, data), date_range, selected_airlines, selected_sentiments)
+    )
+
+def filtered_summary():
+    """Headline numbers for the Overview tab"""
+    return cached_result('summary', lambda: cube_summary(filtered_cube()))
 
 # Tab 1: Overview
-with tab1:
+def render_overview():
+    cube = filtered_cube()
+    summary = filtered_summary()
     st.markdown('<h2 class="section-header">📊 Executive Summary</h2>', unsafe_allow_html=True)
     
     # Fun interactive element
@@ -422,7 +556,7 @@ with tab1:
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_tweets = len(filtered_data)
+        total_tweets = summary['total']
         st.markdown(f"""
         <div class="metric-card">
             <p class="metric-value">{total_tweets:,}</p>
@@ -431,7 +565,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col2:
-        positive_pct = (filtered_data['Predicted_Sentiment'] == 'Positive').mean() * 100
+        positive_pct = summary['sentiment_counts'].get('Positive', 0) / total_tweets * 100 if total_tweets else float('nan')
         st.markdown(f"""
         <div class="metric-card">
             <p class="metric-value">{positive_pct:.1f}%</p>
@@ -440,7 +574,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col3:
-        negative_pct = (filtered_data['Predicted_Sentiment'] == 'Negative').mean() * 100
+        negative_pct = summary['sentiment_counts'].get('Negative', 0) / total_tweets * 100 if total_tweets else float('nan')
         st.markdown(f"""
         <div class="metric-card">
             <p class="metric-value">{negative_pct:.1f}%</p>
@@ -449,7 +583,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col4:
-        avg_confidence = filtered_data['Sentiment_Confidence'].mean() * 100
+        avg_confidence = summary['avg_confidence'] * 100
         st.markdown(f"""
         <div class="metric-card">
             <p class="metric-value">{avg_confidence:.1f}%</p>
@@ -462,25 +596,27 @@ with tab1:
     
     with col1:
         st.markdown('<h3 class="section-header">Sentiment Distribution</h3>', unsafe_allow_html=True)
-        sentiment_counts = filtered_data['Predicted_Sentiment'].value_counts()
+        sentiment_counts = sentiment_totals(cube)
         
-        fig = px.pie(
-            values=sentiment_counts.values,
-            names=sentiment_counts.index,
-            color_discrete_map={
-                'Positive': '#00d4ff',
-                'Negative': '#ff6b35',
-                'Neutral': '#6c757d'
-            },
-            hole=0.4
-        )
-        fig.update_layout(
-            title="",
-            showlegend=True,
-            height=400,
-            **create_chart_config()
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def build_sentiment_pie():
+            fig = px.pie(
+                values=sentiment_counts.values,
+                names=sentiment_counts.index,
+                color_discrete_map={
+                    'Positive': '#00d4ff',
+                    'Negative': '#ff6b35',
+                    'Neutral': '#6c757d'
+                },
+                hole=0.4
+            )
+            fig.update_layout(
+                title="",
+                showlegend=True,
+                height=400,
+                **create_chart_config()
+            )
+            return fig
+        st.plotly_chart(cached_figure('sentiment_pie', build_sentiment_pie), use_container_width=True)
     
     with col2:
         st.markdown('<h3 class="section-header">Sentiment Breakdown</h3>', unsafe_allow_html=True)
@@ -503,51 +639,52 @@ with tab1:
     # Airline performance overview
     st.markdown('<h3 class="section-header">Airline Performance Overview</h3>', unsafe_allow_html=True)
     
-    airline_sentiment = filtered_data.groupby(['Airline', 'Predicted_Sentiment']).size().unstack(fill_value=0)
-    airline_sentiment['Total'] = airline_sentiment.sum(axis=1)
-    airline_sentiment['Positive_Pct'] = (airline_sentiment['Positive'] / airline_sentiment['Total']) * 100
-    airline_sentiment['Negative_Pct'] = (airline_sentiment['Negative'] / airline_sentiment['Total']) * 100
-    
-    fig = px.bar(
-        airline_sentiment,
-        x=airline_sentiment.index,
-        y=['Positive_Pct', 'Negative_Pct'],
-        title="",
-        barmode='group',
-        color_discrete_map={
-            'Positive_Pct': '#00d4ff',
-            'Negative_Pct': '#ff6b35'
-        }
-    )
-    fig.update_layout(
-        xaxis_title="Airline",
-        yaxis_title="Percentage (%)",
-        height=400,
-        **create_chart_config()
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    def build_airline_overview():
+        airline_sentiment = sentiment_pivot(cube, 'Airline').reindex(columns=['Negative', 'Neutral', 'Positive'], fill_value=0)
+        airline_sentiment['Total'] = airline_sentiment.sum(axis=1)
+        airline_sentiment['Positive_Pct'] = (airline_sentiment['Positive'] / airline_sentiment['Total']) * 100
+        airline_sentiment['Negative_Pct'] = (airline_sentiment['Negative'] / airline_sentiment['Total']) * 100
+    
+        fig = px.bar(
+            airline_sentiment,
+            x=airline_sentiment.index,
+            y=['Positive_Pct', 'Negative_Pct'],
+            title="",
+            barmode='group',
+            color_discrete_map={
+                'Positive_Pct': '#00d4ff',
+                'Negative_Pct': '#ff6b35'
+            }
+        )
+        fig.update_layout(
+            xaxis_title="Airline",
+            yaxis_title="Percentage (%)",
+            height=400,
+            **create_chart_config()
+        )
+        return fig
+    st.plotly_chart(cached_figure('airline_overview', build_airline_overview), use_container_width=True)
     
     # Insights Section
     st.markdown('<h3 class="section-header">💡 Key Insights</h3>', unsafe_allow_html=True)
     
     # Calculate insights
-    total_tweets = len(filtered_data)
-    positive_tweets = len(filtered_data[filtered_data['Predicted_Sentiment'] == 'Positive'])
-    negative_tweets = len(filtered_data[filtered_data['Predicted_Sentiment'] == 'Negative'])
-    neutral_tweets = len(filtered_data[filtered_data['Predicted_Sentiment'] == 'Neutral'])
+    total_tweets = summary['total']
+    positive_tweets = summary['sentiment_counts'].get('Positive', 0)
+    negative_tweets = summary['sentiment_counts'].get('Negative', 0)
+    neutral_tweets = summary['sentiment_counts'].get('Neutral', 0)
     
     # Find top airline by positive sentiment
-    airline_positive = filtered_data[filtered_data['Predicted_Sentiment'] == 'Positive']['Airline'].value_counts()
-    top_positive_airline = airline_positive.index[0] if len(airline_positive) > 0 else "N/A"
+    top_positive_airline = summary['top_positive_airline']
     
     # Find most active hour
-    peak_hour = filtered_data['hour'].value_counts().index[0] if len(filtered_data) > 0 else "N/A"
+    peak_hour = summary['peak_hour']
     
     # Find average tweet length
-    avg_tweet_length = filtered_data['tweet_content'].str.len().mean()
+    avg_tweet_length = summary['avg_length']
     
     # Find average confidence
-    avg_confidence = filtered_data['Sentiment_Confidence'].mean() * 100
+    avg_confidence = summary['avg_confidence'] * 100
     
     # Create insights cards
     col1, col2 = st.columns(2)
@@ -584,13 +721,14 @@ with tab1:
         <div class="metric-card">
             <h4 style="color: #6c757d; margin: 0;">📈 Data Quality</h4>
             <p style="color: #fafafa; margin: 0.5rem 0;">Total Tweets: <strong>{total_tweets:,}</strong></p>
-            <p style="color: #fafafa; margin: 0.5rem 0;">Airlines Covered: <strong>{len(filtered_data['Airline'].unique())}</strong></p>
+            <p style="color: #fafafa; margin: 0.5rem 0;">Airlines Covered: <strong>{summary['airline_count']}</strong></p>
             <p style="color: #b0b0b0; margin: 0.5rem 0;">Real-time sentiment analysis</p>
         </div>
         """, unsafe_allow_html=True)
 
 # Tab 2: Trends & Analytics
-with tab2:
+def render_trends():
+    cube = filtered_cube()
     st.markdown('<h2 class="section-header">📈 Temporal Trends & Analytics</h2>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
@@ -598,70 +736,68 @@ with tab2:
     with col1:
         st.markdown('<h3 class="section-header">Sentiment Trends Over Time</h3>', unsafe_allow_html=True)
         
-        daily_sentiment = filtered_data.groupby([filtered_data['date'].dt.date, 'Predicted_Sentiment']).size().unstack(fill_value=0)
+        def build_daily_sentiment():
+            daily_sentiment = sentiment_pivot(cube, 'day').rename_axis('date')
         
-        fig = px.line(
-            daily_sentiment,
-            title="",
-            labels={'value': 'Number of Tweets', 'date': 'Date'},
-            color_discrete_map={
-                'Positive': '#00d4ff',
-                'Negative': '#ff6b35',
-                'Neutral': '#6c757d'
-            }
-        )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.line(
+                daily_sentiment,
+                title="",
+                labels={'value': 'Number of Tweets', 'date': 'Date'},
+                color_discrete_map={
+                    'Positive': '#00d4ff',
+                    'Negative': '#ff6b35',
+                    'Neutral': '#6c757d'
+                }
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('daily_sentiment', build_daily_sentiment), use_container_width=True)
     
     with col2:
         st.markdown('<h3 class="section-header">Hourly Activity Pattern</h3>', unsafe_allow_html=True)
         
-        hourly_activity = filtered_data['hour'].value_counts().sort_index()
+        def build_hourly_activity():
+            hourly_activity = cube.groupby('hour')['count'].sum().sort_index()
         
-        fig = px.bar(
-            x=hourly_activity.index,
-            y=hourly_activity.values,
-            title="",
-            labels={'x': 'Hour', 'y': 'Number of Tweets'},
-            color_discrete_sequence=['#00d4ff']
-        )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.bar(
+                x=hourly_activity.index,
+                y=hourly_activity.values,
+                title="",
+                labels={'x': 'Hour', 'y': 'Number of Tweets'},
+                color_discrete_sequence=['#00d4ff']
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('hourly_activity', build_hourly_activity), use_container_width=True)
     
     # Weekly patterns
     st.markdown('<h3 class="section-header">Weekly Activity Patterns</h3>', unsafe_allow_html=True)
     
-    weekly_sentiment = filtered_data.groupby(['day_of_week', 'Predicted_Sentiment']).size().unstack(fill_value=0)
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    weekly_sentiment = weekly_sentiment.reindex(day_order)
-    
-    fig = px.bar(
-        weekly_sentiment,
-        title="",
-        barmode='group',
-        color_discrete_map={
-            'Positive': '#00d4ff',
-            'Negative': '#ff6b35',
-            'Neutral': '#6c757d'
-        }
-    )
-    fig.update_layout(height=400, **create_chart_config())
-    st.plotly_chart(fig, use_container_width=True)
+    def build_weekly_sentiment():
+        weekly_sentiment = sentiment_pivot(cube, 'day_of_week')
+        weekly_sentiment = weekly_sentiment.reindex(DAY_ORDER)
+    
+        fig = px.bar(
+            weekly_sentiment,
+            title="",
+            barmode='group',
+            color_discrete_map={
+                'Positive': '#00d4ff',
+                'Negative': '#ff6b35',
+                'Neutral': '#6c757d'
+            }
+        )
+        fig.update_layout(height=400, **create_chart_config())
+        return fig
+    st.plotly_chart(cached_figure('weekly_sentiment', build_weekly_sentiment), use_container_width=True)
 
 # Tab 3: Airline Comparison
-with tab3:
+def render_airline_comparison():
+    cube = filtered_cube()
     st.markdown('<h2 class="section-header">🏢 Airline Performance Comparison</h2>', unsafe_allow_html=True)
     
     # Airline metrics
-    airline_metrics = filtered_data.groupby('Airline').agg({
-        'Predicted_Sentiment': lambda x: (x == 'Positive').mean() * 100,
-        'Sentiment_Confidence': 'mean',
-        'retweet_count': 'mean',
-        'like_count': 'mean'
-    }).round(2)
-    
-    airline_metrics.columns = ['Positive_Sentiment_%', 'Avg_Confidence', 'Avg_Retweets', 'Avg_Likes']
-    airline_metrics['Total_Tweets'] = filtered_data['Airline'].value_counts()
+    airline_metrics = cached_result('airline_metrics', lambda: cube_airline_metrics(cube))
     
     st.markdown('<h3 class="section-header">Airline Performance Metrics</h3>', unsafe_allow_html=True)
     st.dataframe(airline_metrics, use_container_width=True)
@@ -671,62 +807,171 @@ with tab3:
     with col1:
         st.markdown('<h3 class="section-header">Sentiment Distribution by Airline</h3>', unsafe_allow_html=True)
         
-        airline_sentiment_pivot = filtered_data.groupby(['Airline', 'Predicted_Sentiment']).size().unstack(fill_value=0)
+        def build_airline_sentiment():
+            airline_sentiment_pivot = sentiment_pivot(cube, 'Airline')
         
-        fig = px.bar(
-            airline_sentiment_pivot,
-            title="",
-            barmode='group',
-            color_discrete_map={
-                'Positive': '#00d4ff',
-                'Negative': '#ff6b35',
-                'Neutral': '#6c757d'
-            }
-        )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.bar(
+                airline_sentiment_pivot,
+                title="",
+                barmode='group',
+                color_discrete_map={
+                    'Positive': '#00d4ff',
+                    'Negative': '#ff6b35',
+                    'Neutral': '#6c757d'
+                }
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('airline_sentiment', build_airline_sentiment), use_container_width=True)
     
     with col2:
         st.markdown('<h3 class="section-header">Positive Sentiment Percentage</h3>', unsafe_allow_html=True)
         
-        positive_pct = airline_metrics['Positive_Sentiment_%'].sort_values(ascending=True)
+        def build_airline_positive_pct():
+            positive_pct = airline_metrics['Positive_Sentiment_%'].sort_values(ascending=True)
+        
+            fig = px.bar(
+                x=positive_pct.values,
+                y=positive_pct.index,
+                orientation='h',
+                title="",
+                labels={'x': 'Positive Sentiment (%)', 'y': 'Airline'},
+                color_discrete_sequence=['#00d4ff']
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('airline_positive_pct', build_airline_positive_pct), use_container_width=True)
+
+# Tab 4: Geography
+def render_geography():
+    st.markdown('<h2 class="section-header">🗺️ Geographic Sentiment</h2>', unsafe_allow_html=True)
+    
+    if cached_region_index() is None:
+        st.info(f"State outlines were not found at `{STATES_PATH}`, so tweets cannot be placed in states.")
+        return
+    if 'State' not in data.columns:
+        st.info("State assignments are not available for this data source. Rebuild the snapshot with `python dashboard_data.py` to add them.")
+        return
+    
+    # States were assigned once at load time, so every view here is a groupby on a categorical
+    def count_state_sentiment():
+        columns = [data.columns.get_loc('State'), data.columns.get_loc('Predicted_Sentiment')]
+        counts = data.iloc[filtered_rows, columns].groupby(['State', 'Predicted_Sentiment'], observed=True).size().unstack(fill_value=0)
+        counts.index = counts.index.astype(str)
+        counts.columns = counts.columns.astype(str)
+        return counts.reindex(columns=['Negative', 'Neutral', 'Positive'], fill_value=0)
+    
+    state_sentiment = cached_result('state_sentiment', count_state_sentiment)
+    unplaced = int(state_sentiment.loc[UNKNOWN_REGION].sum()) if UNKNOWN_REGION in state_sentiment.index else 0
+    state_sentiment = state_sentiment.drop(index=UNKNOWN_REGION, errors='ignore')
+    
+    if state_sentiment.empty:
+        st.info("No tweets with a location inside India match the selected filters.")
+        return
+    
+    map_metric = st.radio("Map Metric", ['Tweets', 'Positive %', 'Negative %'], horizontal=True, key="map_metric")
+    
+    def build_state_map():
+        totals = state_sentiment.sum(axis=1)
+        if map_metric == 'Tweets':
+            values, colors = totals, ['#262730', '#00d4ff']
+        elif map_metric == 'Positive %':
+            values, colors = state_sentiment['Positive'] / totals * 100, ['#262730', '#00d4ff']
+        else:
+            values, colors = state_sentiment['Negative'] / totals * 100, ['#262730', '#ff6b35']
+        
+        fig = px.choropleth(
+            locations=values.index,
+            color=values.round(1).values,
+            geojson=cached_state_geojson(),
+            featureidkey='properties.name',
+            color_continuous_scale=colors,
+            labels={'color': map_metric, 'locations': 'State'}
+        )
+        fig.update_geos(fitbounds='locations', visible=False, bgcolor='rgba(0,0,0,0)')
+        fig.update_layout(height=550, margin=dict(l=0, r=0, t=0, b=0), **create_chart_config())
+        return fig
+    st.plotly_chart(cached_figure('state_map', build_state_map, map_metric), use_container_width=True)
+    
+    if unplaced:
+        st.caption(f"{unplaced:,} tweets have no coordinates or fall outside the state outlines and are not mapped.")
+    
+    st.markdown('<h3 class="section-header">Sentiment by State</h3>', unsafe_allow_html=True)
+    
+    def build_state_sentiment():
+        top_states = state_sentiment.loc[state_sentiment.sum(axis=1).sort_values(ascending=False).index[:15]]
         
         fig = px.bar(
-            x=positive_pct.values,
-            y=positive_pct.index,
-            orientation='h',
+            top_states,
             title="",
-            labels={'x': 'Positive Sentiment (%)', 'y': 'Airline'},
-            color_discrete_sequence=['#00d4ff']
+            color_discrete_map={
+                'Positive': '#00d4ff',
+                'Negative': '#ff6b35',
+                'Neutral': '#6c757d'
+            }
         )
         fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
+    st.plotly_chart(cached_figure('state_sentiment', build_state_sentiment), use_container_width=True)
 
-# Tab 4: Content Analysis
-with tab4:
+# Tab 5: Content Analysis
+def render_content_analysis():
     st.markdown('<h2 class="section-header">📝 Content Analysis</h2>', unsafe_allow_html=True)
     
     # Hashtag analysis
     st.markdown('<h3 class="section-header">Hashtag Analysis</h3>', unsafe_allow_html=True)
     
-    all_hashtags = []
-    for text in filtered_data['tweet_content']:
-        all_hashtags.extend(extract_hashtags(text))
-    
-    if all_hashtags:
-        hashtag_counts = Counter(all_hashtags)
-        top_hashtags = dict(hashtag_counts.most_common(15))
+    # Hashtags are extracted once per dataset, and only when this section first renders
+    hashtags = cached_hashtag_index(data_version, data)
+    top_hashtags = cached_result('top_hashtags', lambda: hashtags.top(filtered_rows, 15))
+    
+    if top_hashtags:
+        def build_top_hashtags():
+            fig = px.bar(
+                x=list(top_hashtags.values()),
+                y=list(top_hashtags.keys()),
+                orientation='h',
+                title="",
+                labels={'x': 'Count', 'y': 'Hashtag'},
+                color_discrete_sequence=['#00d4ff']
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('top_hashtags', build_top_hashtags), use_container_width=True)
         
-        fig = px.bar(
-            x=list(top_hashtags.values()),
-            y=list(top_hashtags.keys()),
-            orientation='h',
-            title="",
-            labels={'x': 'Count', 'y': 'Hashtag'},
-            color_discrete_sequence=['#00d4ff']
+        # Hashtag trends and tweets, answered from the index rather than the tweet text
+        st.markdown('<h3 class="section-header">Hashtag Trends</h3>', unsafe_allow_html=True)
+        selected_hashtags = st.multiselect(
+            "Select Hashtags",
+            options=list(top_hashtags),
+            default=list(top_hashtags)[:3],
+            key="selected_hashtags"
         )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+        
+        if selected_hashtags:
+            hashtag_key = tuple(sorted(selected_hashtags))
+            
+            def build_hashtag_trend():
+                trend = hashtags.trend(data['date'], selected_hashtags, filtered_rows)
+                fig = px.line(
+                    trend,
+                    x=trend.index,
+                    y=trend.columns,
+                    title="",
+                    labels={'x': 'Date', 'value': 'Number of Tweets', 'variable': 'Hashtag'}
+                )
+                fig.update_layout(height=400, **create_chart_config())
+                return fig
+            st.plotly_chart(cached_figure('hashtag_trend', build_hashtag_trend, hashtag_key), use_container_width=True)
+            
+            hashtag_rows = cached_result(
+                'hashtag_rows', lambda: hashtags.rows_with(selected_hashtags, filtered_rows), hashtag_key
+            )
+            st.markdown(f'<p style="color: #b0b0b0;"><strong>Tweets with selected hashtags:</strong> {len(hashtag_rows):,}</p>', unsafe_allow_html=True)
+            st.dataframe(
+                take_rows(data, hashtag_rows[-10:])[['date', 'Airline', 'Predicted_Sentiment', 'tweet_content']],
+                use_container_width=True
+            )
     else:
         st.info("No hashtags found in the selected data.")
     
@@ -736,54 +981,77 @@ with tab4:
     with col1:
         st.markdown('<h3 class="section-header">Tweet Length Distribution</h3>', unsafe_allow_html=True)
         
-        tweet_lengths = filtered_data['tweet_content'].str.len()
+        def build_tweet_lengths():
+            tweet_lengths = filtered_tweets()['tweet_content'].str.len()
         
-        fig = px.histogram(
-            x=tweet_lengths,
-            title="",
-            labels={'x': 'Tweet Length (characters)'},
-            color_discrete_sequence=['#00d4ff']
-        )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.histogram(
+                x=tweet_lengths,
+                title="",
+                labels={'x': 'Tweet Length (characters)'},
+                color_discrete_sequence=['#00d4ff']
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('tweet_lengths', build_tweet_lengths), use_container_width=True)
     
     with col2:
         st.markdown('<h3 class="section-header">Average Tweet Length by Sentiment</h3>', unsafe_allow_html=True)
         
-        avg_length_by_sentiment = filtered_data.groupby('Predicted_Sentiment')['tweet_content'].apply(lambda x: x.str.len().mean())
+        def build_avg_length_by_sentiment():
+            avg_length_by_sentiment = filtered_tweets().groupby('Predicted_Sentiment', observed=True)['tweet_content'].apply(lambda x: x.str.len().mean())
         
-        fig = px.bar(
-            x=avg_length_by_sentiment.index,
-            y=avg_length_by_sentiment.values,
-            title="",
-            labels={'x': 'Sentiment', 'y': 'Average Length (characters)'},
-            color_discrete_sequence=['#00d4ff']
-        )
-        fig.update_layout(height=400, **create_chart_config())
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.bar(
+                x=avg_length_by_sentiment.index,
+                y=avg_length_by_sentiment.values,
+                title="",
+                labels={'x': 'Sentiment', 'y': 'Average Length (characters)'},
+                color_discrete_sequence=['#00d4ff']
+            )
+            fig.update_layout(height=400, **create_chart_config())
+            return fig
+        st.plotly_chart(cached_figure('avg_length_by_sentiment', build_avg_length_by_sentiment), use_container_width=True)
 
-# Tab 5: Deep Dive
-with tab5:
+# Tab 6: Deep Dive
+def render_deep_dive():
     st.markdown('<h2 class="section-header">🔍 Deep Dive Analysis</h2>', unsafe_allow_html=True)
     
-    # Sample tweets display
-    st.markdown('<h3 class="section-header">Sample Tweets by Sentiment</h3>', unsafe_allow_html=True)
+    # Full-text search: token index lookups, narrowed to the rows the sidebar filters kept
+    st.markdown('<h3 class="section-header">Search Tweets</h3>', unsafe_allow_html=True)
     
-    sentiment_choice = st.selectbox("Select Sentiment to View Sample Tweets:", ['Positive', 'Negative', 'Neutral'])
-    
-    sample_tweets = filtered_data[filtered_data['Predicted_Sentiment'] == sentiment_choice][['tweet_content', 'Airline', 'date', 'Sentiment_Confidence']].head(10)
+    search_query = st.text_input(
+        "Search Tweets",
+        value="",
+        placeholder='refund "baggage lost"',
+        help="Every word must appear in the tweet; wrap words in quotes to match them as a phrase.",
+        key="search_query",
+        label_visibility="collapsed"
+    )
     
-    for idx, tweet in sample_tweets.iterrows():
-        confidence_color = '#00d4ff' if tweet['Sentiment_Confidence'] > 0.7 else '#ff6b35' if tweet['Sentiment_Confidence'] > 0.5 else '#6c757d'
+    if search_query.strip():
+        # Built once per dataset, the first time anyone searches
+        search_index = cached_search_index(data_version, data)
+        search_started = time.perf_counter()
+        search_rows, search_scores = cached_result(
+            'search', lambda: search_index.search(search_query, filtered_rows), search_query
+        )
+        search_ms = (time.perf_counter() - search_started) * 1000
         
-        st.markdown(f"""
-        <div class="airline-card">
-            <h4 style="color: #00d4ff;">{tweet['Airline']}</h4>
-            <p style="color: #b0b0b0;"><strong>Date:</strong> {tweet['date'].strftime('%Y-%m-%d %H:%M')}</p>
-            <p style="color: #b0b0b0;"><strong>Confidence:</strong> <span style="color: {confidence_color};">{tweet['Sentiment_Confidence']:.3f}</span></p>
-            <p style="color: #fafafa;"><strong>Tweet:</strong> {tweet['tweet_content'][:200]}{'...' if len(tweet['tweet_content']) > 200 else ''}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            page_size = st.selectbox("Results per Page", [10, 25, 50], key="search_page_size")
+        page_count = max(1, -(-len(search_rows) // page_size))
+        with col2:
+            # Keyed by the query so a new search starts again from the first page
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                   key=f"search_page:{search_query}:{page_size}")
+        
+        st.markdown(f'<p style="color: #b0b0b0;"><strong>Matches:</strong> {len(search_rows):,} tweets in {search_ms:.1f} ms · page {page} of {page_count}</p>', unsafe_allow_html=True)
+        
+        if len(search_rows) > 0:
+            start = (page - 1) * page_size
+            results = data.take(search_rows[start:start + page_size])[['date', 'Airline', 'Predicted_Sentiment', 'tweet_content']]
+            results.insert(0, 'Relevance', search_scores[start:start + page_size].round(2))
+            st.dataframe(results, use_container_width=True, hide_index=True)
     
     # Advanced filtering
     st.markdown('<h3 class="section-header">Advanced Data Explorer</h3>', unsafe_allow_html=True)
@@ -796,31 +1064,107 @@ with tab5:
     
     with col2:
         min_likes = st.slider("Minimum Likes", 0, 100, 0)
-        show_raw_data = st.checkbox("Show Raw Data")
-    
-    # Apply advanced filters
-    advanced_filtered = filtered_data[
-        (filtered_data['Sentiment_Confidence'] >= min_confidence) &
-        (filtered_data['retweet_count'] >= min_retweets) &
-        (filtered_data['like_count'] >= min_likes)
-    ]
-    
-    st.markdown(f'<p style="color: #b0b0b0;"><strong>Filtered Results:</strong> {len(advanced_filtered)} tweets</p>', unsafe_allow_html=True)
+        browse_sort = st.selectbox("Sort Tweets By", list(SORT_OPTIONS), key="browse_sort")
+    
+    # Apply advanced filters (row positions are memoized per filter state, sliders included)
+    def apply_advanced_filters():
+        filtered_data = filtered_tweets()
+        return filtered_rows[(
+            (filtered_data['Sentiment_Confidence'] >= min_confidence) &
+            (filtered_data['retweet_count'] >= min_retweets) &
+            (filtered_data['like_count'] >= min_likes)
+        ).to_numpy()]
+    advanced_rows = cached_result('advanced_rows', apply_advanced_filters, min_confidence, min_retweets, min_likes)
+    st.markdown(f'<p style="color: #b0b0b0;"><strong>Filtered Results:</strong> {len(advanced_rows)} tweets</p>', unsafe_allow_html=True)
+    
+    # Tweet browser: keyset pages over the filtered rows; only the visible page is sent to the browser
+    st.markdown('<h3 class="section-header">Tweet Browser</h3>', unsafe_allow_html=True)
+    
+    browse_key = filter_key + (min_confidence, min_retweets, min_likes, browse_sort)
+    if st.session_state.get("browse_key") != browse_key:
+        st.session_state["browse_key"] = browse_key
+        st.session_state["browse_cursors"] = [None]
+    cursors = st.session_state["browse_cursors"]
+    
+    page_rows = cached_tweet_browser(data_version, data).page(
+        browse_sort, advanced_rows, after=cursors[-1], limit=BROWSE_PAGE_SIZE
+    )
+    page_count = max(1, -(-len(advanced_rows) // BROWSE_PAGE_SIZE))
     
-    if show_raw_data and len(advanced_filtered) > 0:
-        st.dataframe(advanced_filtered[['date', 'user', 'tweet_content', 'Airline', 'Predicted_Sentiment', 'Sentiment_Confidence', 'retweet_count', 'like_count']], use_container_width=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("◀ Previous", key="browse_previous", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        st.markdown(f'<p style="color: #b0b0b0; text-align: center;">Page {len(cursors)} of {page_count}</p>', unsafe_allow_html=True)
+    with col3:
+        if st.button("Next ▶", key="browse_next", disabled=len(cursors) >= page_count):
+            cursors.append(int(page_rows[-1]))
+            st.rerun()
+    
+    if len(page_rows) > 0:
+        st.dataframe(
+            data.take(page_rows)[['date', 'user', 'tweet_content', 'Airline', 'Predicted_Sentiment', 'Sentiment_Confidence', 'retweet_count', 'like_count']],
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.info("No tweets match the selected filters.")
     
-    # Export functionality
+    # Export functionality: written in chunks to a compressed temp file, never one big in-memory string
     st.markdown('<h3 class="section-header">Export Data</h3>', unsafe_allow_html=True)
     
-    if st.button("Export Filtered Data to CSV"):
-        csv = advanced_filtered.to_csv(index=False)
-        st.download_button(
-            label="Download CSV",
-            data=csv,
-            file_name=f"airline_sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        export_format = st.selectbox("Format", available_formats(), key="export_format")
+    with col2:
+        export_columns = st.multiselect(
+            "Columns",
+            options=list(data.columns),
+            default=[column for column in EXPORT_COLUMNS if column in data.columns],
+            key="export_columns"
         )
+    
+    if st.button("Export Filtered Data", disabled=not export_columns):
+        export_path = export_to_tempfile(data, advanced_rows, export_columns, export_format)
+        try:
+            with open(export_path, 'rb') as export_file:
+                st.download_button(
+                    label=f"Download {export_format.upper()} ({os.path.getsize(export_path) / 1e6:.1f} MB)",
+                    data=export_file,
+                    file_name=f"airline_sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}",
+                    mime=EXPORT_FORMATS[export_format]
+                )
+        finally:
+            os.remove(export_path)
+
+# Only the section in view runs its analytics; the others cost nothing on a rerun
+TABS = {
+    "📊 Overview": render_overview,
+    "📈 Trends & Analytics": render_trends,
+    "🏢 Airline Comparison": render_airline_comparison,
+    "🗺️ Geography": render_geography,
+    "📝 Content Analysis": render_content_analysis,
+    "🔍 Deep Dive": render_deep_dive,
+}
+active_tab = st.radio("Dashboard Section", list(TABS), horizontal=True, key="active_tab", label_visibility="collapsed")
+
+tab_started = time.perf_counter()
+if len(filtered_rows) == 0:
+    # A cleared airline or sentiment selection keeps no tweets, as the original filters did
+    st.info("No tweets match the selected filters. Choose at least one airline and sentiment, or 'All'.")
+else:
+    TABS[active_tab]()
+tab_seconds = time.perf_counter() - tab_started
+
+# Last render time per tab, kept for the session so the cost of each section can be compared
+tab_timings = st.session_state.setdefault("tab_timings", {})
+tab_timings[active_tab] = tab_seconds
+st.caption(f"⏱️ {active_tab} rendered in {tab_seconds * 1000:.0f} ms")
+with st.sidebar.expander("⏱️ Tab Render Times"):
+    for name, seconds in tab_timings.items():
+        st.write(f"{name}: {seconds * 1000:.0f} ms")
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,58 @@
+"""Micro-benchmark: one-scan airline and lexicon matcher vs. per-keyword scans.
+
+Run from the repository root: ``python benchmarks/bench_matcher.py --rows 1000000``
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tweet_matcher import AIRLINE_ALIASES, NEGATIVE_TERMS, POSITIVE_TERMS, TweetMatcher  # noqa: E402
+
+
+def keyword_scans(texts):
+    """The earlier approach: one substring scan per airline keyword and a token explode for the lexicon."""
+    normalized = texts.str.lower()
+    airlines = pd.Series("Live X", index=texts.index, dtype=object)
+    for airline, aliases in reversed(list(AIRLINE_ALIASES.items())):
+        airlines[normalized.str.contains(aliases[0], regex=False)] = airline
+
+    terms = normalized.str.findall(r"[a-z']+").explode().dropna().reset_index().drop_duplicates()
+    rows, words = terms.iloc[:, 0].to_numpy(), terms.iloc[:, 1]
+    positive = np.bincount(rows[words.isin(POSITIVE_TERMS).to_numpy()], minlength=len(texts))
+    negative = np.bincount(rows[words.isin(NEGATIVE_TERMS).to_numpy()], minlength=len(texts))
+    return airlines, positive, negative
+
+
+def timed(label, function, rows):
+    started = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed:8.2f}s  {rows / elapsed:12,.0f} tweets/sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", default="indianairline.csv", help="CSV to sample tweet_content from")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of tweets to classify")
+    args = parser.parse_args()
+
+    sample = pd.read_csv(args.input, usecols=['tweet_content'])['tweet_content'].fillna('').astype(str)
+    tweets = sample.sample(args.rows, replace=True, random_state=0).reset_index(drop=True)
+    print(f"Classifying {args.rows:,} tweets")
+
+    timed("per-keyword scans", lambda: keyword_scans(tweets), args.rows)
+    matcher = timed("compile matcher", TweetMatcher, 1)
+    airlines, labels, _ = timed("TweetMatcher.classify", lambda: matcher.classify(tweets), args.rows)
+    print(pd.Series(airlines).value_counts().head(8).to_string())
+    print(pd.Series(labels).value_counts().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Micro-benchmark: regex tweet masking vs. the original per-word loop.
+
+Run from the repository root: ``python benchmarks/bench_preprocess.py --rows 1000000``
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocess import preprocess_series, preprocess_tweets  # noqa: E402
+
+
+def word_loop(tweet):
+    tweet_words = []
+    for word in tweet.split(' '):
+        if word.startswith('@') and len(word) > 1:
+            word = '@user'
+        elif word.startswith('http'):
+            word = "http"
+        tweet_words.append(word)
+    return " ".join(tweet_words)
+
+
+def timed(label, function, rows):
+    started = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed:8.2f}s  {rows / elapsed:12,.0f} tweets/sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", default="indianairline.csv", help="CSV to sample tweet_content from")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of tweets to preprocess")
+    args = parser.parse_args()
+
+    sample = pd.read_csv(args.input, usecols=['tweet_content'])['tweet_content'].fillna('').astype(str)
+    tweets = sample.sample(args.rows, replace=True, random_state=0).reset_index(drop=True)
+    tweet_list = tweets.tolist()
+    print(f"Preprocessing {args.rows:,} tweets")
+
+    expected = timed("per-word loop", lambda: [word_loop(tweet) for tweet in tweet_list], args.rows)
+    regex_list = timed("preprocess_tweets", lambda: preprocess_tweets(tweet_list), args.rows)
+    regex_series = timed("preprocess_series", lambda: preprocess_series(tweets), args.rows)
+
+    identical = regex_list == expected and regex_series.tolist() == expected
+    print(f"Byte-identical output: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
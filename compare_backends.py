@@ -0,0 +1,65 @@
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+from sentiment_analyzer import BACKENDS, DEFAULT_BATCH_SIZE, MODEL_NAME, SentimentAnalyzer
+
+
+def timed_predict(analyzer, tweets):
+    started = time.perf_counter()
+    labels = analyzer.predict(tweets)
+    return labels, len(tweets) / max(time.perf_counter() - started, 1e-9)
+
+
+def label_agreement(reference, candidate):
+    """Fraction of tweets where both backends chose the same label."""
+    if not reference:
+        return 1.0
+    return sum(a == b for a, b in zip(reference, candidate)) / len(reference)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check a faster backend's labels and throughput against full-precision PyTorch."
+    )
+    parser.add_argument("--input", default="indianairline.csv", help="CSV file with a tweet_content column")
+    parser.add_argument("--backend", choices=[b for b in BACKENDS if b != "torch"], default="quantized")
+    parser.add_argument("--onnx-path", default=None, help="ONNX graph to evaluate with --backend onnx")
+    parser.add_argument("--model", default=MODEL_NAME, help="Model name present in the local HF cache")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--limit", type=int, default=None, help="Only compare the first N tweets")
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        default=0.97,
+        help="Exit with status 1 when label agreement falls below this fraction",
+    )
+    args = parser.parse_args(argv)
+
+    tweets = pd.read_csv(args.input, usecols=['tweet_content'], nrows=args.limit)['tweet_content']
+    tweets = tweets.fillna('').astype(str).tolist()
+
+    reference = SentimentAnalyzer(args.model, batch_size=args.batch_size, local_files_only=True)
+    candidate = SentimentAnalyzer(
+        args.model,
+        batch_size=args.batch_size,
+        local_files_only=True,
+        backend=args.backend,
+        onnx_path=args.onnx_path,
+    )
+
+    reference_labels, reference_speed = timed_predict(reference, tweets)
+    candidate_labels, candidate_speed = timed_predict(candidate, tweets)
+    agreement = label_agreement(reference_labels, candidate_labels)
+
+    print(f"Tweets compared: {len(tweets)}")
+    print(f"torch: {reference_speed:.1f} tweets/sec")
+    print(f"{args.backend}: {candidate_speed:.1f} tweets/sec ({candidate_speed / max(reference_speed, 1e-9):.2f}x)")
+    print(f"Label agreement: {agreement * 100:.2f}% (minimum {args.min_agreement * 100:.2f}%)")
+    return 0 if agreement >= args.min_agreement else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
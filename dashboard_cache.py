@@ -0,0 +1,105 @@
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def estimate_bytes(value):
+    """Rough in-memory size of a cached result, used to enforce the memory cap."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True, deep=False)))
+    if hasattr(value, 'to_json'):
+        # Plotly figures: the serialized payload is what Streamlit ships, and roughly what we hold
+        return len(value.to_json())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Abandoned(Exception):
+    """Set on an in-flight result whose computing session stopped before finishing it."""
+
+
+class ResultCache:
+    """Thread-safe LRU memo shared by every dashboard session.
+
+    Entries are evicted least recently used first once their estimated size passes
+    ``max_bytes``. Sessions asking for a key that another session is already computing
+    wait for that result instead of computing it again.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` once on a miss."""
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key][0]
+                future = self._in_flight.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._in_flight[key] = future
+                    self.misses += 1
+            if owner:
+                return self._compute(key, compute, future)
+            try:
+                return future.result()
+            except _Abandoned:
+                # The owning session was interrupted (e.g. a Streamlit rerun); compute it here instead
+                continue
+
+    def _compute(self, key, compute, future):
+        try:
+            value = compute()
+        except Exception as error:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(error)
+            raise
+        except BaseException:
+            # RerunException and StopException only concern the session that raised them
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(_Abandoned())
+            raise
+
+        size = estimate_bytes(value)
+        with self._lock:
+            del self._in_flight[key]
+            if size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self.current_bytes -= evicted_size
+        future.set_result(value)
+        return value
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
@@ -0,0 +1,103 @@
+import argparse
+import os
+
+import pandas as pd
+
+from geo_index import STATES_PATH, RegionIndex
+from sentiment_analyzer import PROBABILITY_COLUMNS
+
+DATA_PATH = "sentiment_analyzed_data.csv"
+SNAPSHOT_PATH = "sentiment_analyzed_data.feather"
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CATEGORICAL_COLUMNS = ['Airline', 'Predicted_Sentiment']
+
+
+def prepare_dashboard_frame(data, states_path=STATES_PATH):
+    """Parse dates, derive the time and state columns and encode repeated strings as categoricals."""
+    data['date'] = pd.to_datetime(data['date'])
+    data['tweet_location'] = data['tweet_location'].fillna('Unknown')
+    data['latitude'] = pd.to_numeric(data['latitude'], errors='coerce')
+    data['longitude'] = pd.to_numeric(data['longitude'], errors='coerce')
+    data['hour'] = data['date'].dt.hour.astype('int8')
+    data['day_of_week'] = pd.Categorical(data['date'].dt.day_name(), categories=DAY_ORDER, ordered=True)
+    data['month'] = data['date'].dt.month.astype('int8')
+    data['year'] = data['date'].dt.year.astype('int16')
+    data['Airline'] = data['Airline'].str.title()
+    for column in CATEGORICAL_COLUMNS:
+        data[column] = data[column].astype('category')
+    # Probabilities written by tweet.py are kept as float32 so confidence filters stay compact and vectorized
+    for column in ['Sentiment_Confidence'] + PROBABILITY_COLUMNS:
+        if column in data.columns:
+            data[column] = pd.to_numeric(data[column], errors='coerce').astype('float32')
+    # Point-in-state assignment runs here, once per load or snapshot build, never per rerun
+    if states_path and os.path.exists(states_path):
+        data['State'] = RegionIndex.from_shapefile(states_path).assign(data['longitude'], data['latitude'])
+    return data
+
+
+def utc_days(dates):
+    """Naive midnight timestamps for each date, in UTC like ``dates.dt.date`` on the dashboard data."""
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+    return dates.dt.normalize()
+
+
+def read_source(source=DATA_PATH):
+    """Parse the scored CSV the way the dashboard always has."""
+    return prepare_dashboard_frame(pd.read_csv(source, encoding='latin-1'))
+
+
+def snapshot_is_current(source=DATA_PATH, snapshot=SNAPSHOT_PATH):
+    """True when ``snapshot`` exists and was built after ``source`` last changed."""
+    if not os.path.exists(snapshot):
+        return False
+    return not os.path.exists(source) or os.path.getmtime(snapshot) >= os.path.getmtime(source)
+
+
+def dataset_version(source=DATA_PATH, snapshot=SNAPSHOT_PATH):
+    """A string that changes whenever the file the dashboard would load changes."""
+    path = snapshot if snapshot_is_current(source, snapshot) else source
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def build_snapshot(source=DATA_PATH, snapshot=SNAPSHOT_PATH):
+    """Write a typed, uncompressed Feather snapshot that the dashboard can memory-map."""
+    data = read_source(source).reset_index(drop=True)
+    data.to_feather(snapshot, compression='uncompressed')
+    return data
+
+
+def load_dashboard_data(source=DATA_PATH, snapshot=SNAPSHOT_PATH):
+    """Memory-map the columnar snapshot when it is current, otherwise parse the CSV."""
+    if snapshot_is_current(source, snapshot):
+        try:
+            from pyarrow import feather
+        except ImportError:
+            # pyarrow is not installed; the CSV path below still works
+            feather = None
+        if feather is not None:
+            data = feather.read_table(snapshot, memory_map=True).to_pandas()
+            data['Date'] = data['date']
+            return data
+
+    data = read_source(source)
+    data['Date'] = data['date']
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the dashboard's columnar snapshot from the scored CSV.")
+    parser.add_argument("--source", default=DATA_PATH, help="Scored CSV written by tweet.py")
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH, help="Feather file the dashboard memory-maps")
+    args = parser.parse_args(argv)
+
+    data = build_snapshot(args.source, args.snapshot)
+    print(f"Wrote {len(data):,} rows to {args.snapshot} ({os.path.getsize(args.snapshot) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
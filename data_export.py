@@ -0,0 +1,77 @@
+import gzip
+import os
+import tempfile
+
+# Export format -> MIME type for the download
+EXPORT_FORMATS = {
+    'csv.gz': 'application/gzip',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def available_formats():
+    """Export formats usable here; Parquet needs pyarrow."""
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet']
+    return list(EXPORT_FORMATS)
+
+
+def iter_export_chunks(data, rows, columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield ``rows`` x ``columns`` of ``data`` a chunk at a time, so only one chunk is ever copied."""
+    positions = [data.columns.get_loc(column) for column in columns]
+    if not len(rows):
+        yield data.iloc[:0, positions]
+        return
+    for start in range(0, len(rows), chunk_rows):
+        yield data.iloc[rows[start:start + chunk_rows], positions]
+
+
+def write_export(data, rows, columns, path, fmt='csv.gz', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Write the selected rows and columns to ``path`` chunk by chunk; returns ``path``."""
+    chunks = iter_export_chunks(data, rows, columns, chunk_rows)
+    if fmt == 'parquet':
+        _write_parquet(chunks, path)
+    elif fmt in ('csv', 'csv.gz'):
+        opener = gzip.open if fmt == 'csv.gz' else open
+        with opener(path, 'wt', newline='', encoding='utf-8') as handle:
+            for number, chunk in enumerate(chunks):
+                chunk.to_csv(handle, index=False, header=number == 0)
+    else:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    return path
+
+
+def _write_parquet(chunks, path):
+    import pyarrow as pa
+    from pyarrow import parquet
+
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                # A column that is entirely missing in the first chunk would otherwise be typed as null
+                schema = pa.schema(
+                    [pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field for field in schema],
+                    metadata=schema.metadata,
+                )
+                writer = parquet.ParquetWriter(path, schema, compression='zstd')
+            writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_to_tempfile(data, rows, columns, fmt='csv.gz', chunk_rows=DEFAULT_CHUNK_ROWS, directory=None):
+    """Write an export to a new temporary file and return its path; the caller removes it."""
+    handle, path = tempfile.mkstemp(prefix='airline_sentiment_', suffix=f'.{fmt}', dir=directory)
+    os.close(handle)
+    try:
+        return write_export(data, rows, columns, path, fmt, chunk_rows)
+    except BaseException:
+        os.remove(path)
+        raise
@@ -0,0 +1,63 @@
+import argparse
+import os
+
+from sentiment_analyzer import MODEL_NAME, default_onnx_path
+
+
+def export_onnx(model_name=MODEL_NAME, output=None, quantize=False, opset=14):
+    """Export the sentiment model from the local Hugging Face cache to an ONNX graph."""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    output = output or default_onnx_path(model_name)
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, local_files_only=True)
+    model.eval()
+    # The config's return_dict output is not traceable; export the logits tensor only
+    model.config.return_dict = False
+
+    sample = tokenizer(["@user my flight was delayed again", "http thanks for the upgrade"], padding=True,
+                       return_tensors="pt")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            output,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=opset,
+        )
+    print(f"Exported {model_name} to {output}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized_output = f"{os.path.splitext(output)[0]}-int8.onnx"
+        quantize_dynamic(output, quantized_output, weight_type=QuantType.QInt8)
+        print(f"Wrote int8 weight-quantized graph to {quantized_output}")
+        return quantized_output
+
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the RoBERTa sentiment model to ONNX for CPU inference.")
+    parser.add_argument("--model", default=MODEL_NAME, help="Model name already present in the local HF cache")
+    parser.add_argument("--output", default=None, help="Destination .onnx file (defaults to models/<model>.onnx)")
+    parser.add_argument("--quantize", action="store_true", help="Also write an int8 dynamically quantized copy")
+    parser.add_argument("--opset", type=int, default=14, help="ONNX opset version")
+    args = parser.parse_args(argv)
+    export_onnx(args.model, args.output, args.quantize, args.opset)
+
+
+if __name__ == "__main__":
+    main()
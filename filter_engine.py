@@ -0,0 +1,77 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from dashboard_data import utc_days
+
+BITMAP_COLUMNS = ('Airline', 'Predicted_Sentiment')
+
+
+class FilterIndex:
+    """Date-sorted row order plus per-value bitmaps for the sidebar filters.
+
+    Date ranges are resolved with a binary search over the sorted days, so only the rows
+    inside the range are touched. Airline and sentiment selections are boolean bitmaps
+    that are OR-ed per selection and probed for the in-range rows only.
+    """
+
+    def __init__(self, data):
+        self.size = len(data)
+        days = utc_days(data['date']).to_numpy(dtype='datetime64[ns]')
+        self.order = np.argsort(days, kind='stable')
+        self.sorted_days = days[self.order]
+        self.bitmaps = {}
+        for column in BITMAP_COLUMNS:
+            codes, values = pd.factorize(data[column].astype(str))
+            self.bitmaps[column] = {value: codes == code for code, value in enumerate(values)}
+        self._selection_mask = lru_cache(maxsize=32)(self._build_selection_mask)
+
+    def date_slice(self, date_range):
+        """Row positions whose UTC day lies in ``date_range``, in date order."""
+        if date_range is None or len(date_range) != 2:
+            return self.order
+        start = np.datetime64(pd.Timestamp(date_range[0]).to_datetime64(), 'ns')
+        end = np.datetime64(pd.Timestamp(date_range[1]).to_datetime64(), 'ns')
+        low = np.searchsorted(self.sorted_days, start, side='left')
+        high = np.searchsorted(self.sorted_days, end, side='right')
+        return self.order[low:high]
+
+    def filter(self, date_range=None, airlines=None, sentiments=None):
+        """Return the sorted row positions that pass every sidebar filter."""
+        rows = self.date_slice(date_range)
+        mask = self._selection_mask(_selection(airlines), _selection(sentiments))
+        if mask is None and len(rows) == self.size:
+            return np.arange(self.size)
+        if mask is not None:
+            rows = rows[mask[rows]]
+        # Keep the original row order so downstream views look exactly like a boolean-mask filter
+        return np.sort(rows)
+
+    def _build_selection_mask(self, airlines, sentiments):
+        mask = None
+        for column, selected in zip(BITMAP_COLUMNS, (airlines, sentiments)):
+            if selected is None:
+                continue
+            column_mask = np.zeros(self.size, dtype=bool)
+            for value in selected:
+                bitmap = self.bitmaps[column].get(value)
+                if bitmap is not None:
+                    column_mask |= bitmap
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+
+def _selection(values):
+    # None or 'All' stands for "no restriction", while an empty selection keeps no rows as the
+    # original mask filter did; tuples keep selections hashable for the mask cache
+    if values is None or 'All' in values:
+        return None
+    return tuple(sorted(values))
+
+
+def take_rows(data, rows):
+    """Select ``rows`` from ``data`` without copying when every row is kept."""
+    if len(rows) == len(data):
+        return data
+    return data.take(rows)
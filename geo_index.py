@@ -0,0 +1,188 @@
+import struct
+
+import numpy as np
+import pandas as pd
+
+STATES_PATH = "india_st.shp"
+STATE_FIELD = "STATE"
+UNKNOWN_REGION = "Unknown"
+GRID_CELLS = 64
+# Douglas-Peucker tolerance in degrees for the map outlines (about 5 km)
+SIMPLIFY_TOLERANCE = 0.05
+
+
+def read_polygons(path):
+    """Read a polygon shapefile into one list of (n, 2) lon/lat rings per record."""
+    with open(path, 'rb') as handle:
+        content = handle.read()
+    shapes = []
+    offset = 100
+    while offset < len(content):
+        _, words = struct.unpack('>ii', content[offset:offset + 8])
+        record = content[offset + 8:offset + 8 + words * 2]
+        offset += 8 + words * 2
+        if struct.unpack('<i', record[:4])[0] == 0:
+            shapes.append([])
+            continue
+        num_parts, num_points = struct.unpack('<ii', record[36:44])
+        parts = np.frombuffer(record, '<i4', num_parts, 44)
+        points = np.frombuffer(record, '<f8', num_points * 2, 44 + 4 * num_parts).reshape(-1, 2)
+        bounds = np.append(parts, num_points)
+        shapes.append([points[start:end] for start, end in zip(bounds[:-1], bounds[1:])])
+    return shapes
+
+
+def read_dbf_column(path, field):
+    """Read one character field from a dBASE table as a list of stripped strings."""
+    with open(path, 'rb') as handle:
+        content = handle.read()
+    count, header_length, record_length = struct.unpack('<IHH', content[4:12])
+    position, start, width = 32, 1, None
+    while content[position] != 0x0D:
+        name = content[position:position + 11].split(b'\0')[0].decode('ascii')
+        length = content[position + 16]
+        if name == field:
+            width = length
+            break
+        start += length
+        position += 32
+    if width is None:
+        raise KeyError(f"{path} has no field {field!r}")
+    return [
+        content[header_length + i * record_length + start:header_length + i * record_length + start + width]
+        .decode('latin-1').strip()
+        for i in range(count)
+    ]
+
+
+def _inside(rings, x, y):
+    # Even-odd ray casting over every ring, so holes and multi-part regions both work
+    inside = np.zeros(len(x), dtype=bool)
+    for ring in rings:
+        x1, y1 = ring[:-1, 0], ring[:-1, 1]
+        x2, y2 = ring[1:, 0], ring[1:, 1]
+        for ax, ay, bx, by in zip(x1, y1, x2, y2):
+            if ay == by:
+                continue
+            crosses = (ay > y) != (by > y)
+            inside ^= crosses & (x < (bx - ax) * (y - ay) / (by - ay) + ax)
+    return inside
+
+
+def _simplify(ring, tolerance):
+    # Iterative Douglas-Peucker; keeps the first and last point of the (closed) ring
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = ring[first], ring[last]
+        segment = end - start
+        points = ring[first + 1:last] - start
+        norm = np.hypot(*segment)
+        if norm == 0:
+            distances = np.hypot(points[:, 0], points[:, 1])
+        else:
+            distances = np.abs(segment[0] * points[:, 1] - segment[1] * points[:, 0]) / norm
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.extend([(first, split), (split, last)])
+    return ring[keep]
+
+
+def _signed_area(ring):
+    return 0.5 * np.sum(ring[:-1, 0] * ring[1:, 1] - ring[1:, 0] * ring[:-1, 1])
+
+
+class RegionIndex:
+    """Point-in-polygon lookup for shapefile regions with a uniform grid in front of it.
+
+    Each region marks the grid cells its bounding box overlaps, so a point is only ray-cast
+    against regions that cover its cell and whose bounding box also contains it.
+    """
+
+    def __init__(self, shapes, names, grid_cells=GRID_CELLS):
+        self.shapes = shapes
+        self.names = [name.title() for name in names]
+        self.grid_cells = grid_cells
+        points = np.concatenate([ring for rings in shapes for ring in rings])
+        self.lower = points.min(axis=0)
+        self.cell_size = (points.max(axis=0) - self.lower) / grid_cells
+        self.boxes = []
+        self.cells = []
+        for rings in shapes:
+            if not rings:
+                self.boxes.append(None)
+                self.cells.append(None)
+                continue
+            shape_points = np.concatenate(rings)
+            low, high = shape_points.min(axis=0), shape_points.max(axis=0)
+            (col0, row0), (col1, row1) = self._cell(low), self._cell(high)
+            cells = np.zeros((grid_cells, grid_cells), dtype=bool)
+            cells[col0:col1 + 1, row0:row1 + 1] = True
+            self.boxes.append((low, high))
+            self.cells.append(cells)
+
+    @classmethod
+    def from_shapefile(cls, path=STATES_PATH, field=STATE_FIELD):
+        """Load regions from ``path`` and its sibling ``.dbf``, named by ``field``."""
+        return cls(read_polygons(path), read_dbf_column(path[:-4] + '.dbf', field))
+
+    def _cell(self, points):
+        cells = np.floor((np.asarray(points) - self.lower) / self.cell_size).astype(np.int64)
+        return tuple(np.clip(cells, 0, self.grid_cells - 1).T)
+
+    def assign(self, longitude, latitude):
+        """Region name for every point as a categorical; points outside every region are ``Unknown``."""
+        coordinates = np.column_stack([
+            pd.to_numeric(pd.Series(longitude), errors='coerce').to_numpy(dtype=float),
+            pd.to_numeric(pd.Series(latitude), errors='coerce').to_numpy(dtype=float),
+        ])
+        valid = ~np.isnan(coordinates).any(axis=1)
+        # Tweets are usually geocoded to a handful of city centres; test each distinct point once
+        unique, inverse = np.unique(coordinates[valid], axis=0, return_inverse=True)
+        codes = np.full(len(unique), len(self.names), dtype=np.int64)
+        columns, rows = self._cell(unique) if len(unique) else (np.zeros(0, int), np.zeros(0, int))
+        x, y = unique[:, 0], unique[:, 1]
+        for code, (rings, box, cells) in enumerate(zip(self.shapes, self.boxes, self.cells)):
+            if box is None:
+                continue
+            low, high = box
+            candidates = np.flatnonzero(
+                (codes == len(self.names)) & cells[columns, rows]
+                & (x >= low[0]) & (x <= high[0]) & (y >= low[1]) & (y <= high[1])
+            )
+            if len(candidates):
+                codes[candidates[_inside(rings, x[candidates], y[candidates])]] = code
+
+        categories = self.names + [UNKNOWN_REGION]
+        all_codes = np.full(len(coordinates), len(self.names), dtype=np.int64)
+        all_codes[valid] = codes[inverse.ravel()]
+        return pd.Categorical.from_codes(all_codes, categories=categories)
+
+    def to_geojson(self, tolerance=SIMPLIFY_TOLERANCE):
+        """Simplified outlines as a GeoJSON FeatureCollection keyed by ``properties.name``."""
+        features = []
+        for name, rings in zip(self.names, self.shapes):
+            polygons = []
+            for ring in rings:
+                simplified = _simplify(ring, tolerance)
+                if len(simplified) < 4:
+                    continue
+                coordinates = np.round(simplified, 4).tolist()
+                # Shapefiles wind outer rings clockwise and holes counter-clockwise
+                if _signed_area(ring) < 0 or not polygons:
+                    polygons.append([coordinates])
+                else:
+                    polygons[-1].append(coordinates)
+            if polygons:
+                features.append({
+                    'type': 'Feature',
+                    'properties': {'name': name},
+                    'geometry': {'type': 'MultiPolygon', 'coordinates': polygons},
+                })
+        return {'type': 'FeatureCollection', 'features': features}
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from dashboard_data import utc_days
+
+HASHTAG_PATTERN = r'#\w+'
+
+
+class HashtagIndex:
+    """Hashtags extracted once per dataset as (row, hashtag id) pairs over an interned vocabulary.
+
+    ``row_ids`` and ``tag_ids`` are parallel arrays sorted by row, and ``vocabulary[tag_id]``
+    is the lowercased hashtag. Counting hashtags for any filtered subset is a bincount over
+    the pairs whose row is selected, so no tweet text is scanned after the index is built.
+    """
+
+    def __init__(self, texts):
+        self.size = len(texts)
+        matches = pd.Series(np.asarray(texts, dtype=object)).str.findall(HASHTAG_PATTERN)
+        found = matches.explode().dropna().astype(str)
+        codes, vocabulary = pd.factorize(found.str.lower())
+        self.row_ids = found.index.to_numpy(dtype=np.int64)
+        self.tag_ids = codes.astype(np.int32)
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self._ids = {tag: tag_id for tag_id, tag in enumerate(self.vocabulary)}
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def _entries(self, rows):
+        # Boolean positions into row_ids/tag_ids for the selected rows; None keeps every entry
+        if rows is None or len(rows) == self.size:
+            return slice(None)
+        selected = np.zeros(self.size, dtype=bool)
+        selected[rows] = True
+        return selected[self.row_ids]
+
+    def counts(self, rows=None):
+        """Occurrences of every vocabulary hashtag within ``rows`` (all rows when ``None``)."""
+        return np.bincount(self.tag_ids[self._entries(rows)], minlength=len(self.vocabulary))
+
+    def top(self, rows=None, n=15):
+        """The ``n`` most used hashtags in ``rows`` as ``{hashtag: count}``, like ``Counter.most_common``."""
+        tag_ids = self.tag_ids[self._entries(rows)]
+        if not len(tag_ids):
+            return {}
+        present, first_seen, counts = np.unique(tag_ids, return_index=True, return_counts=True)
+        # Ties keep the order in which hashtags first appear in the subset, as Counter does
+        order = np.lexsort((first_seen, -counts))[:n]
+        return {self.vocabulary[present[i]]: int(counts[i]) for i in order}
+
+    def tag_ids_for(self, tags):
+        """Vocabulary ids of ``tags``; unknown hashtags are ignored."""
+        return np.array([self._ids[tag.lower()] for tag in tags if tag.lower() in self._ids], dtype=np.int32)
+
+    def rows_with(self, tags, rows=None):
+        """Sorted row positions of tweets using any of ``tags``, optionally limited to ``rows``."""
+        entries = self._entries(rows)
+        matches = np.isin(self.tag_ids[entries], self.tag_ids_for(tags))
+        return np.unique(self.row_ids[entries][matches])
+
+    def trend(self, dates, tags, rows=None):
+        """Daily usage of ``tags`` as a frame with one row per UTC day and one column per hashtag."""
+        entries = self._entries(rows)
+        row_ids = self.row_ids[entries]
+        tag_ids = self.tag_ids[entries]
+        wanted = self.tag_ids_for(tags)
+        matches = np.isin(tag_ids, wanted)
+        days = utc_days(pd.Series(dates).iloc[row_ids[matches]].reset_index(drop=True))
+        usage = pd.DataFrame({'date': days, 'hashtag': self.vocabulary[tag_ids[matches]]})
+        trend = usage.groupby(['date', 'hashtag']).size().unstack(fill_value=0)
+        return trend.reindex(columns=self.vocabulary[wanted], fill_value=0)
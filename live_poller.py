@@ -0,0 +1,185 @@
+import argparse
+import threading
+import time
+
+from live_scorer import DEFAULT_CONFIDENCE_THRESHOLD, DEFAULT_LATENCY_BUDGET, TieredScorer
+from live_store import ID_COLUMN, LiveStore
+from xquik_client import XquikClient, XquikConfigError, XquikError, numeric_id, post_id
+from xquik_source import xquik_posts_to_dataframe
+
+DEFAULT_INTERVAL = 60
+DEFAULT_LIMIT = 200
+
+
+class LivePoller:
+    """Fetch only posts newer than each query's watermark and append them to a ``LiveStore``.
+
+    The first poll of a query takes its ``limit`` most recent posts; later polls pass the
+    newest id seen as ``since_id``, so downloads and model scoring grow with new posts only.
+    New posts are labelled by ``scorer``, a ``TieredScorer`` over ``cache`` and ``scoring_url``
+    unless one is given.
+    """
+
+    def __init__(self, client, store, queries=(), limit=DEFAULT_LIMIT, cache=None, scoring_url=None,
+                 interval=DEFAULT_INTERVAL, scorer=None):
+        self.client = client
+        self.store = store
+        self.scorer = scorer or TieredScorer(cache, scoring_url)
+        self.interval = interval
+        self.last_error = None
+        self.last_poll = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.configure(queries, limit)
+
+    def configure(self, queries, limit=DEFAULT_LIMIT):
+        self.queries = _clean(queries)
+        self.limit = max(int(limit), 1)
+
+    def poll_once(self, queries=None, limit=None):
+        """Fetch, score and store the posts added since the last poll; returns how many were stored.
+
+        ``queries`` and ``limit`` poll other searches once without changing the configured ones.
+        """
+        queries = self.queries if queries is None else _clean(queries)
+        limit = self.limit if limit is None else max(int(limit), 1)
+        with self._lock:
+            watermarks = self.store.watermarks()
+            since_ids = {
+                query: watermarks[query]["since_id"]
+                for query in queries
+                if watermarks.get(query, {}).get("since_id") is not None
+            }
+            results = {
+                query: [post for post in posts if isinstance(post, dict)]
+                for query, posts in self.client.search_each(queries, limit, since_ids).items()
+            }
+            posts = [post for query_posts in results.values() for post in query_posts]
+            data = xquik_posts_to_dataframe(posts)
+            data[ID_COLUMN] = [_id_text(post_id(post)) for post in posts]
+
+            polled_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            updates = {}
+            offset = 0
+            for query, query_posts in results.items():
+                mark = dict(watermarks.get(query, {}), polled_at=polled_at)
+                ids = [value for value in map(numeric_id, query_posts) if value is not None]
+                if ids and max(ids) > int(mark.get("since_id") or 0):
+                    mark["since_id"] = str(max(ids))
+                if query_posts:
+                    newest = data["date"].iloc[offset:offset + len(query_posts)].max().isoformat()
+                    mark["newest"] = max(mark.get("newest") or "", newest)
+                offset += len(query_posts)
+                updates[query] = mark
+
+            stored = 0
+            if not data.empty:
+                # One type per column, as the columnar part files require
+                data["tweet_location"] = data["tweet_location"].astype(str)
+                data = data.drop_duplicates(ID_COLUMN)
+                # Only posts the store has not seen are scored
+                data = data[self.store.is_new(data[ID_COLUMN])].reset_index(drop=True)
+                stored = self.store.append(self.scorer.score(data))
+
+            # Advance the watermarks only once the posts they cover are on disk
+            self.store.update_watermarks(updates)
+            self.last_poll = polled_at
+            return stored
+
+    def start(self, interval=None):
+        """Poll every ``interval`` seconds on a daemon thread until ``stop``."""
+        if interval is not None:
+            self.interval = interval
+        if self.running:
+            if not self._stop.is_set():
+                return
+            # A stop without waiting is still winding down; let it finish before restarting
+            self._thread.join()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="live-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        """Stop polling; with ``wait=False`` return without waiting for a poll in progress."""
+        self._stop.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def stopping(self):
+        return self._stop.is_set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            wait = self.interval
+            try:
+                if self.queries:
+                    self.poll_once()
+                self.last_error = None
+            except XquikError as error:
+                # Keep polling; the next window resumes from the same watermarks
+                self.last_error = error
+                wait = max(wait, error.retry_after or 0)
+            self._stop.wait(wait)
+
+
+def _clean(queries):
+    return list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+
+
+def _id_text(key):
+    return key if isinstance(key, str) else "|".join(key)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll X searches into the local live post store.")
+    parser.add_argument("queries", nargs="+", help="Search queries, one per argument")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Posts per query on the first poll")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between polls")
+    parser.add_argument("--once", action="store_true", help="Poll once and exit")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_CONFIDENCE_THRESHOLD,
+                        help="Keyword confidence below which a post is escalated to the model")
+    parser.add_argument("--latency-budget", type=float, default=DEFAULT_LATENCY_BUDGET,
+                        help="Seconds per poll spent escalating posts to the model")
+    args = parser.parse_args(argv)
+
+    from sentiment_analyzer import MODEL_NAME
+    from sentiment_cache import DEFAULT_CACHE_PATH, SentimentCache
+
+    client = XquikClient()
+    if not client.api_key:
+        parser.error("set XQUIK_API_KEY")
+    scorer = TieredScorer(SentimentCache(DEFAULT_CACHE_PATH, model_name=MODEL_NAME), threshold=args.threshold,
+                          latency_budget=args.latency_budget)
+    poller = LivePoller(client, LiveStore(), args.queries, args.limit, scorer=scorer)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                stored = poller.poll_once()
+                print(f"Stored {stored:,} new posts in {time.perf_counter() - started:.1f}s")
+                report = scorer.last_report
+                if report and report["posts"]:
+                    print(f"  escalated {report['escalated']:,} of {report['posts']:,}: {report['cache']:,} cached, "
+                          f"{report['model']:,} scored, {report['unresolved']:,} kept keyword labels")
+            except XquikConfigError as error:
+                parser.exit(1, f"{error}\n")
+            except XquikError as error:
+                print(f"Poll failed ({type(error).__name__}): {error}")
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
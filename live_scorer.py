@@ -0,0 +1,88 @@
+import time
+
+import numpy as np
+
+from preprocess import preprocess_tweets
+from scoring_server import request_scores
+from sentiment_analyzer import LABELS
+
+# Lexicon labels at or above this confidence are kept; 0.75 means two more hits of one polarity
+DEFAULT_CONFIDENCE_THRESHOLD = 0.7
+DEFAULT_BATCH_SIZE = 128
+DEFAULT_LATENCY_BUDGET = 5.0
+
+
+class TieredScorer:
+    """Keep confident lexicon labels and escalate only the rest to model results.
+
+    Posts arrive labelled by ``tweet_matcher``. Those below ``threshold`` confidence are
+    looked up in the ``SentimentCache`` of earlier model results, and the remaining misses
+    go to the warm scoring server in batches of ``batch_size``. Escalation for one call
+    stops once ``latency_budget`` seconds have passed; posts it did not reach keep their
+    lexicon label. Running totals report how many posts each tier settled.
+    """
+
+    def __init__(self, cache=None, scoring_url=None, threshold=DEFAULT_CONFIDENCE_THRESHOLD,
+                 batch_size=DEFAULT_BATCH_SIZE, latency_budget=DEFAULT_LATENCY_BUDGET, clock=time.perf_counter):
+        self.cache = cache
+        self.scoring_url = scoring_url
+        self.threshold = threshold
+        self.batch_size = max(int(batch_size), 1)
+        self.latency_budget = latency_budget
+        self.clock = clock
+        self.totals = dict.fromkeys(("posts", "escalated", "cache", "model", "unresolved"), 0)
+        self.last_report = None
+
+    @property
+    def escalated_fraction(self):
+        """Share of every post scored so far that fell below the lexicon threshold."""
+        return self.totals["escalated"] / self.totals["posts"] if self.totals["posts"] else 0.0
+
+    def score(self, data):
+        """Overwrite low-confidence lexicon labels in ``data`` with model labels; returns ``data``."""
+        started = self.clock()
+        report = dict.fromkeys(self.totals, 0)
+        if data is None or data.empty:
+            self.last_report = dict(report, seconds=0.0)
+            return data
+
+        confidence = data["Sentiment_Confidence"].to_numpy(dtype=float)
+        escalated = np.flatnonzero(confidence < self.threshold)
+        report["posts"] = len(data)
+        report["escalated"] = len(escalated)
+
+        texts = preprocess_tweets(data["tweet_content"].iloc[escalated])
+        pending = list(range(len(escalated)))
+        if pending and self.cache is not None:
+            cached = self.cache.get_many(texts)
+            hits = [i for i in pending if cached[i] is not None]
+            if hits:
+                set_model_sentiment(data, escalated[hits], np.vstack([cached[i] for i in hits]))
+            pending = [i for i in pending if cached[i] is None]
+            report["cache"] = len(hits)
+
+        deadline = started + self.latency_budget
+        for start in range(0, len(pending), self.batch_size):
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                break
+            batch = pending[start:start + self.batch_size]
+            scores = request_scores([texts[i] for i in batch], self.scoring_url, timeout=remaining)
+            if scores is None or len(scores) != len(batch):
+                # No server, or it timed out; later batches would fare no better this call
+                break
+            set_model_sentiment(data, escalated[batch], scores)
+            report["model"] += len(batch)
+
+        report["unresolved"] = report["escalated"] - report["cache"] - report["model"]
+        for key in self.totals:
+            self.totals[key] += report[key]
+        self.last_report = dict(report, seconds=self.clock() - started)
+        return data
+
+
+def set_model_sentiment(data, positions, scores):
+    """Label the rows at ``positions`` with the argmax and confidence of (n, 3) model ``scores``."""
+    rows = data.index[positions]
+    data.loc[rows, "Predicted_Sentiment"] = [LABELS[index] for index in scores.argmax(axis=1)]
+    data.loc[rows, "Sentiment_Confidence"] = scores.max(axis=1).astype(float)
@@ -0,0 +1,186 @@
+import json
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+LIVE_STORE_DIR = os.path.join("cache", "live_x")
+WATERMARKS_FILE = "watermarks.json"
+LOCK_FILE = "watermarks.lock"
+ID_COLUMN = "post_id"
+PART_PATTERN = re.compile(r"part-(\d{6})\.(feather|pkl)$")
+
+
+def _feather_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        # pyarrow is not installed; parts are written as pickles instead
+        return False
+    return True
+
+
+class LiveStore:
+    """Append-only local store of live X posts with a per-query polling watermark.
+
+    Every append writes one immutable part file (Feather when pyarrow is installed), so
+    readers only ever need the parts added since they last looked. Post ids already in
+    the store are dropped on append, and watermarks are merged under a file lock. Several
+    processes may append to one directory: part numbers are claimed with exclusive
+    creation, and each append first reads the ids of parts other writers have added.
+    """
+
+    def __init__(self, directory=LIVE_STORE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._known_ids = set()
+        self._parts_seen = set()
+
+    def parts(self):
+        """Part file paths, oldest first."""
+        names = sorted(name for name in os.listdir(self.directory) if PART_PATTERN.match(name))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def read(self, start=0):
+        """Rows of every part from index ``start`` on, and the part count to resume from."""
+        parts = self.parts()
+        frames = [_read_part(path) for path in parts[start:]]
+        data = pd.concat(frames, ignore_index=True) if frames else None
+        return data, len(parts)
+
+    def is_new(self, ids):
+        """Boolean mask of the ``ids`` not yet in the store."""
+        with self._lock:
+            return ~pd.Series(ids).isin(self._ids()).to_numpy()
+
+    def append(self, data):
+        """Write the rows whose ``post_id`` is new as one part; returns how many were written."""
+        with self._lock:
+            known = self._ids()
+            data = data[~data[ID_COLUMN].isin(known)].drop_duplicates(ID_COLUMN)
+            if data.empty:
+                return 0
+
+            path = _write_part(data.reset_index(drop=True), self.directory)
+            self._parts_seen.add(path)
+            known.update(data[ID_COLUMN])
+            return len(data)
+
+    def watermarks(self):
+        """``{query: {"since_id": ..., "newest": ..., "polled_at": ...}}`` for every polled query."""
+        try:
+            with open(os.path.join(self.directory, WATERMARKS_FILE), encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def update_watermarks(self, updates):
+        """Merge ``updates`` into the stored watermarks; a query's watermark never moves backwards."""
+        with self._lock, _file_lock(os.path.join(self.directory, LOCK_FILE)):
+            watermarks = self.watermarks()
+            for query, mark in updates.items():
+                watermarks[query] = _merge_watermark(watermarks.get(query, {}), mark)
+            handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(handle, "w", encoding="utf-8") as handle:
+                json.dump(watermarks, handle, indent=2, sort_keys=True)
+            os.replace(temporary, os.path.join(self.directory, WATERMARKS_FILE))
+
+    def _ids(self):
+        # Pick up parts written since the last call, including those of other processes
+        for path in self.parts():
+            if path not in self._parts_seen:
+                self._known_ids.update(_read_part(path, columns=[ID_COLUMN])[ID_COLUMN])
+                self._parts_seen.add(path)
+        return self._known_ids
+
+
+class LiveStoreReader:
+    """The store's rows in one frame, extended with only the parts written since the last refresh."""
+
+    def __init__(self, store):
+        self.store = store
+        self.data = None
+        self.parts_read = 0
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        # Parts are immutable, so the part count identifies the frame
+        return f"live:{self.store.directory}:{self.parts_read}"
+
+    def refresh(self):
+        with self._lock:
+            new_rows, self.parts_read = self.store.read(self.parts_read)
+            if new_rows is not None:
+                # Writers racing on one post may both store it; keep the first copy
+                new_rows = new_rows[~new_rows[ID_COLUMN].isin(self._ids)].drop_duplicates(ID_COLUMN)
+                self._ids.update(new_rows[ID_COLUMN])
+                frames = [self.data, new_rows] if self.data is not None else [new_rows]
+                self.data = pd.concat(frames, ignore_index=True)
+            return self.data
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive OS lock on ``path`` so other processes wait for the block to finish."""
+    try:
+        import fcntl
+    except ImportError:
+        # No fcntl (Windows); the per-query merge still keeps watermarks from moving backwards
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _merge_watermark(stored, update):
+    merged = dict(stored, **update)
+    ids = [int(mark["since_id"]) for mark in (stored, update) if mark.get("since_id") is not None]
+    if ids:
+        merged["since_id"] = str(max(ids))
+    for key in ("newest", "polled_at"):
+        values = [mark[key] for mark in (stored, update) if mark.get(key)]
+        if values:
+            merged[key] = max(values)
+    return merged
+
+
+def _write_part(data, directory):
+    """Write ``data`` as the next free part number and return its path."""
+    extension = "feather" if _feather_available() else "pkl"
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(handle)
+    try:
+        if extension == "feather":
+            data.to_feather(temporary, compression="lz4")
+        else:
+            data.to_pickle(temporary, compression=None)
+        parts = sorted(name for name in os.listdir(directory) if PART_PATTERN.match(name))
+        number = int(PART_PATTERN.match(parts[-1]).group(1)) + 1 if parts else 0
+        while True:
+            path = os.path.join(directory, f"part-{number:06d}.{extension}")
+            try:
+                # Linking fails instead of overwriting when another writer took the number,
+                # and readers never see a half-written part
+                os.link(temporary, path)
+                return path
+            except FileExistsError:
+                number += 1
+    finally:
+        os.remove(temporary)
+
+
+def _read_part(path, columns=None):
+    if path.endswith(".feather"):
+        return pd.read_feather(path, columns=columns)
+    data = pd.read_pickle(path)
+    return data[columns] if columns else data
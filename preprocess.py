@@ -0,0 +1,26 @@
+import re
+
+# A "word" is whatever str.split(' ') yields, so only a literal space starts a new one. The
+# patterns begin with the literal so the regex engine can skip ahead to candidates, then use a
+# lookbehind to reject matches that do not start a word.
+_HANDLE_PATTERN = re.compile(r"@(?<![^ ]@)[^ ]+")
+_LINK_PATTERN = re.compile(r"http(?<![^ ]http)[^ ]*")
+
+
+def preprocess_tweet(tweet):
+    """Mask user handles and links the way the RoBERTa Twitter model expects."""
+    return _LINK_PATTERN.sub("http", _HANDLE_PATTERN.sub("@user", tweet))
+
+
+def preprocess_tweets(tweets):
+    """Mask handles and links in every tweet of an iterable; returns a list of strings."""
+    handle_sub = _HANDLE_PATTERN.sub
+    link_sub = _LINK_PATTERN.sub
+    return [link_sub("http", handle_sub("@user", str(tweet))) for tweet in tweets]
+
+
+def preprocess_series(tweets):
+    """Mask handles and links across a pandas string column."""
+    return tweets.astype(str).str.replace(_HANDLE_PATTERN, "@user", regex=True).str.replace(
+        _LINK_PATTERN, "http", regex=True
+    )
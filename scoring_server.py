@@ -0,0 +1,213 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+from sentiment_analyzer import BACKENDS, DEFAULT_BATCH_SIZE, LABELS, MODEL_NAME
+from sentiment_cache import DEFAULT_CACHE_PATH
+
+SERVER_URL_ENV = "SENTIMENT_SERVER_URL"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """Merge concurrent scoring requests into one call to ``score_batch``.
+
+    The first queued request opens a batch; requests arriving within ``max_wait_ms``
+    join it until ``max_batch_size`` texts are collected.
+    """
+
+    def __init__(self, score_batch, max_batch_size=64, max_wait_ms=5):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches_run = 0
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts):
+        """Block until ``texts`` are scored and return their (n, 3) probabilities."""
+        future = Future()
+        self._requests.put((list(texts), future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            pending = [self._requests.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                size += len(request[0])
+            self._score(pending)
+
+    def _score(self, pending):
+        texts = [text for request_texts, _ in pending for text in request_texts]
+        try:
+            probabilities = np.asarray(self.score_batch(texts), dtype=np.float32)
+        except Exception as error:
+            for _, future in pending:
+                future.set_exception(error)
+            return
+
+        self.batches_run += 1
+        offset = 0
+        for request_texts, future in pending:
+            future.set_result(probabilities[offset:offset + len(request_texts)])
+            offset += len(request_texts)
+
+
+def _result(scores):
+    index = int(np.argmax(scores))
+    return {
+        "label": LABELS[index],
+        "confidence": float(scores[index]),
+        "probabilities": {label: float(score) for label, score in zip(LABELS, scores)},
+    }
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    """JSON endpoints: ``GET /health``, ``POST /score`` and ``POST /score_batch``.
+
+    Connections are kept alive between requests. Replies go out without Nagle's delay, and
+    a connection idle for ``timeout`` seconds is closed so it does not hold a thread.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    timeout = 30
+    batcher = None
+    model_name = MODEL_NAME
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "model": self.model_name, "batches_run": self.batcher.batches_run})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"error": "request body must be JSON"})
+            return
+
+        try:
+            if self.path == "/score" and isinstance(body.get("text"), str):
+                self._send(200, _result(self.batcher.submit([body["text"]])[0]))
+            elif self.path == "/score_batch" and isinstance(body.get("texts"), list):
+                probabilities = self.batcher.submit([str(text) for text in body["texts"]])
+                self._send(200, {"results": [_result(scores) for scores in probabilities]})
+            else:
+                self._send(400, {"error": "expected {'text': str} on /score or {'texts': [str]} on /score_batch"})
+        except Exception as error:
+            # Answer instead of dropping the connection, so clients see why scoring failed
+            logger.exception("scoring %s failed", self.path)
+            self._send(500, {"error": f"scoring failed: {error}"})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(score_batch, host=DEFAULT_HOST, port=DEFAULT_PORT, max_batch_size=64, max_wait_ms=5,
+                model_name=MODEL_NAME):
+    """Build a threaded HTTP server whose handlers share one micro-batcher around ``score_batch``."""
+    handler = type(
+        "BoundScoringHandler",
+        (ScoringHandler,),
+        {"batcher": MicroBatcher(score_batch, max_batch_size, max_wait_ms), "model_name": model_name},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def request_scores(texts, url=None, timeout=5):
+    """Score ``texts`` on a running server; returns (n, 3) probabilities or ``None`` if unavailable."""
+    url = url or os.environ.get(SERVER_URL_ENV)
+    if not url or not texts:
+        return None
+
+    request = Request(
+        f"{url.rstrip('/')}/score_batch",
+        data=json.dumps({"texts": list(texts)}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            results = json.loads(response.read().decode("utf-8"))["results"]
+    except (URLError, OSError, TimeoutError, ValueError, KeyError):
+        return None
+
+    return np.array(
+        [[result["probabilities"][label] for label in LABELS] for result in results], dtype=np.float32
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve warm RoBERTa sentiment scoring over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--model", default=MODEL_NAME, help="Hugging Face model name or local path")
+    parser.add_argument("--backend", choices=BACKENDS, default="torch", help="Inference backend")
+    parser.add_argument("--onnx-path", default=None, help="Graph written by export_onnx.py")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Tweets per forward pass")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Texts merged into one micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=5, help="How long a micro-batch waits to fill")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="SQLite sentiment cache")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or fill the sentiment cache")
+    args = parser.parse_args(argv)
+
+    from sentiment_analyzer import SentimentAnalyzer
+
+    # Load the model once; every request afterwards only pays for inference
+    analyzer = SentimentAnalyzer(
+        args.model,
+        batch_size=args.batch_size,
+        cache_path=None if args.no_cache else args.cache_path,
+        backend=args.backend,
+        onnx_path=args.onnx_path,
+    )
+    server = make_server(
+        analyzer.predict_proba, args.host, args.port, args.max_batch_size, args.max_wait_ms, args.model
+    )
+    print(f"Scoring server listening on http://{args.host}:{server.server_address[1]} ({args.backend})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = r"\w+"
+_QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+_find_tokens = re.compile(TOKEN_PATTERN).findall
+_ROW_BREAK = "ROWBREAK"
+# BM25 term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text):
+    """Lowercased word tokens, split the same way the index splits tweets."""
+    return _find_tokens(str(text).lower())
+
+
+def parse_query(query):
+    """Split a query into AND-ed clauses of tokens.
+
+    ``"baggage lost"`` in quotes is a phrase; unquoted words are separate terms that must
+    all appear. A literal ``AND`` between words is accepted and ignored.
+    """
+    clauses = []
+    for phrase, word in _QUERY_PATTERN.findall(query):
+        if word == "AND":
+            continue
+        tokens = tokenize(phrase or word)
+        if tokens:
+            clauses.append(tuple(tokens))
+    return clauses
+
+
+class SearchIndex:
+    """Positional inverted index over tweet text.
+
+    Postings for token ``t`` are ``rows[offsets[t]:offsets[t + 1]]`` and the matching
+    ``positions``, sorted by row and then position. Terms are looked up without scanning any
+    text; phrases are matched by checking that each token follows the previous one.
+    """
+
+    def __init__(self, texts, chunk_size=100_000):
+        values = np.asarray(texts, dtype=object)
+        self.size = len(values)
+        self._ids = {}
+        row_parts, code_parts = [], []
+        for start in range(0, self.size, chunk_size):
+            rows, codes = self._tokenize_chunk(values[start:start + chunk_size])
+            row_parts.append(rows + start)
+            code_parts.append(codes)
+        rows = np.concatenate(row_parts) if row_parts else np.zeros(0, dtype=np.int64)
+        codes = np.concatenate(code_parts) if code_parts else np.zeros(0, dtype=np.int64)
+        # Tokens come out in row order, so a token's position is its distance from the row's first token
+        positions = np.arange(len(rows)) - np.searchsorted(rows, rows, side='left')
+
+        order = np.argsort(codes, kind='stable')
+        self.rows = rows[order].astype(np.int32)
+        self.positions = positions[order].astype(np.int32)
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(self._ids)))])
+        self.doc_lengths = np.bincount(rows, minlength=self.size).astype(np.int32)
+        self.avg_length = float(self.doc_lengths.mean()) if self.size else 0.0
+
+    def _tokenize_chunk(self, values):
+        # One regex pass over the whole chunk instead of one per tweet. The separator is upper
+        # case, which never survives lower(), so it cannot be confused with a real token.
+        text = f" {_ROW_BREAK} ".join(value.lower() if isinstance(value, str) else "" for value in values)
+        codes, vocabulary = pd.factorize(np.array(_find_tokens(text), dtype=object))
+        breaks = vocabulary == _ROW_BREAK
+        is_break = breaks[codes]
+        rows = np.cumsum(is_break)[~is_break]
+        # Map this chunk's vocabulary onto the index-wide token ids
+        global_ids = np.array(
+            [-1 if token == _ROW_BREAK else self._ids.setdefault(token, len(self._ids)) for token in vocabulary],
+            dtype=np.int64,
+        )
+        return rows, global_ids[codes[~is_break]]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _postings(self, token):
+        token_id = self._ids.get(token)
+        if token_id is None:
+            return self.rows[:0], self.positions[:0]
+        start, end = self.offsets[token_id], self.offsets[token_id + 1]
+        return self.rows[start:end], self.positions[start:end]
+
+    def _occurrences(self, clause):
+        # Anchor on the rarest token so the phrase check walks the shortest postings list
+        postings = [self._postings(token) for token in clause]
+        anchor = min(range(len(clause)), key=lambda i: len(postings[i][0]))
+        rows, positions = postings[anchor]
+        keys = rows.astype(np.int64) << 32 | positions
+        for i, (other_rows, other_positions) in enumerate(postings):
+            if i == anchor or not len(keys):
+                continue
+            # Postings are sorted by (row, position), so their keys are sorted and binary-searchable
+            other_keys = other_rows.astype(np.int64) << 32 | other_positions
+            wanted = keys + (i - anchor)
+            found = np.searchsorted(other_keys, wanted)
+            keys = keys[(found < len(other_keys)) & (other_keys[np.minimum(found, len(other_keys) - 1)] == wanted)]
+        return keys >> 32
+
+    def search(self, query, rows=None):
+        """Rows matching every clause of ``query``, best BM25 score first.
+
+        ``rows`` limits the result to an existing selection, such as the sidebar filters.
+        Returns ``(rows, scores)`` arrays in rank order; ties keep row order.
+        """
+        clauses = parse_query(query)
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+        if not clauses:
+            return empty
+
+        allowed = None
+        if rows is not None:
+            allowed = np.zeros(self.size, dtype=bool)
+            allowed[rows] = True
+
+        matched = scores = None
+        for clause in clauses:
+            hit_rows, frequencies = np.unique(self._occurrences(clause), return_counts=True)
+            # Rarity is measured over the whole dataset so scores do not depend on the filters
+            idf = np.log1p((self.size - len(hit_rows) + 0.5) / (len(hit_rows) + 0.5))
+            if allowed is not None:
+                keep = allowed[hit_rows]
+                hit_rows, frequencies = hit_rows[keep], frequencies[keep]
+            norm = K1 * (1 - B + B * self.doc_lengths[hit_rows] / (self.avg_length or 1))
+            clause_scores = idf * frequencies * (K1 + 1) / (frequencies + norm)
+
+            if matched is None:
+                matched, scores = hit_rows, clause_scores
+            else:
+                matched, left, right = np.intersect1d(matched, hit_rows, assume_unique=True, return_indices=True)
+                scores = scores[left] + clause_scores[right]
+            if not len(matched):
+                return empty
+
+        ranking = np.lexsort((matched, -scores))
+        return matched[ranking], scores[ranking]
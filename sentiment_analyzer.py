@@ -0,0 +1,185 @@
+import os
+
+import numpy as np
+
+from preprocess import preprocess_tweet, preprocess_tweets
+
+MODEL_NAME = "cardiffnlp/twitter-roberta-base-sentiment"
+LABELS = ["Negative", "Neutral", "Positive"]
+PROBABILITY_COLUMNS = [f"Prob_{label}" for label in LABELS]
+DEFAULT_BATCH_SIZE = 32
+MAX_LENGTH = 512
+BACKENDS = ("torch", "quantized", "onnx")
+
+
+def length_sorted_batches(lengths, batch_size):
+    """Yield index arrays that group texts of similar token length together."""
+    batch_size = max(int(batch_size), 1)
+    order = np.argsort(np.asarray(lengths), kind="stable")
+    for start in range(0, len(order), batch_size):
+        yield order[start:start + batch_size]
+
+
+def sentiment_columns(probabilities):
+    """Turn an (n, 3) probability array into the label, per-class and confidence output columns."""
+    probabilities = np.asarray(probabilities, dtype=np.float32).reshape(-1, len(LABELS))
+    columns = {"Predicted_Sentiment": np.asarray(LABELS, dtype=object)[probabilities.argmax(axis=1)]}
+    for index, name in enumerate(PROBABILITY_COLUMNS):
+        columns[name] = probabilities[:, index]
+    columns["Sentiment_Confidence"] = probabilities.max(axis=1)
+    return columns
+
+
+def softmax(logits):
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return (shifted / shifted.sum(axis=-1, keepdims=True)).astype(np.float32)
+
+
+def default_onnx_path(model_name=MODEL_NAME, quantized=False):
+    """Where ``export_onnx.py`` writes the exported graph for ``model_name``."""
+    suffix = "-int8" if quantized else ""
+    return os.path.join("models", f"{model_name.rstrip('/').split('/')[-1]}{suffix}.onnx")
+
+
+def backend_version(backend, onnx_path=None, torch_version=None):
+    """Suffix for the cache's model version naming the backend and the weights it actually runs.
+
+    ONNX graphs are identified by file name, size and modification time, so the fp32 and
+    ``-int8`` exports (or a re-export) never share cache entries. Dynamic quantization is
+    identified by its scheme and the torch version that performs it.
+    """
+    if backend == "onnx":
+        stat = os.stat(onnx_path)
+        return f"+onnx:{os.path.basename(onnx_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    if backend == "quantized":
+        return f"+quantized:qint8-linear:torch-{torch_version}"
+    return ""
+
+
+class SentimentAnalyzer:
+    """Score tweets with the RoBERTa sentiment model in padded batches.
+
+    ``backend`` selects how the forward pass runs: ``"torch"`` (full precision),
+    ``"quantized"`` (int8 dynamic quantization of the linear layers) or ``"onnx"``
+    (an exported graph from ``export_onnx.py`` run with ONNX Runtime).
+    """
+
+    def __init__(self, model_name=MODEL_NAME, batch_size=DEFAULT_BATCH_SIZE, max_length=MAX_LENGTH,
+                 local_files_only=False, cache_path=None, backend="torch", onnx_path=None, num_threads=None):
+        from transformers import AutoConfig, AutoTokenizer
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.labels = LABELS
+        self.backend = backend
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=local_files_only)
+        config = AutoConfig.from_pretrained(model_name, local_files_only=local_files_only)
+
+        torch_version = None
+        if backend == "onnx":
+            import onnxruntime
+
+            onnx_path = onnx_path or default_onnx_path(model_name)
+            options = onnxruntime.SessionOptions()
+            if num_threads:
+                options.intra_op_num_threads = num_threads
+            self.session = onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        else:
+            import torch
+            from transformers import AutoModelForSequenceClassification
+
+            self._torch = torch
+            torch_version = torch.__version__
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                model_name, local_files_only=local_files_only
+            )
+            self.model.eval()
+            if backend == "quantized":
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+        # The hub commit hash pins cache entries to the exact weights (and backend) that produced them
+        commit = getattr(config, "_commit_hash", None) or ""
+        self.model_version = commit + backend_version(backend, onnx_path, torch_version)
+        self.cache = None
+        if cache_path:
+            from sentiment_cache import SentimentCache
+
+            self.cache = SentimentCache(cache_path, model_name=model_name, model_version=self.model_version)
+
+    def predict_proba(self, tweets):
+        """Return an (n, 3) float32 array of class probabilities in ``LABELS`` order."""
+        processed = preprocess_tweets(tweets)
+        if not processed:
+            return np.zeros((0, len(self.labels)), dtype=np.float32)
+
+        # Retweets and copy-pasted complaints collapse to the same text after masking; score each once
+        positions = {}
+        inverse = [positions.setdefault(text, len(positions)) for text in processed]
+        unique_texts = list(positions)
+        unique_probabilities = np.zeros((len(unique_texts), len(self.labels)), dtype=np.float32)
+
+        missing = list(range(len(unique_texts)))
+        if self.cache is not None:
+            cached = self.cache.get_many(unique_texts)
+            missing = [i for i, scores in enumerate(cached) if scores is None]
+            for i, scores in enumerate(cached):
+                if scores is not None:
+                    unique_probabilities[i] = scores
+
+        if missing:
+            scored = self._score_processed([unique_texts[i] for i in missing])
+            unique_probabilities[missing] = scored
+            if self.cache is not None:
+                self.cache.put_many([unique_texts[i] for i in missing], scored)
+
+        return unique_probabilities[inverse]
+
+    def _score_processed(self, processed):
+        probabilities = np.zeros((len(processed), len(self.labels)), dtype=np.float32)
+        # Tokenize once without padding, then pad each length-sorted batch only to its own longest tweet
+        encoded = self.tokenizer(processed, truncation=True, max_length=self.max_length)
+        input_ids = encoded["input_ids"]
+        attention_mask = encoded["attention_mask"]
+        lengths = [len(ids) for ids in input_ids]
+
+        tensor_type = "np" if self.backend == "onnx" else "pt"
+        for batch in length_sorted_batches(lengths, self.batch_size):
+            padded = self.tokenizer.pad(
+                {
+                    "input_ids": [input_ids[i] for i in batch],
+                    "attention_mask": [attention_mask[i] for i in batch],
+                },
+                return_tensors=tensor_type,
+            )
+            probabilities[batch] = softmax(self._logits(padded))
+
+        return probabilities
+
+    def predict(self, tweets):
+        """Return the most likely sentiment label for each tweet."""
+        probabilities = self.predict_proba(tweets)
+        return [self.labels[index] for index in probabilities.argmax(axis=1)]
+
+    def score_one(self, tweet):
+        """Score a single tweet with one unpadded forward pass (the original per-tweet path)."""
+        tensor_type = "np" if self.backend == "onnx" else "pt"
+        encoded_tweet = self.tokenizer(preprocess_tweet(str(tweet)), return_tensors=tensor_type)
+        return softmax(self._logits(encoded_tweet))[0]
+
+    def _logits(self, encoded):
+        if self.backend == "onnx":
+            feeds = {
+                "input_ids": np.asarray(encoded["input_ids"], dtype=np.int64),
+                "attention_mask": np.asarray(encoded["attention_mask"], dtype=np.int64),
+            }
+            return self.session.run(["logits"], feeds)[0]
+        with self._torch.no_grad():
+            return self.model(input_ids=encoded["input_ids"], attention_mask=encoded["attention_mask"]).logits.numpy()
+
+    def analyze_sentiment(self, tweet):
+        """Return the most likely sentiment label for a single tweet."""
+        return self.labels[self.score_one(tweet).argmax()]
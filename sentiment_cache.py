@@ -0,0 +1,161 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "sentiment_cache.sqlite3")
+DEFAULT_MAX_ENTRIES = 2_000_000
+# A hit only rewrites its last-used stamp once the stamp is this old
+DEFAULT_TOUCH_INTERVAL = 3600
+# Eviction frees this share of ``max_entries`` beyond the excess, so the table is recounted rarely
+EVICTION_SLACK = 0.01
+_LOOKUP_BATCH = 500
+
+
+def cache_key(normalized_text, model_name, model_version):
+    """Hash normalized tweet text together with the model identity."""
+    digest = hashlib.sha256()
+    for part in (model_name, model_version or "", normalized_text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+class SentimentCache:
+    """SQLite-backed store of model probabilities keyed by normalized tweet text.
+
+    The database runs in WAL mode so several scoring processes and dashboard sessions can
+    read and write it at once. Once it holds more than ``max_entries`` rows the least recently
+    used entries are evicted. When ``model_version`` is ``None`` the version last recorded for
+    ``model_name`` by a scoring run is used.
+
+    Lookups stay read-only unless a hit's last-used stamp is older than ``touch_interval``
+    seconds, so recency is tracked to within that interval. The row count is kept in memory
+    and only recounted from the table when it passes ``max_entries``.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, model_name="", model_version=None,
+                 max_entries=DEFAULT_MAX_ENTRIES, touch_interval=DEFAULT_TOUCH_INTERVAL):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.touch_interval_ns = int(touch_interval * 1e9)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sentiment ("
+            "key BLOB PRIMARY KEY, negative REAL, neutral REAL, positive REAL, last_used INTEGER)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS sentiment_last_used ON sentiment (last_used)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS models (model_name TEXT PRIMARY KEY, model_version TEXT)"
+        )
+
+        if model_version is None:
+            row = self._connection.execute(
+                "SELECT model_version FROM models WHERE model_name = ?", (model_name,)
+            ).fetchone()
+            model_version = row[0] if row else ""
+        else:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO models (model_name, model_version) VALUES (?, ?)",
+                (model_name, model_version),
+            )
+        self.model_version = model_version
+        self._rows = self._count()
+
+    def get_many(self, normalized_texts):
+        """Return a list with an (3,) float32 probability array, or ``None``, per text."""
+        keys = [cache_key(text, self.model_name, self.model_version) for text in normalized_texts]
+        found = {}
+        stale = []
+        now = time.time_ns()
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    "SELECT key, negative, neutral, positive, last_used FROM sentiment "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, negative, neutral, positive, last_used in rows:
+                    found[key] = np.array([negative, neutral, positive], dtype=np.float32)
+                    if now - last_used > self.touch_interval_ns:
+                        stale.append(key)
+            if stale:
+                # One write transaction for every stamp this lookup refreshes
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._connection.executemany(
+                        "UPDATE sentiment SET last_used = ? WHERE key = ?", [(now, key) for key in stale]
+                    )
+                    self._connection.execute("COMMIT")
+                except Exception:
+                    self._connection.execute("ROLLBACK")
+                    raise
+        return [found.get(key) for key in keys]
+
+    def put_many(self, normalized_texts, probabilities):
+        """Store one probability row per normalized text and evict old entries if over capacity."""
+        now = time.time_ns()
+        rows = [
+            (cache_key(text, self.model_name, self.model_version), *map(float, scores), now)
+            for text, scores in zip(normalized_texts, probabilities)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                existing = 0
+                for start in range(0, len(rows), _LOOKUP_BATCH):
+                    batch = [row[0] for row in rows[start:start + _LOOKUP_BATCH]]
+                    existing += self._connection.execute(
+                        f"SELECT COUNT(*) FROM sentiment WHERE key IN ({','.join('?' * len(batch))})", batch
+                    ).fetchone()[0]
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO sentiment (key, negative, neutral, positive, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._rows += len({row[0] for row in rows}) - existing
+                if self._rows > self.max_entries:
+                    self._evict()
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _count(self):
+        return self._connection.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+
+    def _evict(self):
+        # Other processes may have added rows too, so count exactly before deleting
+        self._rows = self._count()
+        excess = self._rows - self.max_entries
+        if excess > 0:
+            excess += int(self.max_entries * EVICTION_SLACK)
+            self._connection.execute(
+                "DELETE FROM sentiment WHERE key IN "
+                "(SELECT key FROM sentiment ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self._rows = max(self._rows - excess, 0)
@@ -0,0 +1,88 @@
+import pandas as pd
+
+from dashboard_data import DAY_ORDER, utc_days
+from sentiment_analyzer import LABELS
+
+CUBE_KEYS = ['day', 'hour', 'Airline', 'Predicted_Sentiment']
+
+
+def build_cube(data):
+    """Aggregate tweets into counts and sums keyed by (day, hour, airline, sentiment)."""
+    frame = pd.DataFrame({
+        'day': utc_days(data['date']),
+        'hour': data['hour'],
+        'Airline': data['Airline'],
+        'Predicted_Sentiment': data['Predicted_Sentiment'],
+        'count': 1,
+        'confidence_sum': data['Sentiment_Confidence'].astype('float64'),
+        'retweet_sum': data['retweet_count'],
+        'like_sum': data['like_count'],
+        'length_sum': data['tweet_content'].str.len().fillna(0),
+    })
+    cube = frame.groupby(CUBE_KEYS, observed=True, sort=False).sum().reset_index()
+    cube['day_of_week'] = pd.Categorical(cube['day'].dt.day_name(), categories=DAY_ORDER, ordered=True)
+    return cube
+
+
+def filter_cube(cube, date_range=None, airlines=None, sentiments=None):
+    """Apply the sidebar filters to cube cells.
+
+    ``None`` or ``'All'`` means no restriction; an empty selection keeps no cells.
+    """
+    mask = pd.Series(True, index=cube.index)
+    if date_range is not None and len(date_range) == 2:
+        mask &= cube['day'].between(pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1]))
+    if airlines is not None and 'All' not in airlines:
+        mask &= cube['Airline'].isin(airlines)
+    if sentiments is not None and 'All' not in sentiments:
+        mask &= cube['Predicted_Sentiment'].isin(sentiments)
+    return cube[mask]
+
+
+def sentiment_pivot(cube, by):
+    """Tweet counts with one row per ``by`` value and one column per sentiment label."""
+    pivot = cube.groupby([by, 'Predicted_Sentiment'], observed=True)['count'].sum().unstack(fill_value=0)
+    pivot.columns = pivot.columns.astype(str)
+    columns = [label for label in LABELS if label in pivot.columns]
+    return pivot.reindex(columns=columns + [c for c in pivot.columns if c not in columns])
+
+
+def sentiment_totals(cube):
+    """Tweet count per sentiment label."""
+    return cube.groupby('Predicted_Sentiment', observed=True)['count'].sum().sort_values(ascending=False)
+
+
+def airline_metrics(cube):
+    """Per-airline positive share, averages and totals, matching the Airline Comparison table."""
+    positive = cube['count'].where(cube['Predicted_Sentiment'] == 'Positive', 0)
+    grouped = cube.assign(positive=positive).groupby('Airline', observed=True)[
+        ['positive', 'count', 'confidence_sum', 'retweet_sum', 'like_sum']
+    ].sum()
+    metrics = pd.DataFrame({
+        'Positive_Sentiment_%': grouped['positive'] / grouped['count'] * 100,
+        'Avg_Confidence': grouped['confidence_sum'] / grouped['count'],
+        'Avg_Retweets': grouped['retweet_sum'] / grouped['count'],
+        'Avg_Likes': grouped['like_sum'] / grouped['count'],
+    }).round(2)
+    metrics['Total_Tweets'] = grouped['count']
+    metrics.index = metrics.index.astype(str)
+    return metrics
+
+
+def cube_summary(cube):
+    """Headline numbers for the Overview tab."""
+    total = int(cube['count'].sum())
+    totals = sentiment_totals(cube)
+    positive_by_airline = cube[cube['Predicted_Sentiment'] == 'Positive'].groupby('Airline', observed=True)[
+        'count'
+    ].sum()
+    hourly = cube.groupby('hour')['count'].sum()
+    return {
+        'total': total,
+        'sentiment_counts': {str(label): int(count) for label, count in totals.items()},
+        'avg_confidence': cube['confidence_sum'].sum() / total if total else float('nan'),
+        'avg_length': cube['length_sum'].sum() / total if total else float('nan'),
+        'top_positive_airline': str(positive_by_airline.idxmax()) if positive_by_airline.sum() else "N/A",
+        'peak_hour': int(hourly.idxmax()) if total else "N/A",
+        'airline_count': int((cube.groupby('Airline', observed=True)['count'].sum() > 0).sum()),
+    }
@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from dashboard_cache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_returns_cached_value_without_recomputing(self):
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.arange(10)
+
+        first = cache.get_or_compute(("rows", "v1"), compute)
+        second = cache.get_or_compute(("rows", "v1"), compute)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used_past_memory_cap(self):
+        cache = ResultCache(max_bytes=2 * 800)
+        cache.get_or_compute("a", lambda: np.zeros(100))
+        cache.get_or_compute("b", lambda: np.zeros(100))
+        cache.get_or_compute("a", lambda: np.zeros(100))
+        cache.get_or_compute("c", lambda: np.zeros(100))
+
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+        recomputed = []
+        cache.get_or_compute("b", lambda: recomputed.append("b") or np.zeros(100))
+        cache.get_or_compute("c", lambda: recomputed.append("c") or np.zeros(100))
+        self.assertEqual(recomputed, ["b"])
+
+    def test_concurrent_requests_share_one_computation(self):
+        cache = ResultCache()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return "figure"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", slow))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["figure"] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_failures_are_not_cached(self):
+        cache = ResultCache()
+
+        def fail():
+            raise ValueError("bad filter")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("k", fail)
+        self.assertEqual(cache.get_or_compute("k", lambda: 42), 42)
+
+
+    def test_interrupted_computation_releases_waiting_sessions(self):
+        class Rerun(BaseException):
+            pass
+
+        cache = ResultCache()
+        started = threading.Event()
+
+        def interrupted():
+            started.set()
+            time.sleep(0.1)
+            raise Rerun()
+
+        def owner():
+            with self.assertRaises(Rerun):
+                cache.get_or_compute("k", interrupted)
+
+        thread = threading.Thread(target=owner)
+        thread.start()
+        started.wait()
+        # The waiter is not handed the other session's rerun; it computes the value itself
+        self.assertEqual(cache.get_or_compute("k", lambda: "figure"), "figure")
+        thread.join()
+        self.assertEqual(cache.get_or_compute("k", lambda: "other"), "figure")
+        self.assertEqual(cache._in_flight, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
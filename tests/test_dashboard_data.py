@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from dashboard_data import build_snapshot, load_dashboard_data, read_source
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _write_source(path):
+    pd.DataFrame(
+        {
+            "date": ["2020-07-31 22:36:45+00:00", "2020-08-03 09:05:00+00:00"],
+            "tweet_location": [None, "Delhi"],
+            "tweet_content": ["@airindiain refund please", "thanks @IndiGo6E"],
+            "Airline": ["airindia", "indigo"],
+            "latitude": ["28.66", "bad"],
+            "longitude": [77.23, None],
+            "Predicted_Sentiment": ["Negative", "Positive"],
+            "Sentiment_Confidence": [0.91, 0.73],
+            "retweet_count": [0, 3],
+            "like_count": [1, 5],
+        }
+    ).to_csv(path, index=False)
+
+
+class DashboardDataTest(unittest.TestCase):
+    def test_read_source_derives_typed_columns(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "scored.csv")
+            _write_source(source)
+            data = read_source(source)
+
+        self.assertEqual(data["Airline"].tolist(), ["Airindia", "Indigo"])
+        self.assertEqual(data["Airline"].dtype, "category")
+        self.assertEqual(data["day_of_week"].tolist(), ["Friday", "Monday"])
+        self.assertEqual(data["hour"].tolist(), [22, 9])
+        self.assertEqual(data["Sentiment_Confidence"].dtype, "float32")
+        self.assertEqual(data["tweet_location"].tolist(), ["Unknown", "Delhi"])
+        self.assertTrue(pd.isna(data.loc[1, "latitude"]))
+
+    def test_missing_snapshot_falls_back_to_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "scored.csv")
+            _write_source(source)
+            data = load_dashboard_data(source, os.path.join(directory, "missing.feather"))
+
+        self.assertEqual(len(data), 2)
+        self.assertIn("Date", data.columns)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is required for Feather snapshots")
+    def test_snapshot_round_trips_csv_result(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "scored.csv")
+            snapshot = os.path.join(directory, "scored.feather")
+            _write_source(source)
+            build_snapshot(source, snapshot)
+
+            from_snapshot = load_dashboard_data(source, snapshot)
+            from_csv = read_source(source)
+            from_csv["Date"] = from_csv["date"]
+
+        pd.testing.assert_frame_equal(from_snapshot, from_csv)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_export import available_formats, export_to_tempfile, write_export
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+COLUMNS = ["date", "Airline", "tweet_content", "like_count"]
+
+
+def _tweets():
+    return pd.DataFrame({
+        "date": pd.date_range("2020-06-20", periods=10, freq="h", tz="UTC"),
+        "user": [f"user{i}" for i in range(10)],
+        "Airline": pd.Categorical(["Indigo", "Vistara"] * 5),
+        "tweet_content": [f"tweet, with \"quotes\" {i}" if i != 3 else None for i in range(10)],
+        "like_count": np.arange(10),
+    })
+
+
+class DataExportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _expected(self, data, rows):
+        return data.iloc[rows][COLUMNS].reset_index(drop=True)
+
+    def test_chunked_csv_matches_a_single_to_csv(self):
+        data = _tweets()
+        rows = np.array([0, 2, 3, 5, 6, 9])
+        for fmt in ("csv", "csv.gz"):
+            path = write_export(data, rows, COLUMNS, os.path.join(self.directory.name, f"out.{fmt}"), fmt, chunk_rows=4)
+            expected = self._expected(data, rows).to_csv(index=False)
+            self.assertEqual(pd.read_csv(path).to_csv(index=False), expected, fmt)
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_chunked_parquet_round_trips(self):
+        data = _tweets()
+        data.loc[:5, "tweet_content"] = None
+        rows = np.arange(10)
+        path = write_export(data, rows, COLUMNS, os.path.join(self.directory.name, "out.parquet"), "parquet", 3)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(path), self._expected(data, rows))
+        self.assertIn("parquet", available_formats())
+
+    def test_empty_selection_keeps_the_header(self):
+        path = export_to_tempfile(_tweets(), np.zeros(0, dtype=int), COLUMNS, "csv", directory=self.directory.name)
+
+        with open(path, encoding="utf-8") as handle:
+            self.assertEqual(handle.read().strip(), ",".join(COLUMNS))
+
+    def test_unknown_format_removes_the_temp_file(self):
+        with self.assertRaises(ValueError):
+            export_to_tempfile(_tweets(), np.arange(3), COLUMNS, "xlsx", directory=self.directory.name)
+
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
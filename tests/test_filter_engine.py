@@ -0,0 +1,60 @@
+import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from filter_engine import FilterIndex, take_rows
+
+
+def _tweets(size=300):
+    generator = np.random.default_rng(11)
+    dates = pd.Timestamp("2020-06-20 18:00", tz="UTC") + pd.to_timedelta(generator.integers(0, 30 * 24, size), unit="h")
+    return pd.DataFrame({
+        "date": dates,
+        "Airline": pd.Categorical(generator.choice(["Airindia", "Indigo", "Spicejet", "Vistara"], size)),
+        "Predicted_Sentiment": generator.choice(["Negative", "Neutral", "Positive"], size),
+    })
+
+
+def _mask_filter(data, date_range, airlines, sentiments):
+    # The original app.py boolean-mask implementation, used as the reference
+    filtered = data.copy()
+    if len(date_range) == 2:
+        filtered = filtered[(filtered["date"].dt.date >= date_range[0]) & (filtered["date"].dt.date <= date_range[1])]
+    if "All" not in airlines:
+        filtered = filtered[filtered["Airline"].isin(airlines)]
+    if "All" not in sentiments:
+        filtered = filtered[filtered["Predicted_Sentiment"].isin(sentiments)]
+    return filtered
+
+
+class FilterIndexTest(unittest.TestCase):
+    def test_matches_boolean_mask_filtering(self):
+        data = _tweets()
+        index = FilterIndex(data)
+        cases = [
+            ((datetime.date(2020, 6, 20), datetime.date(2020, 7, 30)), ["All"], ["All"]),
+            ((datetime.date(2020, 6, 25), datetime.date(2020, 7, 2)), ["All"], ["All"]),
+            ((datetime.date(2020, 7, 1), datetime.date(2020, 7, 1)), ["Indigo", "Vistara"], ["All"]),
+            ((datetime.date(2020, 6, 22), datetime.date(2020, 7, 10)), ["Spicejet"], ["Positive", "Neutral"]),
+            ((datetime.date(2020, 6, 22),), ["All"], ["Negative"]),
+            ((datetime.date(2020, 8, 1), datetime.date(2020, 8, 5)), ["All"], ["All"]),
+            # Clearing a multiselect keeps no rows, as the original filter did
+            ((datetime.date(2020, 6, 20), datetime.date(2020, 7, 30)), [], ["All"]),
+            ((datetime.date(2020, 6, 20), datetime.date(2020, 7, 30)), ["Indigo"], []),
+        ]
+        for date_range, airlines, sentiments in cases:
+            expected = _mask_filter(data, date_range, airlines, sentiments)
+            actual = take_rows(data, index.filter(date_range, airlines, sentiments))
+            pd.testing.assert_frame_equal(actual, expected, obj=str((date_range, airlines, sentiments)))
+
+    def test_unfiltered_selection_reuses_the_frame(self):
+        data = _tweets(20)
+        rows = FilterIndex(data).filter(None, ["All"], ["All"])
+
+        self.assertIs(take_rows(data, rows), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
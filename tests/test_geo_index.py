@@ -0,0 +1,55 @@
+import os
+import unittest
+
+import numpy as np
+
+from geo_index import STATES_PATH, UNKNOWN_REGION, RegionIndex
+
+
+def _ring(points):
+    # Close the ring the way shapefiles store it
+    return np.array(points + points[:1], dtype=float)
+
+
+def _regions():
+    # A square with a square hole, and a two-part region made of separate triangles
+    outer = _ring([(0, 0), (0, 10), (10, 10), (10, 0)])
+    hole = _ring([(4, 4), (6, 4), (6, 6), (4, 6)])
+    left = _ring([(20, 0), (20, 4), (24, 0)])
+    right = _ring([(30, 0), (30, 4), (34, 0)])
+    return RegionIndex([[outer, hole], [left, right]], ["SQUARE STATE", "ISLANDS"], grid_cells=8)
+
+
+class RegionIndexTest(unittest.TestCase):
+    def test_assign_handles_holes_parts_and_missing_points(self):
+        longitude = [1, 5, 9.5, 21, 31, 33.9, 15, None, "bad", 1]
+        latitude = [1, 5, 9.5, 1, 1, 3.9, 5, 1, 1, 1]
+
+        states = _regions().assign(longitude, latitude)
+
+        self.assertEqual(
+            list(states),
+            ["Square State", UNKNOWN_REGION, "Square State", "Islands", "Islands", UNKNOWN_REGION,
+             UNKNOWN_REGION, UNKNOWN_REGION, UNKNOWN_REGION, "Square State"],
+        )
+        self.assertEqual(list(states.categories), ["Square State", "Islands", UNKNOWN_REGION])
+
+    def test_geojson_keeps_holes_with_their_polygon(self):
+        geojson = _regions().to_geojson(tolerance=0.01)
+
+        square, islands = geojson["features"]
+        self.assertEqual(square["properties"]["name"], "Square State")
+        self.assertEqual(len(square["geometry"]["coordinates"]), 1)
+        self.assertEqual(len(square["geometry"]["coordinates"][0]), 2)
+        self.assertEqual(len(islands["geometry"]["coordinates"]), 2)
+
+    @unittest.skipUnless(os.path.exists(STATES_PATH), "bundled state shapefile is not present")
+    def test_bundled_state_shapefile(self):
+        index = RegionIndex.from_shapefile(STATES_PATH)
+
+        states = index.assign([77.59, 80.95, 88.36], [12.97, 26.85, 22.57])
+        self.assertEqual(list(states), ["Karnataka", "Uttar Pradesh", "West Bengal"])
+
+
+if __name__ == "__main__":
+    unittest.main()
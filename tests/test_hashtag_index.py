@@ -0,0 +1,66 @@
+import re
+import unittest
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from hashtag_index import HashtagIndex
+
+
+def _tweets():
+    return pd.DataFrame({
+        "date": pd.to_datetime([
+            "2020-06-20 08:00", "2020-06-20 09:00", "2020-06-21 10:00",
+            "2020-06-21 11:00", "2020-06-22 12:00", "2020-06-22 13:00",
+        ]),
+        "tweet_content": [
+            "#IndiGo delayed again #fail",
+            "loved the crew #Vistara",
+            None,
+            "#fail #fail @SpiceJet refund please",
+            "no hashtags here",
+            "#vistara #indigo",
+        ],
+    })
+
+
+def _most_common(texts, n):
+    # The original app.py regex-and-Counter scan, used as the reference
+    tags = []
+    for text in texts:
+        if isinstance(text, str):
+            tags.extend(tag.lower() for tag in re.findall(r"#\w+", text))
+    return dict(Counter(tags).most_common(n))
+
+
+class HashtagIndexTest(unittest.TestCase):
+    def test_top_matches_counter_for_any_subset(self):
+        data = _tweets()
+        index = HashtagIndex(data["tweet_content"])
+        for rows in (None, np.array([0, 1, 2]), np.array([3, 5]), np.array([4]), np.array([], dtype=int)):
+            texts = data["tweet_content"] if rows is None else data["tweet_content"].iloc[rows]
+            self.assertEqual(list(index.top(rows, 3).items()), list(_most_common(texts, 3).items()))
+
+    def test_vocabulary_is_interned_and_lowercased(self):
+        index = HashtagIndex(_tweets()["tweet_content"])
+
+        self.assertEqual(sorted(index.vocabulary), ["#fail", "#indigo", "#vistara"])
+        self.assertEqual(index.counts().sum(), 7)
+
+    def test_rows_with_and_trend(self):
+        data = _tweets()
+        index = HashtagIndex(data["tweet_content"])
+
+        self.assertEqual(index.rows_with(["#VISTARA"]).tolist(), [1, 5])
+        self.assertEqual(index.rows_with(["#fail", "#unknown"], rows=np.array([3, 4])).tolist(), [3])
+
+        trend = index.trend(data["date"], ["#fail", "#indigo"])
+        self.assertEqual(list(trend.columns), ["#fail", "#indigo"])
+        self.assertEqual(trend.loc[pd.Timestamp("2020-06-20")].tolist(), [1, 1])
+        self.assertEqual(trend.loc[pd.Timestamp("2020-06-21")].tolist(), [2, 0])
+        self.assertEqual(trend.loc[pd.Timestamp("2020-06-22")].tolist(), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+
+from live_poller import LivePoller
+from live_store import LiveStore, LiveStoreReader
+
+
+class FakeClient:
+    """Serves each query's posts newest first, honouring ``since_id`` like the search API."""
+
+    def __init__(self, posts):
+        self.posts = posts
+        self.calls = []
+
+    def search_each(self, queries, max_posts, since_ids=None):
+        since_ids = since_ids or {}
+        self.calls.append(dict(since_ids))
+        results = {}
+        for query in queries:
+            since = int(since_ids.get(query, 0))
+            newer = [post for post in self.posts.get(query, []) if int(post["id"]) > since]
+            results[query] = sorted(newer, key=lambda post: -int(post["id"]))[:max_posts]
+        return results
+
+
+def _post(post_id, text):
+    return {"id": str(post_id), "createdAt": f"2026-01-02T03:04:{post_id:02d}Z", "text": text}
+
+
+class LivePollerTest(unittest.TestCase):
+    def test_polls_fetch_and_store_only_posts_newer_than_the_watermark(self):
+        client = FakeClient({
+            "indigo": [_post(1, "IndiGo great crew"), _post(3, "IndiGo delayed again")],
+            "vistara": [_post(2, "Vistara smooth"), _post(3, "IndiGo delayed again")],
+        })
+        with tempfile.TemporaryDirectory() as directory:
+            store = LiveStore(directory)
+            poller = LivePoller(client, store, ["indigo", "vistara", " "], limit=10)
+
+            self.assertEqual(poller.poll_once(), 3)
+            self.assertEqual(store.watermarks()["indigo"]["since_id"], "3")
+            self.assertEqual(store.watermarks()["vistara"]["newest"], "2026-01-02T03:04:03")
+
+            self.assertEqual(poller.poll_once(), 0)
+            self.assertEqual(client.calls[-1], {"indigo": "3", "vistara": "3"})
+
+            client.posts["vistara"].append(_post(4, "Vistara lost my bag"))
+            self.assertEqual(poller.poll_once(), 1)
+
+            data = LiveStoreReader(store).refresh()
+            self.assertEqual(sorted(data["post_id"]), ["1", "2", "3", "4"])
+            self.assertEqual(data.set_index("post_id").loc["4", "Predicted_Sentiment"], "Negative")
+            self.assertEqual(len(store.parts()), 2)
+
+    def test_one_off_polls_leave_the_shared_configuration_alone(self):
+        client = FakeClient({"indigo": [_post(1, "IndiGo great crew")], "vistara": [_post(2, "Vistara smooth")]})
+        with tempfile.TemporaryDirectory() as directory:
+            poller = LivePoller(client, LiveStore(directory), ["indigo"], limit=10, interval=60)
+
+            self.assertEqual(poller.poll_once(["vistara", ""], 5), 1)
+            self.assertEqual(poller.queries, ["indigo"])
+
+            poller.start()
+            poller.stop(wait=False)
+            self.assertTrue(poller.stopping)
+            poller.start()
+            self.assertFalse(poller.stopping)
+            poller.stop()
+            self.assertFalse(poller.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
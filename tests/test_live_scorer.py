@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import live_scorer
+from live_scorer import TieredScorer
+from sentiment_cache import SentimentCache
+from xquik_source import xquik_posts_to_dataframe
+
+TEXTS = [
+    "@IndiGo6E rude staff, lost bag, flight delayed",
+    "@IndiGo6E great, another delay",
+    "Vistara lounge is open",
+    "Air India flight today",
+    "SpiceJet boarding now",
+    "Akasa meal was fine",
+]
+
+
+class FakeScoringServer:
+    """Scores everything negative, taking ``seconds`` of fake time per batch."""
+
+    def __init__(self, seconds=0.0):
+        self.now = 0.0
+        self.seconds = seconds
+        self.batches = []
+
+    def clock(self):
+        return self.now
+
+    def __call__(self, texts, url=None, timeout=5):
+        self.batches.append(list(texts))
+        self.now += self.seconds
+        return np.tile(np.array([[0.9, 0.07, 0.03]], dtype=np.float32), (len(texts), 1))
+
+
+class TieredScorerTest(unittest.TestCase):
+    def setUp(self):
+        self.data = xquik_posts_to_dataframe([{"createdAt": "2026-01-02T03:04:05Z", "text": text} for text in TEXTS])
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = SentimentCache(os.path.join(directory.name, "cache.sqlite3"), model_name="roberta",
+                                    model_version="v1")
+        self.addCleanup(self.cache.close)
+        self.cache.put_many(["@user great, another delay"], [[0.2, 0.7, 0.1]])
+
+    def test_only_low_confidence_posts_reach_the_cache_and_then_the_model(self):
+        server = FakeScoringServer()
+        scorer = TieredScorer(self.cache, batch_size=2, clock=server.clock)
+
+        with mock.patch.object(live_scorer, "request_scores", server):
+            data = scorer.score(self.data)
+
+        # Three negative terms are confident enough to keep the keyword label
+        self.assertAlmostEqual(data.loc[0, "Sentiment_Confidence"], 0.85)
+        self.assertEqual(data.loc[1, "Predicted_Sentiment"], "Neutral")
+        self.assertAlmostEqual(data.loc[1, "Sentiment_Confidence"], 0.7, places=5)
+        self.assertEqual(data["Predicted_Sentiment"].iloc[2:].tolist(), ["Negative"] * 4)
+        self.assertEqual([len(batch) for batch in server.batches], [2, 2])
+        self.assertEqual(scorer.last_report["escalated"], 5)
+        self.assertEqual((scorer.last_report["cache"], scorer.last_report["model"]), (1, 4))
+        self.assertAlmostEqual(scorer.escalated_fraction, 5 / 6)
+
+    def test_cached_model_results_override_the_keyword_estimate(self):
+        scorer = TieredScorer(self.cache)
+
+        with mock.patch.object(live_scorer, "request_scores", return_value=None):
+            data = scorer.score(self.data)
+
+        # Cache keys are the normalized text, so the masked handle still hits
+        self.assertEqual(data.loc[1, "Predicted_Sentiment"], "Neutral")
+        self.assertAlmostEqual(data.loc[1, "Sentiment_Confidence"], 0.7, places=5)
+        self.assertEqual(data.loc[2, "Predicted_Sentiment"], "Neutral")
+        self.assertAlmostEqual(data.loc[2, "Sentiment_Confidence"], 0.5)
+        self.assertEqual((scorer.last_report["cache"], scorer.last_report["unresolved"]), (1, 4))
+
+    def test_latency_budget_and_missing_server_leave_keyword_labels(self):
+        server = FakeScoringServer(seconds=0.3)
+        scorer = TieredScorer(batch_size=2, latency_budget=0.5, clock=server.clock)
+
+        with mock.patch.object(live_scorer, "request_scores", server):
+            data = scorer.score(self.data.copy())
+        self.assertEqual(len(server.batches), 2)
+        self.assertEqual((scorer.last_report["model"], scorer.last_report["unresolved"]), (4, 1))
+        self.assertEqual(data.loc[5, "Predicted_Sentiment"], "Neutral")
+
+        with mock.patch.object(live_scorer, "request_scores", return_value=None):
+            scorer.score(self.data.copy())
+        self.assertEqual(scorer.last_report["unresolved"], 5)
+        self.assertEqual(scorer.totals, {"posts": 12, "escalated": 10, "cache": 0, "model": 4, "unresolved": 6})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import multiprocessing
+import tempfile
+import unittest
+
+import pandas as pd
+
+from live_store import PART_PATTERN, LiveStore, LiveStoreReader, _write_part
+
+
+def _rows(ids):
+    return pd.DataFrame({"post_id": [str(i) for i in ids], "tweet_content": [f"post {i}" for i in ids]})
+
+
+def _poll_watermarks(directory, query, polls):
+    # Runs in its own process, like the poller CLI next to the dashboard
+    store = LiveStore(directory)
+    for since_id in range(1, polls + 1):
+        store.update_watermarks({query: {"since_id": str(since_id)}, "shared": {"since_id": str(since_id)}})
+
+
+class LiveStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_append_skips_known_ids_and_reader_loads_only_new_parts(self):
+        store = LiveStore(self.directory)
+        reader = LiveStoreReader(store)
+        self.assertIsNone(reader.refresh())
+
+        self.assertEqual(store.append(_rows([1, 2, 2])), 2)
+        self.assertEqual(reader.refresh()["post_id"].tolist(), ["1", "2"])
+        first_version = reader.version
+
+        self.assertEqual(store.append(_rows([2, 3])), 1)
+        self.assertEqual(store.append(_rows([3])), 0)
+        self.assertEqual(len(store.parts()), 2)
+        self.assertEqual(reader.refresh()["post_id"].tolist(), ["1", "2", "3"])
+        self.assertNotEqual(reader.version, first_version)
+
+        # A store reopened from disk still knows every stored id
+        reopened = LiveStore(self.directory)
+        self.assertEqual(reopened.is_new(["1", "3", "4"]).tolist(), [False, False, True])
+        self.assertEqual(reopened.read(1)[0]["post_id"].tolist(), ["3"])
+
+    def test_writers_sharing_a_directory_neither_overwrite_nor_repeat_posts(self):
+        dashboard, cli = LiveStore(self.directory), LiveStore(self.directory)
+        self.assertTrue(cli.is_new(["1"]).all())
+
+        self.assertEqual(dashboard.append(_rows([1, 2])), 2)
+        # The other writer sees the part just written before de-duplicating
+        self.assertEqual(cli.append(_rows([2, 3])), 1)
+        self.assertEqual([PART_PATTERN.search(path).group(1) for path in dashboard.parts()], ["000000", "000001"])
+
+        # A post both writers stored in the same instant is read once
+        _write_part(_rows([3, 4]), self.directory)
+        self.assertEqual(LiveStoreReader(dashboard).refresh()["post_id"].tolist(), ["1", "2", "3", "4"])
+
+    def test_watermarks_merge_and_persist(self):
+        store = LiveStore(self.directory)
+        store.update_watermarks({"indigo": {"since_id": "10"}})
+        store.update_watermarks({"vistara": {"since_id": "7"}})
+
+        self.assertEqual(
+            LiveStore(self.directory).watermarks(),
+            {"indigo": {"since_id": "10"}, "vistara": {"since_id": "7"}},
+        )
+
+    def test_processes_updating_watermarks_never_lose_or_rewind_them(self):
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_poll_watermarks, args=(self.directory, query, 50)) for query in ("indigo", "vistara")
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual([process.exitcode for process in processes], [0, 0])
+        self.assertEqual(
+            LiveStore(self.directory).watermarks(),
+            {"indigo": {"since_id": "50"}, "shared": {"since_id": "50"}, "vistara": {"since_id": "50"}},
+        )
+        # An older update merged later keeps the newer watermark
+        LiveStore(self.directory).update_watermarks({"shared": {"since_id": "9", "newest": "2026-01-02T03:04:05"}})
+        self.assertEqual(LiveStore(self.directory).watermarks()["shared"],
+                         {"since_id": "50", "newest": "2026-01-02T03:04:05"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+import pandas as pd
+
+from preprocess import preprocess_series, preprocess_tweet, preprocess_tweets
+
+
+def _word_loop(tweet):
+    # The original per-word implementation from tweet.py, kept as the reference
+    tweet_words = []
+    for word in tweet.split(' '):
+        if word.startswith('@') and len(word) > 1:
+            word = '@user'
+        elif word.startswith('http'):
+            word = "http"
+        tweet_words.append(word)
+    return " ".join(tweet_words)
+
+
+class PreprocessTest(unittest.TestCase):
+    def test_masks_handles_and_links(self):
+        self.assertEqual(
+            preprocess_tweet("@IndiGo6E refund please https://t.co/abc @"),
+            "@user refund please http @",
+        )
+
+    def test_matches_word_loop_on_edge_cases(self):
+        tweets = [
+            "",
+            "@",
+            "@@",
+            "  @a  http",
+            "email@host.com and xhttp://x",
+            "line one\n@handle\thttp://t.co ok",
+            "@user_1,@user_2 https:// http",
+        ]
+        for tweet in tweets:
+            self.assertEqual(preprocess_tweet(tweet), _word_loop(tweet), repr(tweet))
+
+    def test_matches_word_loop_on_random_text(self):
+        generator = random.Random(7)
+        pieces = [" ", "  ", "@", "h", "http", "s:", "/", "\n", "\t", "x", "#tag"]
+        tweets = ["".join(generator.choice(pieces) for _ in range(generator.randint(0, 12))) for _ in range(5000)]
+
+        expected = [_word_loop(tweet) for tweet in tweets]
+
+        self.assertEqual(preprocess_tweets(tweets), expected)
+        self.assertEqual(preprocess_series(pd.Series(tweets)).tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import http.client
+import json
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from scoring_server import MicroBatcher, make_server, request_scores
+
+
+def _score_by_length(texts):
+    return np.array([[0.1, 0.2, 0.7] if len(text) > 5 else [0.6, 0.3, 0.1] for text in texts], dtype=np.float32)
+
+
+class MicroBatcherTest(unittest.TestCase):
+    def test_concurrent_requests_share_one_forward_pass(self):
+        batch_sizes = []
+
+        def score(texts):
+            batch_sizes.append(len(texts))
+            return _score_by_length(texts)
+
+        batcher = MicroBatcher(score, max_batch_size=8, max_wait_ms=200)
+        results = {}
+
+        def submit(text):
+            results[text] = batcher.submit([text])
+
+        threads = [threading.Thread(target=submit, args=(text,)) for text in ("ok", "great trip", "bad")]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(batch_sizes, [3])
+        np.testing.assert_allclose(results["great trip"], [[0.1, 0.2, 0.7]])
+        np.testing.assert_allclose(results["ok"], [[0.6, 0.3, 0.1]])
+
+    def test_errors_reach_every_waiting_request(self):
+        def fail(texts):
+            raise RuntimeError("model unavailable")
+
+        with self.assertRaises(RuntimeError):
+            MicroBatcher(fail, max_wait_ms=1).submit(["late again"])
+
+
+class ScoringServerTest(unittest.TestCase):
+    def test_batch_endpoint_round_trip(self):
+        server = make_server(_score_by_length, port=0, max_wait_ms=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            scores = request_scores(["ok", "great trip"], url)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        np.testing.assert_allclose(scores, _score_by_length(["ok", "great trip"]), rtol=1e-6)
+
+    def test_requests_reuse_one_keep_alive_connection(self):
+        server = make_server(_score_by_length, port=0, max_wait_ms=1)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        self.addCleanup(connection.close)
+
+        sockets = []
+        for text in ("ok", "great trip"):
+            connection.request("POST", "/score", json.dumps({"text": text}), {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertFalse(response.will_close)
+            json.loads(response.read())
+            sockets.append(connection.sock)
+
+        self.assertIs(sockets[0], sockets[1])
+
+    def test_scoring_failures_answer_with_a_json_error(self):
+        def fail(texts):
+            raise RuntimeError("model unavailable")
+
+        server = make_server(fail, port=0, max_wait_ms=1)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        self.addCleanup(connection.close)
+
+        with self.assertLogs("scoring_server", level="ERROR"):
+            connection.request("POST", "/score_batch", json.dumps({"texts": ["late again"]}))
+            response = connection.getresponse()
+            body = json.loads(response.read())
+            scores = request_scores(["late again"], f"http://127.0.0.1:{server.server_address[1]}")
+
+        self.assertEqual(response.status, 500)
+        self.assertEqual(body, {"error": "scoring failed: model unavailable"})
+        self.assertIsNone(scores)
+
+    def test_unreachable_server_returns_none(self):
+        self.assertIsNone(request_scores(["late again"], "http://127.0.0.1:9", timeout=0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from search_index import SearchIndex, parse_query, tokenize
+
+TWEETS = [
+    "Baggage lost at Delhi, still waiting for a refund",
+    "@IndiGo6E refund refund refund!!",
+    "Lost my baggage tag but the baggage arrived",
+    None,
+    "Great crew, no complaints",
+    "REFUND my ticket, baggage lost again #fail",
+]
+
+
+def _brute_force(texts, clauses):
+    # Scan every tweet's tokens, as a str.contains-style reference
+    matches = []
+    for row, text in enumerate(texts):
+        tokens = tokenize(text) if text is not None else []
+        joined = f" {' '.join(tokens)} "
+        if all(f" {' '.join(clause)} " in joined for clause in clauses):
+            matches.append(row)
+    return matches
+
+
+class SearchIndexTest(unittest.TestCase):
+    def test_parse_query(self):
+        self.assertEqual(parse_query('refund AND "Baggage lost"'), [("refund",), ("baggage", "lost")])
+        self.assertEqual(parse_query("can't"), [("can", "t")])
+        self.assertEqual(parse_query('  ""  '), [])
+
+    def test_matches_brute_force_scan(self):
+        for index in (SearchIndex(TWEETS), SearchIndex(TWEETS, chunk_size=4)):
+            self._assert_matches(index)
+
+    def _assert_matches(self, index):
+        for query in ["refund", "baggage lost", '"baggage lost"', '"lost my baggage"', "refund AND baggage",
+                      '"lost baggage"', "missing"]:
+            rows, scores = index.search(query)
+            self.assertEqual(sorted(rows.tolist()), _brute_force(TWEETS, parse_query(query)), query)
+            self.assertTrue(np.all(np.diff(scores) <= 0), query)
+
+    def test_ranking_and_row_restriction(self):
+        index = SearchIndex(TWEETS)
+
+        rows, _ = index.search("refund")
+        self.assertEqual(rows[0], 1)
+
+        rows, _ = index.search('"baggage lost"', rows=np.array([2, 4, 5]))
+        self.assertEqual(rows.tolist(), [5])
+
+    def test_empty_query(self):
+        rows, scores = SearchIndex(TWEETS).search("   ")
+
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(scores), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from sentiment_analyzer import LABELS, SentimentAnalyzer, backend_version, length_sorted_batches, sentiment_columns, softmax
+from sentiment_cache import SentimentCache
+
+
+class SentimentAnalyzerTest(unittest.TestCase):
+    def test_length_sorted_batches_cover_every_row_once(self):
+        lengths = [9, 2, 7, 2, 5]
+        batches = list(length_sorted_batches(lengths, 2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(sorted(int(i) for batch in batches for i in batch), [0, 1, 2, 3, 4])
+        self.assertEqual([lengths[i] for i in batches[0]], [2, 2])
+
+    def test_sentiment_columns_keep_probabilities_as_float32(self):
+        columns = sentiment_columns(np.array([[0.2, 0.7, 0.1], [0.5, 0.1, 0.4]], dtype=np.float64))
+
+        self.assertEqual(columns["Predicted_Sentiment"].tolist(), ["Neutral", "Negative"])
+        self.assertEqual(columns["Prob_Positive"].dtype, np.float32)
+        np.testing.assert_allclose(columns["Sentiment_Confidence"], [0.7, 0.5], rtol=1e-6)
+
+    def test_softmax_rows_sum_to_one(self):
+        probabilities = softmax(np.array([[1000.0, 0.0, -1000.0], [0.0, 0.0, 0.0]], dtype=np.float32))
+
+        np.testing.assert_allclose(probabilities.sum(axis=1), [1.0, 1.0], rtol=1e-6)
+        self.assertEqual(probabilities.argmax(axis=1).tolist(), [0, 0])
+
+
+    def test_backend_versions_tell_graphs_and_quantization_apart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fp32 = os.path.join(directory, "model.onnx")
+            int8 = os.path.join(directory, "model-int8.onnx")
+            for path, size in ((fp32, 8), (int8, 4)):
+                with open(path, "wb") as handle:
+                    handle.write(b"\0" * size)
+            versions = {backend_version("onnx", fp32), backend_version("onnx", int8)}
+
+            os.utime(fp32, ns=(0, 10**9))
+            versions.add(backend_version("onnx", fp32))
+
+        self.assertEqual(len(versions), 3)
+        self.assertEqual(backend_version("torch"), "")
+        self.assertNotEqual(backend_version("quantized", torch_version="2.3"),
+                            backend_version("quantized", torch_version="2.4"))
+
+
+    def test_predict_proba_scores_each_distinct_text_once_and_reuses_the_cache(self):
+        scored = []
+
+        def score_processed(processed):
+            scored.append(list(processed))
+            return np.array([[0.1, 0.2, 0.7] if "great" in text else [0.6, 0.3, 0.1] for text in processed],
+                            dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as directory:
+            # The stubbed forward pass stands in for the model, so no weights are loaded
+            analyzer = SentimentAnalyzer.__new__(SentimentAnalyzer)
+            analyzer.labels = LABELS
+            analyzer.cache = SentimentCache(os.path.join(directory, "cache.sqlite3"), model_name="roberta",
+                                            model_version="v1")
+            analyzer._score_processed = score_processed
+            analyzer.cache.put_many(["cached @user"], [[0.2, 0.7, 0.1]])
+
+            probabilities = analyzer.predict_proba(
+                ["great @a", "late", "great @b", "cached @someone", "late", "great @c"]
+            )
+            repeat = analyzer.predict_proba(["late", "great @d"])
+            analyzer.cache.close()
+
+        # Handles are masked, so the three "great" tweets are one text; the cached one never reaches the model
+        self.assertEqual(scored, [["great @user", "late"]])
+        self.assertEqual([LABELS[i] for i in probabilities.argmax(axis=1)],
+                         ["Positive", "Negative", "Positive", "Neutral", "Negative", "Positive"])
+        np.testing.assert_allclose(probabilities[3], [0.2, 0.7, 0.1], rtol=1e-6)
+        np.testing.assert_allclose(repeat, [[0.6, 0.3, 0.1], [0.1, 0.2, 0.7]], rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from sentiment_cache import SentimentCache
+
+
+class SentimentCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trips_probabilities(self):
+        cache = SentimentCache(self.path, model_name="roberta", model_version="abc")
+        cache.put_many(["@user refund please"], np.array([[0.7, 0.2, 0.1]], dtype=np.float32))
+
+        hit, miss = cache.get_many(["@user refund please", "something else"])
+
+        np.testing.assert_allclose(hit, [0.7, 0.2, 0.1], rtol=1e-6)
+        self.assertIsNone(miss)
+        cache.close()
+
+    def test_entries_are_scoped_to_model_version(self):
+        writer = SentimentCache(self.path, model_name="roberta", model_version="v1")
+        writer.put_many(["late again"], [[0.9, 0.05, 0.05]])
+
+        # Readers that do not know the version pick up the one the last scoring run recorded
+        self.assertIsNotNone(SentimentCache(self.path, model_name="roberta").get_many(["late again"])[0])
+        self.assertIsNone(SentimentCache(self.path, model_name="roberta", model_version="v2").get_many(["late again"])[0])
+        self.assertIsNone(SentimentCache(self.path, model_name="roberta").get_many(["late again"])[0])
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = SentimentCache(self.path, model_name="roberta", model_version="v1", max_entries=2, touch_interval=0)
+        cache.put_many(["first"], [[1.0, 0.0, 0.0]])
+        cache.put_many(["second"], [[0.0, 1.0, 0.0]])
+        cache.get_many(["first"])
+        cache.put_many(["third"], [[0.0, 0.0, 1.0]])
+
+        first, second, third = cache.get_many(["first", "second", "third"])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertIsNotNone(third)
+
+
+    def test_recent_hits_are_read_without_writing(self):
+        cache = SentimentCache(self.path, model_name="roberta", model_version="v1", max_entries=3)
+        cache.put_many(["first", "second"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        changes = cache._connection.total_changes
+
+        self.assertIsNotNone(cache.get_many(["first", "second", "third"])[1])
+        self.assertEqual(cache._connection.total_changes, changes)
+
+        # Rewriting stored texts does not count towards capacity
+        cache.put_many(["first", "second"], [[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+        cache.put_many(["third"], [[0.0, 0.0, 1.0]])
+        self.assertEqual(len(cache), 3)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
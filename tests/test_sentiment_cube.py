@@ -0,0 +1,63 @@
+import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from sentiment_cube import airline_metrics, build_cube, cube_summary, filter_cube, sentiment_pivot
+
+
+def _tweets():
+    generator = np.random.default_rng(3)
+    size = 400
+    dates = pd.Timestamp("2020-07-01", tz="UTC") + pd.to_timedelta(generator.integers(0, 20 * 24 * 60, size), unit="min")
+    return pd.DataFrame({
+        "date": dates,
+        "hour": dates.hour,
+        "Airline": pd.Categorical(generator.choice(["Airindia", "Indigo", "Spicejet"], size)),
+        "Predicted_Sentiment": pd.Categorical(generator.choice(["Negative", "Neutral", "Positive"], size)),
+        "Sentiment_Confidence": generator.random(size).astype("float32"),
+        "retweet_count": generator.integers(0, 10, size),
+        "like_count": generator.integers(0, 50, size),
+        "tweet_content": ["x" * int(n) for n in generator.integers(10, 280, size)],
+    })
+
+
+class SentimentCubeTest(unittest.TestCase):
+    def test_rollups_match_raw_groupbys_under_filters(self):
+        data = _tweets()
+        date_range = (datetime.date(2020, 7, 3), datetime.date(2020, 7, 12))
+        raw = data[
+            (data["date"].dt.date >= date_range[0])
+            & (data["date"].dt.date <= date_range[1])
+            & data["Airline"].isin(["Indigo", "Spicejet"])
+        ]
+
+        cube = filter_cube(build_cube(data), date_range, ["Indigo", "Spicejet"], ["All"])
+
+        expected_daily = raw.groupby([raw["date"].dt.date, "Predicted_Sentiment"], observed=True).size().unstack(fill_value=0)
+        np.testing.assert_array_equal(sentiment_pivot(cube, "day").sort_index().to_numpy(), expected_daily.to_numpy())
+
+        expected_metrics = raw.groupby("Airline", observed=True).agg({
+            "Predicted_Sentiment": lambda x: (x == "Positive").mean() * 100,
+            "Sentiment_Confidence": "mean",
+            "retweet_count": "mean",
+            "like_count": "mean",
+        }).round(2)
+        np.testing.assert_allclose(airline_metrics(cube).iloc[:, :4].to_numpy(), expected_metrics.to_numpy(), atol=0.011)
+
+        summary = cube_summary(cube)
+        self.assertEqual(summary["total"], len(raw))
+        self.assertTrue(filter_cube(build_cube(data), date_range, [], ["All"]).empty)
+        self.assertEqual(len(filter_cube(build_cube(data), None, None, None)), len(build_cube(data)))
+        self.assertAlmostEqual(summary["avg_length"], raw["tweet_content"].str.len().mean())
+        self.assertEqual(summary["peak_hour"], raw["hour"].value_counts().sort_index().idxmax())
+
+    def test_sentiment_filter_limits_pivot_columns(self):
+        cube = filter_cube(build_cube(_tweets()), sentiments=["Positive"])
+
+        self.assertEqual(sentiment_pivot(cube, "Airline").columns.tolist(), ["Positive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
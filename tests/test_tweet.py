@@ -0,0 +1,143 @@
+import itertools
+import os
+import sys
+import tempfile
+import unittest
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import tweet
+from tweet import (
+    input_fingerprint,
+    iter_chunks,
+    iter_scored_chunks,
+    load_checkpoint,
+    ordered_imap,
+    output_options,
+    parse_args,
+    write_chunks,
+)
+
+
+def _label_by_length(tweets):
+    return ["Positive" if len(tweet) > 5 else "Negative" for tweet in tweets]
+
+
+def _score_by_length(tweets):
+    return np.array(
+        [[0.1, 0.2, 0.7] if label == "Positive" else [0.6, 0.3, 0.1] for label in _label_by_length(tweets)],
+        dtype=np.float32,
+    ).reshape(-1, 3)
+
+
+class TweetScriptTest(unittest.TestCase):
+    def test_ordered_imap_preserves_input_order(self):
+        with ThreadPool(3) as pool:
+            results = list(ordered_imap(pool, lambda value: value * 2, range(10), max_in_flight=2))
+
+        self.assertEqual(results, [value * 2 for value in range(10)])
+
+    def test_streamed_chunks_match_single_pass_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tweets.csv")
+            output = os.path.join(directory, "scored.csv")
+            pd.DataFrame({"id": range(7), "tweet_content": ["ok", "great trip", None, "bad", "lost bag", "", "x"]}).to_csv(
+                source, index=False
+            )
+
+            count = write_chunks(iter_scored_chunks(iter_chunks(source, 3), _score_by_length), output)
+            expected = pd.read_csv(source)
+            expected["Predicted_Sentiment"] = _label_by_length(expected["tweet_content"].fillna("").astype(str))
+            scored = pd.read_csv(output)
+
+            self.assertEqual(count, 7)
+            pd.testing.assert_frame_equal(scored[expected.columns], expected)
+            self.assertEqual(
+                scored.columns[-4:].tolist(),
+                ["Prob_Negative", "Prob_Neutral", "Prob_Positive", "Sentiment_Confidence"],
+            )
+            np.testing.assert_allclose(scored["Sentiment_Confidence"], [0.6, 0.7, 0.6, 0.6, 0.7, 0.6, 0.6], rtol=1e-6)
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tweets.csv")
+            complete = os.path.join(directory, "complete.csv")
+            resumed = os.path.join(directory, "resumed.csv")
+            pd.DataFrame({"id": range(10), "tweet_content": [f"tweet number {i}" * (i % 3) for i in range(10)]}).to_csv(
+                source, index=False
+            )
+            fingerprint = input_fingerprint(source, 3, "test-model")
+
+            write_chunks(iter_scored_chunks(iter_chunks(source, 3), _score_by_length), complete)
+
+            # Persist two chunks, then simulate a crash that left a partial third chunk behind
+            write_chunks(
+                iter_scored_chunks(itertools.islice(iter_chunks(source, 3), 2), _score_by_length),
+                resumed,
+                fingerprint,
+            )
+            with open(resumed, "ab") as handle:
+                handle.write(b"9,partial row")
+
+            state = load_checkpoint(resumed, fingerprint)
+            self.assertEqual((state["chunks_done"], state["rows_done"]), (2, 6))
+
+            remaining = itertools.islice(iter_chunks(source, 3), state["chunks_done"], None)
+            write_chunks(iter_scored_chunks(remaining, _score_by_length), resumed, fingerprint, state)
+
+            with open(complete, "rb") as expected, open(resumed, "rb") as actual:
+                self.assertEqual(actual.read(), expected.read())
+
+    def test_checkpoint_ignored_for_different_chunking(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tweets.csv")
+            output = os.path.join(directory, "scored.csv")
+            pd.DataFrame({"tweet_content": ["a", "b", "c"]}).to_csv(source, index=False)
+            write_chunks(
+                iter_scored_chunks(iter_chunks(source, 2), _score_by_length),
+                output,
+                input_fingerprint(source, 2, "test-model"),
+            )
+
+            self.assertIsNotNone(load_checkpoint(output, input_fingerprint(source, 2, "test-model")))
+            self.assertIsNone(load_checkpoint(output, input_fingerprint(source, 1, "test-model")))
+
+    def test_checkpoint_ignored_when_output_options_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tweets.csv")
+            output = os.path.join(directory, "scored.csv")
+            pd.DataFrame({"tweet_content": ["a", "b", "c"]}).to_csv(source, index=False)
+            batched = output_options(parse_args(["--input", source]))
+            write_chunks(
+                iter_scored_chunks(iter_chunks(source, 2), _score_by_length),
+                output,
+                input_fingerprint(source, 2, "test-model", batched),
+            )
+
+            self.assertIn("Prob_Positive", batched["columns"])
+            self.assertIsNotNone(load_checkpoint(output, input_fingerprint(source, 2, "test-model", batched)))
+            for flags in (["--per-tweet"], ["--backend", "onnx"], ["--backend", "onnx", "--onnx-path", "q.onnx"]):
+                changed = output_options(parse_args(["--input", source, *flags]))
+                self.assertIsNone(load_checkpoint(output, input_fingerprint(source, 2, "test-model", changed)))
+
+    def test_per_tweet_scoring_is_rejected_with_several_workers(self):
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            parse_args(["--per-tweet", "--workers", "2"])
+
+        self.assertTrue(parse_args(["--per-tweet", "--workers", "1"]).per_tweet)
+
+    def test_onnx_workers_do_not_import_torch(self):
+        # A None entry makes ``import torch`` raise ImportError
+        with mock.patch.dict(sys.modules, {"torch": None}), mock.patch.dict(os.environ), \
+                mock.patch.object(tweet, "SentimentAnalyzer") as analyzer:
+            tweet._init_worker("test-model", 8, 2, None, "onnx", "model.onnx")
+
+        self.assertEqual(analyzer.call_args.kwargs["backend"], "onnx")
+        self.assertEqual(analyzer.call_args.kwargs["num_threads"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
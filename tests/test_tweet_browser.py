@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tweet_browser import SORT_OPTIONS, TweetBrowser
+
+
+def _tweets(size=200):
+    generator = np.random.default_rng(5)
+    return pd.DataFrame({
+        "date": pd.Timestamp("2020-06-20", tz="UTC") + pd.to_timedelta(generator.integers(0, 50, size), unit="D"),
+        "id": generator.integers(0, 20, size).astype(float),
+        "like_count": generator.integers(0, 5, size),
+        "retweet_count": generator.integers(0, 5, size),
+        "Sentiment_Confidence": generator.random(size).astype("float32").round(1),
+    })
+
+
+def _reference(data, sort, rows):
+    # Sort the whole selection up front, the way a plain sort_values + slice would
+    column, descending = SORT_OPTIONS[sort]
+    frame = data.iloc[rows].assign(row=rows)
+    keys = [column, "date", "id", "row"] if column != "date" else ["date", "id", "row"]
+    return frame.sort_values(keys, ascending=not descending, kind="stable")["row"].tolist()
+
+
+class TweetBrowserTest(unittest.TestCase):
+    def test_pages_walk_the_full_sorted_selection(self):
+        data = _tweets()
+        browser = TweetBrowser(data)
+        selections = [np.arange(len(data)), np.arange(0, len(data), 7), np.array([3]), np.zeros(0, dtype=int)]
+        for sort in SORT_OPTIONS:
+            for rows in selections:
+                walked, cursor = [], None
+                while True:
+                    page = browser.page(sort, rows, after=cursor, limit=9)
+                    if not len(page):
+                        break
+                    walked.extend(page.tolist())
+                    cursor = page[-1]
+                self.assertEqual(walked, _reference(data, sort, rows), (sort, len(rows)))
+
+    def test_first_page_of_everything(self):
+        data = _tweets(30)
+        page = TweetBrowser(data).page("Oldest first", limit=5)
+
+        self.assertEqual(page.tolist(), _reference(data, "Oldest first", np.arange(30))[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+import tweet_matcher
+from tweet_matcher import UNMATCHED_AIRLINE, TweetMatcher
+
+TEXTS = [
+    "Air India and IndiGo: delayed, lost bag, bad",
+    "@flyspicejet the crew was not good at all",
+    "Flight was not delayed, thanks @airvistara",
+    "#IndiGoFail worst airline",
+    "Spice jet lost my bag",
+    "@AirIndiain: pathetic!!",
+    "It was not. Good crew though",
+    "Not that the staff were rude",
+    "Booked with vistra, smooth and quick",
+    None,
+    "",
+]
+
+
+class TweetMatcherTest(unittest.TestCase):
+    def test_aliases_cover_handles_hashtags_phrases_and_misspellings(self):
+        airlines, _, _ = TweetMatcher().classify(TEXTS)
+
+        self.assertEqual(
+            list(airlines),
+            ["Air India", "Spicejet", "Vistara", "Indigo", "Spicejet", "Air India", UNMATCHED_AIRLINE,
+             UNMATCHED_AIRLINE, "Vistara", UNMATCHED_AIRLINE, UNMATCHED_AIRLINE],
+        )
+
+    def test_negation_flips_the_next_term_within_its_clause(self):
+        _, labels, confidences = TweetMatcher().classify(TEXTS)
+
+        self.assertEqual(
+            list(labels),
+            ["Negative", "Negative", "Positive", "Negative", "Negative", "Negative", "Positive", "Negative",
+             "Positive", "Neutral", "Neutral"],
+        )
+        # delayed, lost and bad each count once
+        self.assertAlmostEqual(confidences[0], 0.85)
+        # "not delayed" and "thanks" are both positive
+        self.assertAlmostEqual(confidences[2], 0.75)
+        self.assertEqual(confidences[9], 0.5)
+
+    def test_python_fallback_matches_arrow_and_vocabularies_extend(self):
+        matcher = TweetMatcher(
+            {"Akasa Air": ("akasa", "quick jet"), "Vistara": ("vistara", "vistra")},
+            positive_terms={"smooth", "superb"},
+            negative_terms={"lost"},
+            chunk_size=4,
+        )
+        texts = TEXTS + ["Akasa was superb", "#akasaair never superb"]
+
+        expected = matcher.classify(texts)
+        with mock.patch.object(tweet_matcher, "_arrow", return_value=None):
+            fallback = matcher.classify(texts)
+
+        for arrow_column, python_column in zip(expected, fallback):
+            self.assertEqual(list(arrow_column), list(python_column))
+        self.assertEqual(list(expected[0][-4:]), [UNMATCHED_AIRLINE, UNMATCHED_AIRLINE, "Akasa Air", "Akasa Air"])
+        self.assertEqual(list(expected[1][-2:]), ["Positive", "Negative"])
+        # "Booked with vistra, smooth and quick": "quick jet" is not a phrase here, so Vistara is matched
+        self.assertEqual(expected[0][8], "Vistara")
+
+    def test_possessives_and_punctuation_joined_words_split_like_separate_words(self):
+        texts = ["IndiGo's crew was great", "spicejet-flight delayed", "airasia:late", "Air India\u2019s staff didn\u2019t help",
+                 "Vistara/Air-India lounge: not.good", "@AirIndiain's crew rude"]
+
+        airlines, labels, _ = TweetMatcher().classify(texts)
+        with mock.patch.object(tweet_matcher, "_arrow", return_value=None):
+            fallback = TweetMatcher().classify(texts)
+
+        self.assertEqual(list(airlines), ["Indigo", "Spicejet", "AirAsia", "Air India", "Air India", "Air India"])
+        self.assertEqual(list(labels), ["Positive", "Negative", "Negative", "Neutral", "Positive", "Negative"])
+        self.assertEqual(list(fallback[0]), list(airlines))
+        self.assertEqual(list(fallback[1]), list(labels))
+
+    def test_aliases_longer_than_two_words_are_rejected(self):
+        with self.assertRaises(ValueError):
+            TweetMatcher({"Air India": ("air india express",)})
+
+
+if __name__ == "__main__":
+    unittest.main()
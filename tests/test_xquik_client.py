@@ -0,0 +1,234 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from xquik_client import (
+    TokenBucket,
+    XquikClient,
+    XquikConfigError,
+    XquikError,
+    XquikRateLimited,
+    XquikUnavailable,
+    retry_after_seconds,
+)
+from xquik_source import load_xquik_queries
+
+
+class StubSearchHandler(BaseHTTPRequestHandler):
+    """Paginated search: 250 posts per query, with ids shared between queries from 200 on."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        params = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        query = params.get("q")
+        with self.server.lock:
+            self.server.requests[query] = attempt = self.server.requests.get(query, 0) + 1
+        if query == "broken":
+            self._send(500, {"error": "boom"})
+            return
+        if query == "forbidden":
+            self._send(401, {"error": "bad key"})
+            return
+        if query == "flaky" and attempt <= 2:
+            self._send(503, {"error": "try later"})
+            return
+        if query == "throttled" and attempt == 1:
+            self._send(429, {"error": "slow down"}, {"Retry-After": "7"})
+            return
+        if query == "last-call":
+            self._send(200, {"tweets": []}, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"})
+            return
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        time.sleep(0.02)
+        with self.server.lock:
+            self.server.active -= 1
+
+        offset = int(params.get("cursor", 0))
+        limit = int(params["limit"])
+        end = min(offset + limit, 250)
+        posts = [
+            {
+                "id": f"shared-{i}" if i >= 200 else f"{params['q']}-{i}",
+                "createdAt": "2026-01-02T03:04:05Z",
+                "text": f"{params['q']} post {i}",
+            }
+            for i in range(offset, end)
+        ]
+        self._send(200, {"tweets": posts, "next_cursor": str(end) if end < 250 else None})
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeClock:
+    """Time that only moves when someone sleeps, so backoff and rate limits cost nothing in tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.now += seconds
+            self.slept += seconds
+
+
+class XquikClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubSearchHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = self.server.active = self.server.peak = 0
+        self.server.requests = {}
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1/x/tweets/search"
+
+    def _client(self, **options):
+        self.clock = FakeClock()
+        client = XquikClient(api_key="test-key", search_url=self.url, page_size=40, clock=self.clock,
+                             sleep=self.clock.sleep, **options)
+        self.addCleanup(client.close)
+        return client
+
+    def test_follows_cursors_until_the_limit(self):
+        posts = self._client().search("indigo", 130)
+
+        self.assertEqual([post["id"] for post in posts], [f"indigo-{i}" for i in range(130)])
+
+    def test_concurrent_queries_merge_dedupe_and_reuse_connections(self):
+        client = self._client(max_concurrency=2)
+
+        posts = client.search_many(["indigo", "vistara", "spicejet"], 1000)
+
+        ids = [post["id"] for post in posts]
+        self.assertEqual(len(ids), 3 * 200 + 50)
+        self.assertEqual(len(set(ids)), len(ids))
+        # 21 pages in total, served over no more connections than the concurrency limit
+        self.assertLessEqual(self.server.peak, 2)
+        self.assertLessEqual(client.pool.connections_opened, 2)
+        self.assertEqual(self.server.connections, client.pool.connections_opened)
+
+    def test_since_id_stops_paging_at_the_watermark(self):
+        class PagedClient(XquikClient):
+            queries = []
+
+            def search_page(self, query, cursor=None, limit=None):
+                self.queries.append(query)
+                start = int(cursor or 0)
+                # Newest first: ids 100, 99, ... in pages of ``limit``
+                return [{"id": str(100 - i)} for i in range(start, start + limit)], str(start + limit)
+
+        client = PagedClient(api_key="test-key", search_url=self.url, page_size=10)
+        self.addCleanup(client.close)
+
+        posts = client.search("indigo", 500, since_id="75")
+
+        self.assertEqual([post["id"] for post in posts], [str(i) for i in range(100, 75, -1)])
+        self.assertEqual(client.queries, ["indigo since_id:75"] * 3)
+
+    def test_http_errors_raise_with_status(self):
+        with self.assertRaises(XquikError) as raised:
+            self._client(max_retries=2).search("broken", 10)
+
+        self.assertIsInstance(raised.exception, XquikUnavailable)
+        self.assertEqual(raised.exception.status, 500)
+        self.assertEqual(self.server.requests["broken"], 3)
+
+    def test_transient_errors_retry_with_bounded_jittered_backoff(self):
+        client = self._client(retry_base_delay=1)
+
+        self.assertEqual(len(client.search("flaky", 10)), 10)
+        self.assertEqual(client.retries, 2)
+        self.assertLessEqual(self.clock.slept, 1 + 2)
+
+    def test_rate_limit_waits_for_retry_after_and_key_errors_are_not_retried(self):
+        with self.assertRaises(XquikRateLimited) as raised:
+            self._client(max_retries=0).search("throttled", 10)
+        self.assertEqual(raised.exception.retry_after, 7)
+        self.server.requests.clear()
+        client = self._client()
+
+        self.assertEqual(len(client.search("throttled", 10)), 10)
+        self.assertGreaterEqual(self.clock.slept, 7)
+        self.assertEqual(self.server.requests["throttled"], 2)
+
+        with self.assertRaises(XquikConfigError):
+            client.search("forbidden", 10)
+        self.assertEqual(self.server.requests["forbidden"], 1)
+        with self.assertRaises(XquikConfigError):
+            XquikClient(api_key="", search_url=self.url).search_page("indigo")
+
+    def test_exhausted_rate_limit_pauses_the_shared_bucket(self):
+        client = self._client()
+
+        client.search("last-call", 10)
+
+        self.assertAlmostEqual(client.bucket.paused_for, 12)
+        client.search("indigo", 10)
+        self.assertGreaterEqual(self.clock.slept, 12)
+
+    def test_identical_pages_are_served_from_the_response_cache(self):
+        client = self._client(cache_ttl=30)
+
+        first = client.search("indigo", 10)
+        self.assertEqual(client.search("indigo", 10), first)
+        self.assertEqual(self.server.requests["indigo"], 1)
+
+        self.clock.now += 31
+        client.search("indigo", 10)
+        self.assertEqual(self.server.requests["indigo"], 2)
+
+    def test_load_queries_returns_one_dashboard_frame(self):
+        data = load_xquik_queries(["indigo", "", "vistara"], limit=220, client=self._client())
+
+        self.assertEqual(len(data), 2 * 200 + 20)
+        self.assertEqual(data["tweet_content"].str.startswith("indigo").sum(), 220)
+
+
+class RateLimitTest(unittest.TestCase):
+    def test_token_bucket_spaces_requests_after_the_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(6):
+            bucket.acquire()
+
+        self.assertAlmostEqual(clock.slept, 2)
+
+    def test_retry_after_accepts_seconds_and_http_dates(self):
+        self.assertEqual(retry_after_seconds("5"), 5)
+        self.assertEqual(retry_after_seconds("Thu, 01 Jan 2026 00:00:30 GMT", now=1767225600), 30)
+        self.assertIsNone(retry_after_seconds("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,25 @@ class XquikSourceTest(unittest.TestCase):
         self.assertIn("tweet_content", data.columns)
         self.assertIn("Predicted_Sentiment", data.columns)
 
+    def test_parses_mixed_date_formats_and_keywords_column_wise(self):
+        data = xquik_posts_to_dataframe(
+            [
+                {"createdAt": "2026-01-02T08:34:05+05:30", "text": "Air India and IndiGo: delayed, lost bag, bad"},
+                {"created_at": "Fri Jan 02 03:04:05 +0000 2026", "text": "SpiceJet was great, great and good"},
+                {"timestamp": 1767323045000, "text": "Vistara"},
+                {"date": "2026-01-02 03:04:05", "text": None},
+                "not a post",
+            ]
+        )
+
+        self.assertEqual(len(data), 4)
+        self.assertTrue((data["date"] == data["date"].iloc[0]).all())
+        self.assertEqual(data["day_of_week"].tolist(), ["Friday"] * 4)
+        self.assertEqual(data["Airline"].tolist(), ["Air India", "Spicejet", "Vistara", "Live X"])
+        self.assertEqual(data["Predicted_Sentiment"].tolist(), ["Negative", "Positive", "Neutral", "Neutral"])
+        self.assertAlmostEqual(data.loc[0, "Sentiment_Confidence"], 0.85)
+        self.assertAlmostEqual(data.loc[1, "Sentiment_Confidence"], 0.75)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,53 +1,335 @@
-import pandas as pd
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from scipy.special import softmax
-import warnings
-warnings.filterwarnings("ignore", category=UserWarning)
-
-# Load the dataset from CSV
-data = pd.read_csv('indianairline.csv')  
-
-# Load the sentiment analysis model and tokenizer
-roberta = "cardiffnlp/twitter-roberta-base-sentiment"
-model = AutoModelForSequenceClassification.from_pretrained(roberta)
-tokenizer = AutoTokenizer.from_pretrained(roberta)
-
-# Define the labels for sentiment classes
-labels = ['Negative', 'Neutral', 'Positive']
-
-# Function to perform sentiment analysis on a single tweet
-def analyze_sentiment(tweet):
-    tweet_words = []
-    for word in tweet.split(' '):
-        if word.startswith('@') and len(word) > 1:
-            word = '@user'
-        elif word.startswith('http'):
-            word = "http"
-        tweet_words.append(word)
-    tweet_proc = " ".join(tweet_words)
-    
-    encoded_tweet = tokenizer(tweet_proc, return_tensors='pt')
-    output = model(**encoded_tweet)
-
-    scores = output[0][0].detach().numpy()
-    scores = softmax(scores)
-    
-    # Get the index of the sentiment class with the highest score
-    sentiment_index = scores.argmax()
-    return labels[sentiment_index]
-
-# Apply sentiment analysis to each tweet in the dataset and add the predicted sentiment to a new column
-count = 0
-for i, tweet in enumerate(data['tweet_content']):
-    data.at[i, 'Predicted_Sentiment'] = analyze_sentiment(tweet)
-    count += 1
-    print(f"Processed {count} tweets.", end='\r')
-
-# Save the modified dataset with predicted sentiments to a new CSV file
-data.to_csv('sentiment_analyzed_data.csv', index=False)  # Change 'sentiment_analyzed_data.csv' to your desired output file path
-
-# Print message indicating sentiment analysis is complete
-print("\nSentiment analysis has been successfully performed on all tweets.")
-
-# Print count to indicate the progress of sentiment analysis
-print(f"Total tweets processed: {count}")
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+import warnings
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from sentiment_analyzer import (
+    BACKENDS,
+    DEFAULT_BATCH_SIZE,
+    LABELS,
+    MODEL_NAME,
+    SentimentAnalyzer,
+    sentiment_columns,
+)
+from sentiment_cache import DEFAULT_CACHE_PATH
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def score_batched(analyzer, tweets):
+    """Score all tweets with padded, length-sorted batches."""
+    return analyzer.predict_proba(tweets)
+
+
+def score_per_tweet(analyzer, tweets):
+    """Score tweets one forward pass at a time."""
+    if not tweets:
+        return np.zeros((0, len(LABELS)), dtype=np.float32)
+    return np.vstack([analyzer.score_one(tweet) for tweet in tweets])
+
+
+# Each worker process keeps its own analyzer for the lifetime of the pool
+_worker_analyzer = None
+
+
+def _init_worker(model_name, batch_size, threads, cache_path, backend, onnx_path):
+    global _worker_analyzer
+    # Pin intra-op threads before torch starts its pools so workers do not oversubscribe the cores
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    if backend != "onnx":
+        # ONNX Runtime takes its thread count from the session options instead, without torch
+        import torch
+
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    _worker_analyzer = SentimentAnalyzer(
+        model_name,
+        batch_size=batch_size,
+        local_files_only=True,
+        cache_path=cache_path,
+        backend=backend,
+        onnx_path=onnx_path,
+        num_threads=threads,
+    )
+
+
+def _score_chunk(tweets):
+    return _worker_analyzer.predict_proba(tweets)
+
+
+def ordered_imap(pool, func, items, max_in_flight):
+    """Like ``pool.imap`` but never queues more than ``max_in_flight`` items ahead of the consumer."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def iter_chunks(path, chunk_size):
+    """Read the input CSV lazily, ``chunk_size`` rows at a time."""
+    yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def chunk_tweets(chunk):
+    return chunk['tweet_content'].fillna('').astype(str).tolist()
+
+
+def attach_scores(chunk, probabilities):
+    """Add the predicted label, float32 class probabilities and confidence to ``chunk``."""
+    for name, values in sentiment_columns(probabilities).items():
+        chunk[name] = values
+    return chunk
+
+
+def iter_scored_chunks(chunks, score):
+    """Attach sentiment columns to each chunk using ``score(list_of_tweets)`` probabilities."""
+    for chunk in chunks:
+        yield attach_scores(chunk, score(chunk_tweets(chunk)))
+
+
+def iter_scored_chunks_sharded(chunks, model_name, batch_size, workers, threads_per_worker=None,
+                               cache_path=None, backend="torch", onnx_path=None):
+    """Score chunks in worker processes, keeping at most two chunks per worker in memory."""
+    if threads_per_worker is None:
+        threads_per_worker = max((os.cpu_count() or 1) // workers, 1)
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(model_name, batch_size, threads_per_worker, cache_path, backend, onnx_path),
+    ) as pool:
+        buffered = deque()
+
+        def tweets_of_buffered_chunks():
+            for chunk in chunks:
+                buffered.append(chunk)
+                yield chunk_tweets(chunk)
+
+        for probabilities in ordered_imap(
+            pool, _score_chunk, tweets_of_buffered_chunks(), max_in_flight=workers * 2
+        ):
+            yield attach_scores(buffered.popleft(), probabilities)
+
+
+def checkpoint_path(output):
+    return f"{output}.checkpoint.json"
+
+
+def input_fingerprint(path, chunk_size, model_name, options=None):
+    """Describe the run so a checkpoint is only reused for the same input, chunking, model and output.
+
+    ``options`` holds everything else that shapes the output rows, such as the backend and
+    scoring path, so a resumed run never appends rows produced differently.
+    """
+    stat = os.stat(path)
+    return {
+        "input": os.path.abspath(path),
+        "input_size": stat.st_size,
+        "input_mtime_ns": stat.st_mtime_ns,
+        "chunk_size": chunk_size,
+        "model": model_name,
+        "options": options or {},
+    }
+
+
+def output_options(args):
+    """Every command-line option that changes the scored rows or their columns."""
+    return {
+        "backend": args.backend,
+        "onnx_path": args.onnx_path,
+        "per_tweet": args.per_tweet,
+        "columns": list(sentiment_columns(np.zeros((0, len(LABELS))))),
+    }
+
+
+def load_checkpoint(output, fingerprint):
+    """Return the saved progress for this run, or ``None`` when there is nothing to resume."""
+    try:
+        with open(checkpoint_path(output), encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+    if state.get("fingerprint") != fingerprint or not os.path.exists(output):
+        return None
+    if os.path.getsize(output) < state.get("output_bytes", 0):
+        return None
+    return state
+
+
+def save_checkpoint(output, state):
+    """Atomically replace the checkpoint manifest so a crash never leaves it half written."""
+    path = checkpoint_path(output)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(state, handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def write_chunks(chunks, output, fingerprint=None, resume_from=None):
+    """Append each chunk to ``output`` as soon as it is scored; returns the number of rows written.
+
+    With a ``fingerprint`` the manifest next to ``output`` is updated after every chunk is
+    durably written. ``resume_from`` is a manifest returned by :func:`load_checkpoint`; the
+    output is truncated to its last recorded size and ``chunks`` must start after its last chunk.
+    """
+    state = resume_from or {"fingerprint": fingerprint, "chunks_done": 0, "rows_done": 0, "output_bytes": 0}
+    with open(output, "r+b" if resume_from else "wb") as handle:
+        # Drop anything written after the last checkpoint (e.g. a chunk interrupted mid-write)
+        handle.seek(state["output_bytes"])
+        handle.truncate()
+        for chunk in chunks:
+            handle.write(chunk.to_csv(header=state["rows_done"] == 0, index=False).encode("utf-8"))
+            handle.flush()
+            state["chunks_done"] += 1
+            state["rows_done"] += len(chunk)
+            state["output_bytes"] = handle.tell()
+            if fingerprint is not None:
+                os.fsync(handle.fileno())
+                save_checkpoint(output, state)
+            print(f"Processed {state['rows_done']} tweets.", end='\r')
+    print()
+    return state["rows_done"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run RoBERTa sentiment analysis over a tweet CSV.")
+    parser.add_argument("--input", default="indianairline.csv", help="CSV file with a tweet_content column")
+    parser.add_argument("--output", default="sentiment_analyzed_data.csv", help="Where to write the scored CSV")
+    parser.add_argument("--model", default=MODEL_NAME, help="Hugging Face model name or local path")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Tweets per forward pass")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="torch",
+        help="Full-precision PyTorch, int8 dynamically quantized PyTorch, or an ONNX Runtime graph",
+    )
+    parser.add_argument(
+        "--onnx-path",
+        default=None,
+        help="Graph written by export_onnx.py (defaults to models/<model>.onnx)",
+    )
+    parser.add_argument(
+        "--per-tweet",
+        action="store_true",
+        help="Use the original one-tweet-per-forward-pass path (for throughput comparisons)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Score chunks in this many processes, each loading the model from the local cache",
+    )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=None,
+        help="Torch threads per worker process (defaults to CPU count divided by --workers)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Rows read, scored and appended to the output at a time",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=DEFAULT_CACHE_PATH,
+        help="SQLite sentiment cache consulted before running the model",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always run the model, never read or fill the cache")
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore any checkpoint from an interrupted run and score the input from the first row",
+    )
+    args = parser.parse_args(argv)
+    if args.per_tweet and args.workers > 1:
+        # Worker processes always score in batches
+        parser.error("--per-tweet cannot be combined with --workers greater than 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Pick up after the last persisted chunk if an earlier run over the same input was interrupted
+    fingerprint = input_fingerprint(args.input, args.chunk_size, args.model, output_options(args))
+    resume_from = None if args.restart else load_checkpoint(args.output, fingerprint)
+    skipped_rows = 0
+    if resume_from:
+        skipped_rows = resume_from["rows_done"]
+        print(f"Resuming after {resume_from['chunks_done']} chunks ({skipped_rows} tweets already scored).")
+
+    # Stream the dataset from CSV in chunks so memory stays flat regardless of input size
+    chunks = iter_chunks(args.input, args.chunk_size)
+    if resume_from:
+        chunks = itertools.islice(chunks, resume_from["chunks_done"], None)
+
+    # Apply sentiment analysis to each chunk of tweets and add the predicted sentiment to a new column
+    cache_path = None if args.no_cache else args.cache_path
+    started = time.perf_counter()
+    if args.workers > 1:
+        scored = iter_scored_chunks_sharded(
+            chunks,
+            args.model,
+            args.batch_size,
+            args.workers,
+            args.threads_per_worker,
+            cache_path,
+            args.backend,
+            args.onnx_path,
+        )
+    else:
+        # Load the sentiment analysis model and tokenizer
+        analyzer = SentimentAnalyzer(
+            args.model,
+            batch_size=args.batch_size,
+            cache_path=cache_path,
+            backend=args.backend,
+            onnx_path=args.onnx_path,
+        )
+        if args.per_tweet:
+            scored = iter_scored_chunks(chunks, lambda tweets: score_per_tweet(analyzer, tweets))
+        else:
+            scored = iter_scored_chunks(chunks, lambda tweets: score_batched(analyzer, tweets))
+
+    # Append each scored chunk to the output CSV as soon as it is ready
+    count = write_chunks(scored, args.output, fingerprint, resume_from) - skipped_rows
+    elapsed = time.perf_counter() - started
+
+    # The run finished, so the next invocation should start fresh rather than resume
+    if os.path.exists(checkpoint_path(args.output)):
+        os.remove(checkpoint_path(args.output))
+
+    # Print message indicating sentiment analysis is complete
+    print("Sentiment analysis has been successfully performed on all tweets.")
+
+    # Print count and throughput so the batched and per-tweet paths can be compared
+    if args.workers > 1:
+        mode = f"{args.backend}, {args.workers} workers (batch size {args.batch_size})"
+    elif args.per_tweet:
+        mode = f"{args.backend}, per-tweet"
+    else:
+        mode = f"{args.backend}, batched (batch size {args.batch_size})"
+    print(f"Total tweets processed: {count}")
+    print(f"Throughput [{mode}]: {count / max(elapsed, 1e-9):.1f} tweets/sec in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
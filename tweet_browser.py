@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+# Sort option -> (column, descending); ties are always broken by (date, id) in the same direction
+SORT_OPTIONS = {
+    'Newest first': ('date', True),
+    'Oldest first': ('date', False),
+    'Most liked': ('like_count', True),
+    'Most retweeted': ('retweet_count', True),
+    'Highest confidence': ('Sentiment_Confidence', True),
+}
+
+
+def _sortable(values):
+    # Timezone-aware dates sort by their UTC instant; everything else sorts as plain numbers
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+    return values.to_numpy()
+
+
+class TweetBrowser:
+    """Keyset pagination over tweets ordered by a sort column, then ``(date, id)``.
+
+    Each sort column gets one ascending row order per dataset, built once. A page is found
+    by looking up where the cursor row sits in that order and walking forward (or backward
+    for descending sorts) until ``limit`` selected rows are collected, so a page costs the
+    same at page 1 and page 10,000 and nothing outside the page is materialized.
+    """
+
+    def __init__(self, data):
+        self.size = len(data)
+        dates = _sortable(data['date'])
+        ids = _sortable(data['id']) if 'id' in data.columns else np.zeros(self.size)
+        rows = np.arange(self.size)
+        self.orders = {}
+        self.ranks = {}
+        for column in {column for column, _ in SORT_OPTIONS.values()}:
+            if column not in data.columns:
+                continue
+            # Row position is the last key, so every tweet has a unique place in the order
+            order = np.lexsort((rows, ids, dates, _sortable(data[column])))
+            rank = np.empty(self.size, dtype=np.int64)
+            rank[order] = rows
+            self.orders[column] = order
+            self.ranks[column] = rank
+
+    def page(self, sort='Newest first', rows=None, after=None, limit=25):
+        """Return up to ``limit`` row positions that follow the cursor row ``after``.
+
+        ``rows`` is the sorted selection to page through (``None`` for every tweet). The
+        last returned row is the cursor for the next page.
+        """
+        column, descending = SORT_OPTIONS[sort]
+        order = self.orders[column]
+        if descending:
+            order = order[::-1]
+        if after is None:
+            start = 0
+        else:
+            rank = self.ranks[column][after]
+            start = self.size - rank if descending else rank + 1
+
+        found = []
+        block = max(limit * 4, 256)
+        while start < self.size and sum(len(part) for part in found) < limit:
+            candidates = order[start:start + block]
+            if rows is not None:
+                # ``rows`` is sorted, so membership is a binary search rather than a full-size mask
+                positions = np.searchsorted(rows, candidates)
+                inside = positions < len(rows)
+                inside[inside] = rows[positions[inside]] == candidates[inside]
+                candidates = candidates[inside]
+            found.append(candidates)
+            start += block
+            # Sparse selections need longer strides to fill a page
+            block *= 2
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(found)[:limit]
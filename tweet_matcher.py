@@ -0,0 +1,253 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+UNMATCHED_AIRLINE = "Live X"
+
+# When a post names several airlines the one listed first wins. Handles and hashtags match
+# any single-word alias as a prefix, so ``indigo`` covers ``@IndiGo6E`` and ``#IndiGoFail``;
+# two-word aliases match consecutive words.
+AIRLINE_ALIASES = {
+    "Air India": ("air india", "airindia", "airindiain", "air indya", "airindya", "airindai"),
+    "Indigo": ("indigo", "indigo6e", "indgo", "indiggo", "inidgo"),
+    "Spicejet": ("spicejet", "spice jet", "flyspicejet", "spicejett", "spicjet"),
+    "Vistara": ("vistara", "airvistara", "vistra", "visatara", "vistaara"),
+    "Akasa Air": ("akasa", "akasaair", "akasa air"),
+    "Go First": ("go first", "gofirst", "flygofirst", "go air", "goair", "goairlinesindia"),
+    "AirAsia": ("airasia", "air asia", "airasiaindia"),
+    "Jet Airways": ("jet airways", "jetairways"),
+}
+
+POSITIVE_TERMS = {
+    "amazing", "appreciate", "awesome", "best", "clean", "comfortable", "courteous", "easy", "excellent",
+    "fast", "friendly", "good", "great", "happy", "helpful", "kudos", "love", "nice", "perfect", "polite",
+    "quick", "smooth", "thanks", "wonderful",
+}
+
+NEGATIVE_TERMS = {
+    "angry", "awful", "bad", "broken", "canceled", "cancelled", "delay", "delayed", "dirty", "disappointed",
+    "disappointing", "hate", "horrible", "late", "lost", "missed", "pathetic", "poor", "rude", "slow",
+    "stuck", "terrible", "unprofessional", "waiting", "worse", "worst",
+}
+
+# A negator flips the next lexicon term when it is at most this many words ahead in the same clause
+NEGATORS = {
+    "not", "no", "never", "nothing", "hardly", "without", "cannot", "dont", "don't", "didnt", "didn't",
+    "isnt", "isn't", "wasnt", "wasn't", "wont", "won't", "cant", "can't", "arent", "aren't", "werent", "weren't",
+}
+NEGATION_WINDOW = 3
+
+# Lowercased text is split into words at whitespace after possessive ``'s`` and every character
+# outside this ASCII set become spaces, so ``IndiGo's``, ``spicejet-flight`` and ``airasia:late``
+# split like separate words. Clause punctuation is kept but also ends a word, so ``not.good``
+# is two clauses. One pass: the group is empty for the first two alternatives.
+WORD_BREAKS = r"'s\b|[^0-9a-z_@#'.!?;\s]|([.!?;]+)"
+WORD_BREAK_REPLACEMENT = r"\1 "
+
+# Stripped from both ends of every word
+TRIM_CHARACTERS = ".,!?;:\"'()[]{}<>*~|/\\-…"
+CLAUSE_ENDINGS = [".", "!", "?", ";"]
+TAG_PREFIXES = ["@", "#"]
+
+# ASCII classes, as in the RE2 engine Arrow uses
+_WORD_BREAKS = re.compile(WORD_BREAKS, re.ASCII)
+
+
+def _arrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        # pyarrow is not installed; words are split and looked up in Python instead
+        return None
+    return pa, pc
+
+
+class TweetMatcher:
+    """Airline and lexicon sentiment for a whole column of texts in one pass over its words.
+
+    Each chunk of texts is lowercased and split into words once, and every vocabulary lives
+    in one lookup table, so a word costs a single hash probe however many aliases and terms
+    are configured. Negation, airline priority and lexicon counts are array operations.
+    The pass uses Arrow's string kernels when pyarrow is installed and ``str`` methods
+    otherwise, with the same results.
+    """
+
+    def __init__(self, airline_aliases=AIRLINE_ALIASES, positive_terms=POSITIVE_TERMS,
+                 negative_terms=NEGATIVE_TERMS, negators=NEGATORS, chunk_size=100_000):
+        self.airlines = list(airline_aliases)
+        self.chunk_size = chunk_size
+        self._words = {}
+        self._phrases = {}
+        for priority, aliases in enumerate(airline_aliases.values()):
+            for alias in aliases:
+                parts = alias.lower().split()
+                if len(parts) > 2:
+                    raise ValueError(f"airline alias {alias!r} has more than two words")
+                target = self._words if len(parts) == 1 else self._phrases
+                target.setdefault(" ".join(parts), priority)
+        self._prefix_lengths = sorted({len(word) for word in self._words})
+        # Tags are only tried against every alias length when they share an alias's first letters
+        self._stem_length = min(self._prefix_lengths, default=0)
+        self._stems = sorted({word[:self._stem_length] for word in self._words})
+        self._word_priority = np.array(list(self._words.values()), dtype=np.int64)
+        self._phrase_priority = np.array(list(self._phrases.values()), dtype=np.int64)
+
+        polarity = {term.lower(): 1 for term in positive_terms}
+        polarity.update({term.lower(): -1 for term in negative_terms})
+        negators = {negator.lower() for negator in negators}
+        phrase_starts = {phrase.split()[0] for phrase in self._phrases}
+        # One table: lexicon terms first, so a word's index is also its term index
+        extra = (negators | set(self._words) | phrase_starts) - set(polarity)
+        self._vocabulary = list(polarity) + sorted(extra)
+        self._term_count = len(polarity)
+        self._polarity = np.array(list(polarity.values()), dtype=np.int64)
+        self._is_negator = np.isin(self._vocabulary, sorted(negators))
+        self._is_phrase_start = np.isin(self._vocabulary, sorted(phrase_starts))
+        self._alias_priority = np.array([self._words.get(word, -1) for word in self._vocabulary], dtype=np.int64)
+
+    def classify(self, texts):
+        """``(airlines, labels, confidences)`` arrays for every text."""
+        texts = pd.Series(texts).fillna("").astype(str)
+        size = len(texts)
+        priorities = np.full(size, len(self.airlines), dtype=np.int64)
+        positive = np.zeros(size, dtype=np.int64)
+        negative = np.zeros(size, dtype=np.int64)
+
+        for start in range(0, size, self.chunk_size):
+            alias_rows, alias_priority, term_rows, term_codes = self._scan(texts.iloc[start:start + self.chunk_size])
+            np.minimum.at(priorities, alias_rows + start, alias_priority)
+            # Each distinct (term, negated) pair counts once per post
+            _, first = np.unique(term_rows * (2 * self._term_count) + term_codes, return_index=True)
+            codes = term_codes[first]
+            polarity = np.where(codes % 2 == 1, -1, 1) * self._polarity[codes // 2]
+            np.add.at(positive, term_rows[first][polarity > 0] + start, 1)
+            np.add.at(negative, term_rows[first][polarity < 0] + start, 1)
+
+        airlines = np.array(self.airlines + [UNMATCHED_AIRLINE], dtype=object)[priorities]
+        margin = np.abs(positive - negative)
+        labels = np.select([positive > negative, negative > positive], ["Positive", "Negative"], "Neutral")
+        confidences = np.where(margin > 0, np.minimum(0.95, 0.55 + (margin * 0.1)), 0.5)
+        return airlines, labels.astype(object), confidences
+
+    def _scan(self, texts):
+        """Alias hits as ``(rows, priorities)`` and lexicon hits as ``(rows, codes)`` for one chunk.
+
+        A term's code is ``2 * index``, plus one when a negator flips it.
+        """
+        arrow = _arrow()
+        words = _ArrowWords(texts, *arrow) if arrow is not None else _PythonWords(texts)
+        rows = words.rows
+        codes = words.lookup(self._vocabulary)
+        found = codes >= 0
+        looked_up = np.where(found, codes, 0)
+
+        alias_priority = np.where(found, self._alias_priority[looked_up], -1)
+        # Handles and hashtags take the longest alias that prefixes them
+        tagged = np.flatnonzero(words.tagged())
+        tagged = tagged[words.lookup_prefixes(tagged, self._stem_length, self._stems) >= 0]
+        for length in self._prefix_lengths:
+            hits = words.lookup_prefixes(tagged, length, list(self._words))
+            alias_priority[tagged[hits >= 0]] = self._word_priority[hits[hits >= 0]]
+        # Two-word aliases: a phrase's first word followed by its second in the same text
+        starts = np.flatnonzero(found[:-1] & self._is_phrase_start[looked_up[:-1]])
+        starts = starts[rows[starts] == rows[starts + 1]]
+        hits = words.lookup_pairs(starts, list(self._phrases))
+        alias_priority[starts[hits >= 0]] = self._phrase_priority[hits[hits >= 0]]
+        aliases = np.flatnonzero(alias_priority >= 0)
+
+        is_term = found & (codes < self._term_count)
+        is_negator = found & self._is_negator[looked_up]
+        clause_end = words.clause_ends()
+        terms = np.flatnonzero(is_term)
+        negated = np.zeros(len(terms), dtype=bool)
+        blocked = np.zeros(len(terms), dtype=bool)
+        # Walk back from each term until a negator, another term, a clause end or the text start
+        for distance in range(1, NEGATION_WINDOW + 1):
+            before = np.maximum(terms - distance, 0)
+            open_ = ~blocked & (terms - distance >= 0) & (rows[before] == rows[terms]) & ~clause_end[before]
+            negated |= open_ & is_negator[before]
+            blocked |= ~open_ | is_term[before] | is_negator[before]
+
+        return rows[aliases], alias_priority[aliases], rows[terms], 2 * codes[terms] + negated
+
+
+class _ArrowWords:
+    """The whitespace-separated words of a chunk of texts, as Arrow arrays."""
+
+    def __init__(self, texts, pa, pc):
+        self.pa, self.pc = pa, pc
+        # Arrow-backed string columns are passed through without copying
+        lowered = pc.replace_substring(pc.utf8_lower(pa.array(texts)), "\u2019", "'")
+        lists = pc.utf8_split_whitespace(pc.replace_substring_regex(lowered, WORD_BREAKS, WORD_BREAK_REPLACEMENT))
+        self.raw = pc.list_flatten(lists)
+        self.rows = pc.list_parent_indices(lists).to_numpy().astype(np.int64)
+        self.words = pc.utf8_trim(self.raw, characters=TRIM_CHARACTERS)
+
+    def lookup(self, vocabulary, words=None):
+        """Each word's index in ``vocabulary``, or -1."""
+        value_set = self.pa.array(vocabulary, type=self.words.type)
+        codes = self.pc.index_in(self.words if words is None else words, value_set=value_set)
+        return codes.fill_null(-1).to_numpy().astype(np.int64)
+
+    def tagged(self):
+        return self._any(self.pc.starts_with(self.words, prefix) for prefix in TAG_PREFIXES)
+
+    def lookup_prefixes(self, positions, length, vocabulary):
+        """Look up the ``length`` characters after the ``@`` or ``#`` of the words at ``positions``."""
+        tags = self.words.take(self.pa.array(positions, type=self.pa.int64()))
+        return self.lookup(vocabulary, self.pc.utf8_slice_codeunits(tags, start=1, stop=1 + length))
+
+    def lookup_pairs(self, starts, vocabulary):
+        """Look up each word at ``starts`` joined to the word after it."""
+        first = self.words.take(self.pa.array(starts, type=self.pa.int64()))
+        second = self.words.take(self.pa.array(starts + 1, type=self.pa.int64()))
+        return self.lookup(vocabulary, self.pc.binary_join_element_wise(first, second, self.pa.scalar(" ", self.words.type)))
+
+    def clause_ends(self):
+        return self._any(self.pc.ends_with(self.raw, ending) for ending in CLAUSE_ENDINGS)
+
+    def _any(self, masks):
+        combined = None
+        for mask in masks:
+            combined = mask if combined is None else self.pc.or_(combined, mask)
+        return combined.to_numpy(zero_copy_only=False)
+
+
+class _PythonWords:
+    """The same words as ``_ArrowWords``, split with ``str`` methods."""
+
+    def __init__(self, texts):
+        self.raw = []
+        rows = []
+        for row, text in enumerate(texts.str.lower()):
+            text = _WORD_BREAKS.sub(WORD_BREAK_REPLACEMENT, text.replace("\u2019", "'"))
+            # Arrow keeps one empty word for an empty text
+            split = text.split() or [""]
+            self.raw.extend(split)
+            rows.extend([row] * len(split))
+        self.rows = np.array(rows, dtype=np.int64)
+        self.words = [word.strip(TRIM_CHARACTERS) for word in self.raw]
+
+    def lookup(self, vocabulary, words=None):
+        return pd.Index(vocabulary).get_indexer(self.words if words is None else words).astype(np.int64)
+
+    def tagged(self):
+        return np.array([word[:1] in TAG_PREFIXES for word in self.words], dtype=bool)
+
+    def lookup_prefixes(self, positions, length, vocabulary):
+        return self.lookup(vocabulary, [self.words[position][1:1 + length] for position in positions])
+
+    def lookup_pairs(self, starts, vocabulary):
+        return self.lookup(vocabulary, [f"{self.words[start]} {self.words[start + 1]}" for start in starts])
+
+    def clause_ends(self):
+        return np.array([word[-1:] in CLAUSE_ENDINGS for word in self.raw], dtype=bool)
+
+
+@lru_cache(maxsize=1)
+def default_matcher():
+    """The matcher for the built-in vocabularies, built once per process."""
+    return TweetMatcher()
@@ -1,38 +1,33 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from scipy.special import softmax
-
-tweet = "@flyspicejet You asked me to call your customer care numbers that are ALWAYS BUSY. How am I supposed to do web check in if it's asking me to purchase seat again? Even though it clearly shows seat fee? #spicejet"
-
-# precprcess tweet
-tweet_words = []
-
-for word in tweet.split(' '):
-    if word.startswith('@') and len(word) > 1:
-        word = '@user'
-
-    elif word.startswith('http'):
-        word = "http"
-    tweet_words.append(word)
-
-tweet_proc = " ".join(tweet_words)
-
-# load model and tokenizer
-roberta = "cardiffnlp/twitter-roberta-base-sentiment"
-
-model = AutoModelForSequenceClassification.from_pretrained(roberta)
-tokenizer = AutoTokenizer.from_pretrained(roberta)
-
-labels = ['Negative', 'Neutral', 'Positive']
-
-# sentiment analysis
-encoded_tweet = tokenizer(tweet_proc, return_tensors='pt')
-# output = model(encoded_tweet['input_ids'], encoded_tweet['attention_mask'])
-output = model(**encoded_tweet)
-
-scores = output[0][0].detach().numpy()
-scores = softmax(scores)
-
-for i in range(len(scores)):
-    l = labels[i]
-    s = scores[i]
-    print(l, s)
+import argparse
+
+from scoring_server import SERVER_URL_ENV, request_scores
+from sentiment_analyzer import BACKENDS, LABELS, MODEL_NAME, SentimentAnalyzer
+
+tweet = "@flyspicejet You asked me to call your customer care numbers that are ALWAYS BUSY. How am I supposed to do web check in if it's asking me to purchase seat again? Even though it clearly shows seat fee? #spicejet"
+
+parser = argparse.ArgumentParser(description="Score a single tweet with the RoBERTa sentiment model.")
+parser.add_argument("tweet", nargs="?", default=tweet, help="Tweet text to score")
+parser.add_argument("--backend", choices=BACKENDS, default="torch", help="Inference backend")
+parser.add_argument("--onnx-path", default=None, help="Graph written by export_onnx.py")
+parser.add_argument(
+    "--server",
+    default=None,
+    help=f"URL of a running scoring_server.py (defaults to ${SERVER_URL_ENV}); skips loading the model",
+)
+args = parser.parse_args()
+
+# ask the warm scoring server first, so the model is not loaded from scratch for one tweet
+scores = request_scores([args.tweet], args.server)
+if scores is not None:
+    scores = scores[0]
+else:
+    # load model and tokenizer (preprocessing of @user/http happens inside the analyzer)
+    analyzer = SentimentAnalyzer(MODEL_NAME, backend=args.backend, onnx_path=args.onnx_path)
+
+    # sentiment analysis
+    scores = analyzer.score_one(args.tweet)
+
+for i in range(len(scores)):
+    l = LABELS[i]
+    s = scores[i]
+    print(l, s)
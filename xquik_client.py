@@ -0,0 +1,424 @@
+import http.client
+import json
+import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+
+SEARCH_URL = "https://xquik.com/api/v1/x/tweets/search"
+API_KEY_ENV = "XQUIK_API_KEY"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+POST_ID_KEYS = ("id", "id_str", "tweetId", "rest_id")
+CURSOR_KEYS = ("next_cursor", "nextCursor", "cursor")
+DEFAULT_REQUESTS_PER_SECOND = 5
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_RETRY_BASE_DELAY = 0.5
+DEFAULT_RETRY_MAX_DELAY = 30
+DEFAULT_CACHE_TTL = 30
+RETRY_STATUSES = {408, 500, 502, 503, 504}
+
+
+class XquikError(Exception):
+    """A search request failed; ``status`` is the HTTP status, or ``None`` for network errors."""
+
+    retryable = False
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class XquikConfigError(XquikError):
+    """The API key is missing or was rejected; retrying will not help."""
+
+
+class XquikRateLimited(XquikError):
+    """The API answered 429; ``retry_after`` is how long it asked callers to wait, in seconds."""
+
+    retryable = True
+
+
+class XquikUnavailable(XquikError):
+    """A network failure or a transient 5xx response."""
+
+    retryable = True
+
+
+class TokenBucket:
+    """Request scheduler shared by every thread of a client.
+
+    Each request takes one token; tokens refill at ``rate`` per second up to ``capacity``.
+    ``pause`` holds back every caller, for example until a rate limit window resets.
+    """
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_SECOND, capacity=DEFAULT_BURST, clock=time.monotonic,
+                 sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token now and wait for it outside the lock; a deficit queues callers in order
+            self._tokens -= 1
+            wait = max(self._paused_until - now, -self._tokens / self.rate)
+        while wait > 0:
+            self.sleep(wait)
+            with self._lock:
+                wait = self._paused_until - self.clock()
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+
+    @property
+    def paused_for(self):
+        """Seconds until paused callers may send again."""
+        return max(self._paused_until - self.clock(), 0.0)
+
+
+class ResponseCache:
+    """Pages fetched in the last ``ttl`` seconds, keyed by request path, so identical queries share one fetch."""
+
+    def __init__(self, ttl=DEFAULT_CACHE_TTL, max_entries=256, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key, value):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class ConnectionPool:
+    """Keep-alive connections to one host, shared by every thread of a client.
+
+    At most ``max_connections`` requests are in flight at once; callers beyond that wait
+    for a free slot, which makes the pool size the client's global concurrency limit.
+    """
+
+    def __init__(self, url, max_connections=DEFAULT_MAX_CONCURRENCY, timeout=20):
+        parts = urlsplit(url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+
+    def request(self, method, path, headers):
+        """Send one request and return ``(status, headers, body)``."""
+        with self._slots:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._connect(), False
+            try:
+                return self._send(connection, method, path, headers)
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
+            # The server may close an idle keep-alive connection; retry once on a fresh one
+            return self._send(self._connect(), method, path, headers)
+
+    def _connect(self):
+        with self._lock:
+            self.connections_opened += 1
+        return self.connection_class(self.host, self.port, timeout=self.timeout)
+
+    def _send(self, connection, method, path, headers):
+        connection.request(method, path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        if response.will_close:
+            connection.close()
+        else:
+            self._idle.put(connection)
+        return response.status, dict(response.getheaders()), body
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def extract_posts(payload):
+    if isinstance(payload, list):
+        return payload
+    if not isinstance(payload, dict):
+        return []
+
+    for key in ("tweets", "items", "results"):
+        value = payload.get(key)
+        if isinstance(value, list):
+            return value
+
+    data = payload.get("data")
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ("tweets", "items", "results"):
+            value = data.get(key)
+            if isinstance(value, list):
+                return value
+
+    return []
+
+
+def next_cursor(payload):
+    """The cursor for the following page, or ``None`` on the last page."""
+    if not isinstance(payload, dict) or payload.get("has_next_page") is False:
+        return None
+    for container in (payload, payload.get("meta"), payload.get("data")):
+        if isinstance(container, dict):
+            for key in CURSOR_KEYS:
+                if container.get(key):
+                    return str(container[key])
+    return None
+
+
+def post_id(post):
+    for key in POST_ID_KEYS:
+        if post.get(key) is not None:
+            return str(post[key])
+    # Posts without an id are told apart by author, time and text
+    return (str(post.get("author") or post.get("user")), str(post.get("createdAt")), str(post.get("text")))
+
+
+def numeric_id(post):
+    """The post id as an integer, or ``None`` when the post has no numeric id."""
+    for key in POST_ID_KEYS:
+        value = post.get(key)
+        if value is not None:
+            value = str(value)
+            return int(value) if value.isdigit() else None
+    return None
+
+
+def dedupe_posts(posts):
+    """Drop repeated posts, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for post in posts:
+        if not isinstance(post, dict):
+            continue
+        key = post_id(post)
+        if key not in seen:
+            seen.add(key)
+            unique.append(post)
+    return unique
+
+
+def retry_after_seconds(value, now=None):
+    """Seconds to wait from a ``Retry-After`` header holding either seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(moment - (time.time() if now is None else now), 0.0)
+
+
+def rate_limit_reset(headers, now=None):
+    """Seconds until the rate limit window resets when the headers say no requests remain, else ``None``."""
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        reset = float(reset)
+    except ValueError:
+        return None
+    now = time.time() if now is None else now
+    # The reset is either an epoch timestamp or a number of seconds from now
+    return max(reset - now, 0.0) if reset > 1e9 else reset
+
+
+def _error_for(status, headers):
+    if status in (401, 403):
+        return XquikConfigError(f"search rejected the API key (HTTP {status}); check {API_KEY_ENV}", status)
+    if status == 429:
+        retry_after = retry_after_seconds(headers.get("retry-after"))
+        if retry_after is None:
+            retry_after = rate_limit_reset(headers)
+        return XquikRateLimited("search is rate limited (HTTP 429)", status, retry_after)
+    if status in RETRY_STATUSES:
+        return XquikUnavailable(f"search returned HTTP {status}", status,
+                                retry_after_seconds(headers.get("retry-after")))
+    return XquikError(f"search returned HTTP {status}", status)
+
+
+class XquikClient:
+    """Xquik search client that follows pagination cursors over pooled keep-alive connections.
+
+    Every request waits for a token from one shared ``TokenBucket``. Rate limited and
+    transient failures are retried with jittered exponential backoff, honouring
+    ``Retry-After`` and ``X-RateLimit-*`` headers, and identical pages fetched within
+    ``cache_ttl`` seconds are served from memory.
+    """
+
+    def __init__(self, api_key=None, search_url=SEARCH_URL, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 page_size=DEFAULT_PAGE_SIZE, timeout=20, requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+                 burst=DEFAULT_BURST, max_retries=DEFAULT_MAX_RETRIES, retry_base_delay=DEFAULT_RETRY_BASE_DELAY,
+                 retry_max_delay=DEFAULT_RETRY_MAX_DELAY, cache_ttl=DEFAULT_CACHE_TTL, clock=time.monotonic,
+                 sleep=time.sleep):
+        self._api_key = api_key
+        self.search_path = urlsplit(search_url).path
+        self.max_concurrency = max_concurrency
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.sleep = sleep
+        self.retries = 0
+        self.pool = ConnectionPool(search_url, max_concurrency, timeout)
+        self.bucket = TokenBucket(requests_per_second, burst, clock, sleep)
+        self.responses = ResponseCache(cache_ttl, clock=clock)
+
+    @property
+    def api_key(self):
+        # Read the environment on every call so a long-lived client picks up a key set later
+        return self._api_key or os.environ.get(API_KEY_ENV)
+
+    def search_page(self, query, cursor=None, limit=None):
+        """Fetch one page of results; returns ``(posts, next_cursor)``."""
+        if not self.api_key:
+            raise XquikConfigError(f"set {API_KEY_ENV} to search X posts")
+        params = {"q": query, "queryType": "Latest", "limit": str(limit or self.page_size)}
+        if cursor:
+            params["cursor"] = cursor
+        path = f"{self.search_path}?{urlencode(params)}"
+        page = self.responses.get(path)
+        if page is not None:
+            return page
+
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                page = self._fetch(path)
+            except XquikError as error:
+                if not error.retryable or attempt >= self.max_retries:
+                    raise
+                # Full jitter keeps concurrent callers from retrying in lockstep
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+                if error.retry_after is not None:
+                    delay = max(delay, error.retry_after)
+                attempt += 1
+                self.retries += 1
+                if isinstance(error, XquikRateLimited):
+                    # The limit applies to the whole key, so every caller waits
+                    self.bucket.pause(delay)
+                else:
+                    self.sleep(delay)
+                continue
+            self.responses.put(path, page)
+            return page
+
+    def _fetch(self, path):
+        headers = {"accept": "application/json", "x-api-key": self.api_key}
+        try:
+            status, response_headers, body = self.pool.request("GET", path, headers)
+        except (http.client.HTTPException, OSError) as error:
+            raise XquikUnavailable(f"search request failed: {error}") from error
+        response_headers = {key.lower(): value for key, value in response_headers.items()}
+        if status != 200:
+            raise _error_for(status, response_headers)
+
+        reset = rate_limit_reset(response_headers)
+        if reset:
+            self.bucket.pause(reset)
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except ValueError as error:
+            raise XquikUnavailable("search returned invalid JSON", status) from error
+        return extract_posts(payload), next_cursor(payload)
+
+    def search(self, query, max_posts, since_id=None):
+        """Up to ``max_posts`` recent posts for ``query``, following cursors page by page.
+
+        With ``since_id`` only posts with a larger numeric id are returned, and paging stops
+        at the first page that reaches back to it.
+        """
+        if since_id is not None:
+            query = f"{query} since_id:{since_id}"
+        posts = []
+        cursor = None
+        seen_cursors = set()
+        while len(posts) < max_posts:
+            page, cursor = self.search_page(query, cursor, min(self.page_size, max_posts - len(posts)))
+            if since_id is not None:
+                newer = [post for post in page if (numeric_id(post) or 0) > int(since_id)]
+                if len(newer) < len(page):
+                    posts.extend(newer)
+                    break
+            posts.extend(page)
+            if not page or cursor is None or cursor in seen_cursors:
+                break
+            seen_cursors.add(cursor)
+        return posts[:max_posts]
+
+    def search_each(self, queries, max_posts_per_query, since_ids=None):
+        """Run every query concurrently; returns ``{query: posts}``, each from its own ``since_ids`` entry."""
+        queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+        if not queries:
+            return {}
+        since_ids = since_ids or {}
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.max_concurrency)) as executor:
+            results = executor.map(
+                lambda query: self.search(query, max_posts_per_query, since_ids.get(query)), queries
+            )
+            return dict(zip(queries, results))
+
+    def search_many(self, queries, max_posts_per_query):
+        """Run every query concurrently and return their posts merged and de-duplicated."""
+        results = self.search_each(queries, max_posts_per_query)
+        return dedupe_posts(post for posts in results.values() for post in posts)
+
+    def close(self):
+        self.pool.close()
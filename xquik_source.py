@@ -1,15 +1,14 @@
-import json
-import os
-import re
-from datetime import datetime, timezone
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import numpy as np
 import pandas as pd
 
-SEARCH_URL = "https://xquik.com/api/v1/x/tweets/search"
+from live_scorer import TieredScorer
+from tweet_matcher import default_matcher
+from xquik_client import XquikClient
+
+DATE_KEYS = ("createdAt", "created_at", "date", "timestamp")
+TEXT_KEYS = ("text", "full_text", "content", "tweet_content")
 EXPECTED_COLUMNS = [
     "date",
     "Date",
@@ -29,144 +28,79 @@ EXPECTED_COLUMNS = [
     "user",
 ]
 
-AIRLINE_KEYWORDS = {
-    "air india": "Air India",
-    "indigo": "Indigo",
-    "spicejet": "Spicejet",
-    "vistara": "Vistara",
-    "akasa": "Akasa Air",
-    "go first": "Go First",
-    "airasia": "AirAsia",
-}
-
-POSITIVE_TERMS = {
-    "amazing",
-    "best",
-    "clean",
-    "comfortable",
-    "easy",
-    "fast",
-    "friendly",
-    "good",
-    "great",
-    "happy",
-    "helpful",
-    "love",
-    "nice",
-    "quick",
-    "smooth",
-    "thanks",
-}
-
-NEGATIVE_TERMS = {
-    "angry",
-    "bad",
-    "broken",
-    "cancelled",
-    "delay",
-    "delayed",
-    "dirty",
-    "late",
-    "lost",
-    "missed",
-    "poor",
-    "rude",
-    "slow",
-    "terrible",
-    "waiting",
-    "worst",
-}
-
-
-def load_xquik_posts(query, limit=20):
-    """Load recent X posts from Xquik and return dashboard-shaped data."""
-    api_key = os.environ.get("XQUIK_API_KEY")
-    search_query = query.strip()
-    if not api_key or not search_query:
-        return None
 
-    bounded_limit = min(max(int(limit), 1), 100)
-    params = urlencode({"q": search_query, "queryType": "Latest", "limit": str(bounded_limit)})
-    request = Request(
-        f"{SEARCH_URL}?{params}",
-        headers={"accept": "application/json", "x-api-key": api_key},
-    )
+def load_xquik_posts(query, limit=20, cache=None, scoring_url=None, client=None):
+    """Load recent X posts for one search query; see ``load_xquik_queries``."""
+    return load_xquik_queries([query], limit, cache, scoring_url, client)
 
-    try:
-        with urlopen(request, timeout=20) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError, OSError, TimeoutError, ValueError):
-        return None
 
-    return xquik_posts_to_dataframe(_extract_posts(payload))
+def load_xquik_queries(queries, limit=20, cache=None, scoring_url=None, client=None):
+    """Load up to ``limit`` recent X posts per query from Xquik as one dashboard-shaped frame.
 
+    Queries run concurrently and follow pagination cursors; posts matched by several
+    queries appear once. Posts keep their keyword estimate when it is confident; the rest
+    take a ``SentimentCache`` result or, failing that, a label from the warm scoring server
+    at ``scoring_url`` (or ``SENTIMENT_SERVER_URL``).
 
-def xquik_posts_to_dataframe(posts):
-    """Map Xquik post dictionaries to the dashboard dataframe contract."""
-    rows = []
-    for post in posts:
-        if not isinstance(post, dict):
-            continue
-
-        created_at = _parse_date(_first_value(post, ("createdAt", "created_at", "date", "timestamp")))
-        text = str(_first_value(post, ("text", "full_text", "content", "tweet_content")) or "")
-        sentiment, confidence = _estimate_sentiment(text)
-
-        rows.append(
-            {
-                "date": created_at,
-                "Date": created_at,
-                "tweet_location": _first_value(post, ("location", "tweet_location")) or "Live X",
-                "latitude": _first_value(post, ("latitude", "lat")),
-                "longitude": _first_value(post, ("longitude", "lng", "lon")),
-                "hour": created_at.hour,
-                "day_of_week": created_at.strftime("%A"),
-                "month": created_at.month,
-                "year": created_at.year,
-                "Airline": _detect_airline(text),
-                "Predicted_Sentiment": sentiment,
-                "Sentiment_Confidence": confidence,
-                "retweet_count": _metric_value(post, "retweet"),
-                "like_count": _metric_value(post, "like"),
-                "tweet_content": text,
-                "user": _user_value(post),
-            }
-        )
-
-    data = pd.DataFrame(rows, columns=EXPECTED_COLUMNS)
-    if data.empty:
-        return data
-
-    data["date"] = pd.to_datetime(data["date"])
-    data["Date"] = data["date"]
-    data["latitude"] = pd.to_numeric(data["latitude"], errors="coerce")
-    data["longitude"] = pd.to_numeric(data["longitude"], errors="coerce")
-    data["retweet_count"] = pd.to_numeric(data["retweet_count"], errors="coerce").fillna(0)
-    data["like_count"] = pd.to_numeric(data["like_count"], errors="coerce").fillna(0)
-    return data
+    Returns ``None`` when there is nothing to search. Failures raise the client's typed
+    errors, so callers can tell a missing key (``XquikConfigError``) from throttling
+    (``XquikRateLimited``) or an outage (``XquikUnavailable``).
+    """
+    queries = [query.strip() for query in queries if query and query.strip()]
+    if not queries:
+        return None
+    owns_client = client is None
+    client = client or XquikClient()
+    try:
+        posts = client.search_many(queries, max(int(limit), 1))
+    finally:
+        if owns_client:
+            client.close()
 
+    return label_live_posts(xquik_posts_to_dataframe(posts), cache, scoring_url)
 
-def _extract_posts(payload):
-    if isinstance(payload, list):
-        return payload
-    if not isinstance(payload, dict):
-        return []
 
-    for key in ("tweets", "items", "results"):
-        value = payload.get(key)
-        if isinstance(value, list):
-            return value
+def label_live_posts(data, cache=None, scoring_url=None, scorer=None):
+    """Escalate low-confidence keyword estimates to cached or served model labels; see ``TieredScorer``."""
+    scorer = scorer or TieredScorer(cache, scoring_url)
+    return scorer.score(data)
 
-    data = payload.get("data")
-    if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        for key in ("tweets", "items", "results"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return value
 
-    return []
+def xquik_posts_to_dataframe(posts):
+    """Map Xquik post dictionaries to the dashboard dataframe contract."""
+    posts = [post for post in posts if isinstance(post, dict)]
+    if not posts:
+        return pd.DataFrame([], columns=EXPECTED_COLUMNS)
+
+    # Pull each field out column-wise, then parse and derive whole columns at once
+    texts = pd.Series([str(_first_value(post, TEXT_KEYS) or "") for post in posts])
+    dates = _parse_dates([_first_value(post, DATE_KEYS) for post in posts])
+    airlines, sentiments, confidences = default_matcher().classify(texts)
+
+    data = pd.DataFrame(
+        {
+            "date": dates,
+            "Date": dates,
+            "tweet_location": [_first_value(post, ("location", "tweet_location")) or "Live X" for post in posts],
+            "latitude": pd.to_numeric(pd.Series([_first_value(post, ("latitude", "lat")) for post in posts]),
+                                      errors="coerce"),
+            "longitude": pd.to_numeric(pd.Series([_first_value(post, ("longitude", "lng", "lon")) for post in posts]),
+                                       errors="coerce"),
+            "hour": dates.dt.hour.astype("int64"),
+            "day_of_week": dates.dt.day_name(),
+            "month": dates.dt.month.astype("int64"),
+            "year": dates.dt.year.astype("int64"),
+            "Airline": airlines,
+            "Predicted_Sentiment": sentiments,
+            "Sentiment_Confidence": confidences,
+            "retweet_count": _metric_column(posts, "retweet"),
+            "like_count": _metric_column(posts, "like"),
+            "tweet_content": texts,
+            "user": [_user_value(post) for post in posts],
+        },
+        columns=EXPECTED_COLUMNS,
+    )
+    return data
 
 
 def _first_value(record, keys):
@@ -177,58 +111,31 @@ def _first_value(record, keys):
     return None
 
 
-def _parse_date(value):
-    if isinstance(value, datetime):
-        return _to_utc_naive(value)
-    if isinstance(value, (int, float)):
-        seconds = value / 1000 if value > 9999999999 else value
-        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
-    if isinstance(value, str):
-        parsed = _parse_date_string(value)
-        if parsed is not None:
-            return parsed
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+def _parse_dates(values):
+    """Parse mixed date values into naive UTC timestamps; anything unparseable becomes now."""
+    is_number = np.array([isinstance(value, (int, float)) and not isinstance(value, bool) for value in values],
+                         dtype=bool)
+    is_string = np.array([isinstance(value, str) for value in values], dtype=bool)
+    values = pd.Series(values, dtype=object)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns, UTC]")
 
+    if is_number.any():
+        numbers = values[is_number].astype(float)
+        # Millisecond epochs are told apart from second epochs by magnitude
+        seconds = numbers.where(numbers <= 9999999999, numbers / 1000)
+        parsed[is_number] = pd.to_datetime(seconds, unit="s", utc=True, errors="coerce")
 
-def _parse_date_string(value):
-    normalized = value.replace("Z", "+00:00")
-    try:
-        return _to_utc_naive(datetime.fromisoformat(normalized))
-    except ValueError:
-        pass
-
+    remaining = ~is_number & values.notna().to_numpy()
+    if remaining.any():
+        parsed[remaining] = pd.to_datetime(values[remaining], utc=True, format="ISO8601", errors="coerce")
     for date_format in ("%a %b %d %H:%M:%S %z %Y", "%Y-%m-%d %H:%M:%S"):
-        try:
-            return _to_utc_naive(datetime.strptime(value, date_format))
-        except ValueError:
-            pass
-
-    return None
-
+        retry = is_string & parsed.isna().to_numpy()
+        if not retry.any():
+            break
+        parsed[retry] = pd.to_datetime(values[retry], utc=True, format=date_format, errors="coerce")
 
-def _to_utc_naive(value):
-    if value.tzinfo is None:
-        return value
-    return value.astimezone(timezone.utc).replace(tzinfo=None)
-
-
-def _estimate_sentiment(text):
-    terms = set(re.findall(r"[a-z']+", text.lower()))
-    positive = len(terms & POSITIVE_TERMS)
-    negative = len(terms & NEGATIVE_TERMS)
-    if positive > negative:
-        return "Positive", min(0.95, 0.55 + ((positive - negative) * 0.1))
-    if negative > positive:
-        return "Negative", min(0.95, 0.55 + ((negative - positive) * 0.1))
-    return "Neutral", 0.5
-
-
-def _detect_airline(text):
-    normalized = text.lower()
-    for keyword, airline in AIRLINE_KEYWORDS.items():
-        if keyword in normalized:
-            return airline
-    return "Live X"
+    parsed = parsed.fillna(pd.Timestamp.now(tz="UTC"))
+    return parsed.dt.tz_localize(None)
 
 
 def _metric_value(post, metric):
@@ -246,6 +153,11 @@ def _metric_value(post, metric):
     return 0
 
 
+def _metric_column(posts, metric):
+    values = pd.Series([_metric_value(post, metric) for post in posts], dtype=object)
+    return pd.to_numeric(values, errors="coerce").fillna(0)
+
+
 def _user_value(post):
     author = post.get("author") or post.get("user")
     if isinstance(author, dict):